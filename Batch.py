@@ -0,0 +1,101 @@
+"""
+Contains definition of Batch class
+"""
+import os
+import sys
+import json
+import time
+import argparse
+from concurrent.futures import as_completed
+from Util import Tracer, WorkerPool
+from Fluffy import main
+
+
+class Batch:
+    """
+    Represents the generation of many drivers in one process
+    Use to run every driver of a manifest on one shared worker pool, the largest MDEFs are scheduled first
+    so the small ones fill the idle workers meanwhile
+    """
+
+    def __init__(self, inManifestPath: str):
+        """Reads the manifest, a JSON list of {"MDEFPath": ..., "OutputDir": ...} relative to its directory"""
+        baseDir = os.path.dirname(os.path.abspath(inManifestPath))
+        with open(inManifestPath, 'r') as file:
+            self.mDrivers = [(os.path.join(baseDir, driver['MDEFPath']), os.path.join(baseDir, driver['OutputDir']))
+                             for driver in json.load(file)]
+
+    @staticmethod
+    def runDriver(inMDEFPath: str, inOutputDir: str, inIncremental: bool, inStreaming: bool, inStreamWrites: bool,
+                  inCacheDir: str, inBatchStart: float) -> dict:
+        """Generates a single driver, returns the seconds spent per phase"""
+        Tracer.Active = Tracer()
+        start = time.perf_counter()
+        tracer = main(inMDEFPath, inOutputDir, inIncremental=inIncremental, inJobs=1, inStreaming=inStreaming,
+                      inStreamWrites=inStreamWrites, inCacheDir=inCacheDir)
+        # Wall clock, as the batch start comes from another process
+        timings = {'Total': time.perf_counter() - start, 'Finished': time.time() - inBatchStart}
+        for name, category, _, duration, _, _, _ in tracer.mEvents:
+            if category == 'Phase':
+                timings[name] = timings.get(name, 0) + duration
+        return timings
+
+    def run(self, inJobs: int = 1, inIncremental: bool = False, inStreaming: bool = False,
+            inStreamWrites: bool = False, inCacheDir: str = None) -> list[dict]:
+        """Generates every driver, returns their reports in the manifest order"""
+        reports = [{'MDEFPath': mdefPath, 'OutputDir': outputDir} for mdefPath, outputDir in self.mDrivers]
+        order = sorted(range(len(reports)), key=lambda idx: -os.path.getsize(reports[idx]['MDEFPath'])
+                       if os.path.isfile(reports[idx]['MDEFPath']) else 0)
+        start = time.time()
+        with WorkerPool(inJobs) as pool:
+            futures = {pool.submit(Batch.runDriver, reports[idx]['MDEFPath'], reports[idx]['OutputDir'],
+                                   inIncremental, inStreaming, inStreamWrites, inCacheDir, start): idx
+                       for idx in order}
+            for future in as_completed(futures):
+                report = reports[futures[future]]
+                try:
+                    report['Timings'] = future.result()
+                except (Exception, SystemExit) as err:
+                    # A driver exiting on its own must not stop the others
+                    report['Error'] = repr(err)
+        return reports
+
+    @staticmethod
+    def summary(inReports: list[dict]) -> str:
+        """Lists the phase timings of every driver"""
+        phases = ['Parse', 'ConfigurationCPP', 'TableConfig', 'SkeletonTableConfig', 'Total', 'Finished']
+        lines = [f'{"Driver":<40}' + ''.join(f'{phase:>20}' for phase in phases)]
+        for report in inReports:
+            driver = os.path.basename(report['MDEFPath'])
+            if 'Error' in report:
+                lines.append(f'{driver:<40}Failed: {report["Error"]}')
+                continue
+            lines.append(f'{driver:<40}' + ''.join(f'{report["Timings"].get(phase, 0):>20.3f}' for phase in phases))
+        return '\n'.join(lines)
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Prepares the SaaS SDK driver configurations of many drivers at once')
+    parser.add_argument('ManifestPath',
+                        help='Path to a JSON list of {"MDEFPath": ..., "OutputDir": ...}, relative to the manifest')
+    parser.add_argument('--jobs', type=int, default=1, metavar='N',
+                        help='Number of worker processes shared by all the drivers (default: 1)')
+    parser.add_argument('--incremental', action='store_true',
+                        help='Rewrite only the changed files and prune the orphaned ones')
+    parsing = parser.add_mutually_exclusive_group()
+    parsing.add_argument('--stream', action='store_true',
+                         help='Parse the tables incrementally from disk to run in bounded memory on large MDEFs')
+    parsing.add_argument('--cache-dir', metavar='DIR',
+                         help='Reuse the parsed MDEF models cached in DIR while the MDEFs and generator are unchanged')
+    parser.add_argument('--stream-writes', action='store_true',
+                        help='Write the generated code straight to buffered file handles instead of memory')
+    parser.add_argument('--report', metavar='FILE', help='Records the per-driver timings as JSON in FILE')
+    args = parser.parse_args()
+    reports = Batch(args.ManifestPath).run(args.jobs, args.incremental, args.stream, args.stream_writes,
+                                           args.cache_dir)
+    print(Batch.summary(reports))
+    if args.report is not None:
+        with open(args.report, 'w') as file:
+            json.dump(reports, file, indent=2)
+    if any('Error' in report for report in reports):
+        sys.exit(1)
@@ -0,0 +1,172 @@
+"""
+Contains definition of Benchmark class
+"""
+import gc
+import os
+import sys
+import json
+import time
+import argparse
+import platform
+import tempfile
+from Util import File
+from SyntheticMDEF import SyntheticMDEF
+from Configurations import *
+
+
+class Benchmark:
+    """
+    Represents the scaling benchmark of the scripts
+    Use to time parse, render & write of every Configurable against synthetic MDEFs of growing size
+    """
+
+    VERSION = 1
+    __configurables__ = [ConfigurationH, ConfigurationCPP, ConfigurationHelpersH, DriverWideConfigurationCPP,
+                         TableConfig, SkeletonTableConfig]
+
+    def __init__(self, inRepeat: int = 3, inPreReqDepth: int = 1, inSkeletonTables: int = 10,
+                 inListVariables: int = 2, inAuthProfiles: int = 2, inSeed: int = 0):
+        self.mRepeat = max(1, inRepeat)
+        self.mKnobs = {
+            'PreReqDepth': inPreReqDepth,
+            'SkeletonTables': inSkeletonTables,
+            'ListVariables': inListVariables,
+            'AuthProfiles': inAuthProfiles,
+            'Seed': inSeed
+        }
+
+    def run(self, inTables: list[int], inColumns: list[int]) -> dict:
+        """Measures every point of the scaling curve, returns the results"""
+        points = list()
+        with tempfile.TemporaryDirectory() as workDir:
+            for tables in inTables:
+                for columns in inColumns:
+                    mdefPath = os.path.join(workDir, f'MDEF_{tables}x{columns}.json')
+                    SyntheticMDEF(tables, columns, self.mKnobs['PreReqDepth'], self.mKnobs['SkeletonTables'],
+                                  self.mKnobs['ListVariables'], self.mKnobs['AuthProfiles'],
+                                  self.mKnobs['Seed']).save(mdefPath)
+                    points.append({
+                        'Tables': tables,
+                        'Columns': columns,
+                        'Bytes': os.path.getsize(mdefPath),
+                        'Timings': self.measure(mdefPath, os.path.join(workDir, f'Output_{tables}x{columns}'))
+                    })
+                    print(f'{tables} tables x {columns} columns: '
+                          f'{sum(Benchmark.flatten(points[-1]["Timings"]).values()):.3f}s', file=sys.stderr)
+        return {
+            'Version': Benchmark.VERSION,
+            'Timestamp': time.strftime('%Y-%m-%dT%H:%M:%S'),
+            'Python': platform.python_version(),
+            'Platform': platform.platform(),
+            'Repeat': self.mRepeat,
+            'Knobs': self.mKnobs,
+            'Points': points
+        }
+
+    def measure(self, inMDEFPath: str, inOutputDir: str) -> dict:
+        """Times the phases of a single MDEF, keeps the best of the repeated runs"""
+        outputDirs = {
+            TableConfig: os.path.join(inOutputDir, 'Tables'),
+            SkeletonTableConfig: os.path.join(inOutputDir, 'SkeletonTables')
+        }
+        configDir = os.path.join(inOutputDir, 'Configs')
+        for outputDir in [configDir] + list(outputDirs.values()):
+            File.createDir(outputDir)
+
+        timings = dict()
+        for _ in range(self.mRepeat):
+            run = dict()
+            gc.collect()
+            start = time.perf_counter()
+            with open(inMDEFPath, 'r') as file:
+                content = json.load(file)
+            decoded = time.perf_counter()
+            mdef = MDEF(content).load()
+            run['Parse'] = {'Decode': decoded - start, 'Model': time.perf_counter() - decoded}
+
+            for configurable in Benchmark.__configurables__:
+                gc.collect()
+                File.Deferred = list()
+                try:
+                    start = time.perf_counter()
+                    configurable.Configure(mdef, outputDirs.get(configurable, configDir))
+                    rendered = time.perf_counter()
+                finally:
+                    files, File.Deferred = File.Deferred, None
+                for file in files:
+                    file.save()
+                run[configurable.__name__] = {'Render': rendered - start, 'Write': time.perf_counter() - rendered}
+
+            for phase, phaseTimings in run.items():
+                best = timings.setdefault(phase, dict())
+                for step, seconds in phaseTimings.items():
+                    best[step] = min(best.get(step, seconds), seconds)
+        return timings
+
+    @staticmethod
+    def flatten(inTimings: dict) -> dict:
+        """Maps 'Phase.Step' to the seconds spent"""
+        return {f'{phase}.{step}': seconds
+                for phase, steps in inTimings.items() for step, seconds in steps.items()}
+
+    @staticmethod
+    def compare(inBaseline: dict, inCurrent: dict, inThreshold: float = 0.1) -> list[str]:
+        """Prints the current results against the baseline ones, returns the regressed steps"""
+        baselinePoints = {(point['Tables'], point['Columns']): point for point in inBaseline['Points']}
+        regressions = list()
+        print(f'{"Point":<14}{"Step":<36}{"Baseline":>10}{"Current":>10}{"Ratio":>8}')
+        for point in inCurrent['Points']:
+            pointKey = (point['Tables'], point['Columns'])
+            if pointKey not in baselinePoints:
+                continue
+            baseline = Benchmark.flatten(baselinePoints[pointKey]['Timings'])
+            for step, seconds in Benchmark.flatten(point['Timings']).items():
+                if step not in baseline:
+                    continue
+                ratio = seconds / baseline[step] if baseline[step] > 0 else 1.0
+                flag = ''
+                if ratio > 1 + inThreshold:
+                    flag = ' *'
+                    regressions.append(f'{pointKey[0]}x{pointKey[1]} {step}')
+                print(f'{f"{pointKey[0]}x{pointKey[1]}":<14}{step:<36}{baseline[step]:>10.4f}{seconds:>10.4f}'
+                      f'{ratio:>8.2f}{flag}')
+        return regressions
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Times the scripts against synthetic MDEFs of growing size')
+    parser.add_argument('--tables', default='100,200,400,800',
+                        help='Comma separated table counts of the scaling curve (default: 100,200,400,800)')
+    parser.add_argument('--columns', default='20',
+                        help='Comma separated column counts of the scaling curve (default: 20)')
+    parser.add_argument('--prereq-depth', type=int, default=1, help='PreReqCall nesting depth (default: 1)')
+    parser.add_argument('--skeleton-tables', type=int, default=10, help='Number of skeleton tables (default: 10)')
+    parser.add_argument('--list-variables', type=int, default=2,
+                        help='ListVariablesPrecalls per skeleton table (default: 2)')
+    parser.add_argument('--auth-profiles', type=int, default=2, help='Number of auth profiles, up to 4 (default: 2)')
+    parser.add_argument('--seed', type=int, default=0, help='Random seed of the synthetic MDEFs (default: 0)')
+    parser.add_argument('--repeat', type=int, default=3, help='Runs per point, the best one is kept (default: 3)')
+    parser.add_argument('--output', metavar='FILE', help='Records the results as JSON in FILE')
+    parser.add_argument('--compare', metavar='FILE', help='Compares the results against the ones recorded in FILE')
+    parser.add_argument('--threshold', type=float, default=0.1,
+                        help='Slowdown ratio over which a step is reported as regressed (default: 0.1)')
+    args = parser.parse_args()
+
+    benchmark = Benchmark(args.repeat, args.prereq_depth, args.skeleton_tables, args.list_variables,
+                          args.auth_profiles, args.seed)
+    results = benchmark.run([int(count) for count in args.tables.split(',')],
+                            [int(count) for count in args.columns.split(',')])
+    if args.output is not None:
+        with open(args.output, 'w') as file:
+            json.dump(results, file, indent=2)
+    if args.compare is not None:
+        with open(args.compare, 'r') as file:
+            regressions = Benchmark.compare(json.load(file), results, args.threshold)
+        if len(regressions) > 0:
+            print(f'{len(regressions)} step(s) regressed over {args.threshold:.0%}')
+            sys.exit(1)
+    else:
+        for point in results['Points']:
+            for step, seconds in Benchmark.flatten(point['Timings']).items():
+                pointName = f'{point["Tables"]}x{point["Columns"]}'
+                print(f'{pointName:<14}{step:<36}{seconds:>10.4f}')
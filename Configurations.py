@@ -2,9 +2,13 @@
 Contains definition of Configurable classes
 """
 
+import os
+import re
+import json
+import hashlib
 from abc import abstractmethod
 from MDEF import *
-from Util import File
+from Util import DataFile, File, Fragment, ShardMap, Tracer, WorkerPool
 
 
 class Configurable:
@@ -20,7 +24,7 @@ class ConfigurationCPP(Configurable):
     """Represents a class that writes Configuration.cpp"""
 
     @staticmethod
-    def Configure(inMDEF: MDEF, inOutputDir: str):
+    def Configure(inMDEF: MDEF, inOutputDir: str, inLazyTables: bool = False):
         writer = File('Configuration.cpp', f'{inMDEF.DataSource} Driver Configuration', inOutputDir)
         writer.write('#include "Configuration.h"\n')
         writer.write('#include "ConfigurationHelpers.h"\n')
@@ -55,12 +59,13 @@ class ConfigurationCPP(Configurable):
         for idx, authBrowseData in enumerate(inMDEF.AuthBrowseConnectMap):
             key = authBrowseData.Key
             encKey = authBrowseData.EncBrowseConnectKey
-            writer.write(f'\t\tSaaSAuthBrowseConnectMap map{key.replace("_", "")};\n')
-            writer.write(f'\t\tmap{key.replace("_", "")}.SetKey("{key}");\n')
+            mapName = f'map{Identifiers.symbol(key)}'
+            writer.write(f'\t\tSaaSAuthBrowseConnectMap {mapName};\n')
+            writer.write(f'\t\t{mapName}.SetKey("{key}");\n')
             if encKey is not None:
-                writer.write(f'\t\tmap{key.replace("_", "")}.SetEncBrowseConnectKey("{encKey}");\n')
+                writer.write(f'\t\t{mapName}.SetEncBrowseConnectKey("{encKey}");\n')
             writer.write(f'\t\tout_configs.GetAuthBrowseConnectMap().insert('
-                         f'{"{"}"{key}" , map{key.replace("_", "")}{"}"});\n')
+                         f'{"{"}"{key}" , {mapName}{"}"});\n')
             writer.write('\n' if idx != len(inMDEF.AuthBrowseConnectMap) - 1 else '')
         writer.write('\t}\n')
 
@@ -71,10 +76,10 @@ class ConfigurationCPP(Configurable):
         for idx, profile in enumerate(inMDEF.AuthProfiles.AllProfiles):
             if len(profile.AuthFlows) == 0:
                 continue
+            profileSeqName = f'authSeq{Identifiers.symbol(profile.Name, " .")}'
             writer.write(f'\t\t// {profile.Name}\n')
             writer.write('\t\t{\n')
-            writer.write(
-                f'\t\t\tstd::vector<SaaSAuthSequence> authSeq{profile.Name.replace(" ", "").replace(".", "")};\n')
+            writer.write(f'\t\t\tstd::vector<SaaSAuthSequence> {profileSeqName};\n')
             writer.write('\t\t\t{\n')
             for authFlow in profile.AuthFlows:
                 writer.write(f'\t\t\t\t// {authFlow.Name}\n')
@@ -82,10 +87,11 @@ class ConfigurationCPP(Configurable):
                     writer.write(f'\t\t\t\tSaaSBrowseConnectSequence browseSeq{authFlow.Name}{flowIdx + 1};\n')
                     writer.write('\t\t\t\t{\n')
                     for reqParam in authSeq.RequiredParams:
-                        writer.write(f'\t\t\t\t\tSaaSRequiredParam reqParam{reqParam.replace("_", "")};\n')
-                        writer.write(f'\t\t\t\t\treqParam{reqParam.replace("_", "")}.SetKey("{reqParam}");\n')
+                        reqParamName = f'reqParam{Identifiers.symbol(reqParam)}'
+                        writer.write(f'\t\t\t\t\tSaaSRequiredParam {reqParamName};\n')
+                        writer.write(f'\t\t\t\t\t{reqParamName}.SetKey("{reqParam}");\n')
                         writer.write(f'\t\t\t\t\tbrowseSeq{authFlow.Name}{flowIdx + 1}.GetRequiredParams().'
-                                     f'push_back(reqParam{reqParam.replace("_", "")});\n\n')
+                                     f'push_back({reqParamName});\n\n')
 
                     for headerIdx, header in enumerate(authSeq.Headers):
                         writer.write(f'\t\t\t\t\tSaaSHeader header{headerIdx + 1};\n')
@@ -95,11 +101,12 @@ class ConfigurationCPP(Configurable):
                             f'\t\t\t\t\tbrowseSeq{authFlow.Name}{flowIdx + 1}.GetHeaders().push_back(header{headerIdx + 1});\n\n')
 
                     for expParam in authSeq.ExpectedParams:
-                        writer.write(f'\t\t\t\t\tSaaSExpectedParam expParam{expParam.Key.replace("_", "")};\n')
-                        writer.write(f'\t\t\t\t\texpParam{expParam.Key.replace("_", "")}.SetKey("{expParam.Key}");\n')
-                        writer.write(f'\t\t\t\t\texpParam{expParam.Key.replace("_", "")}.SetPath("{expParam.Path}");\n')
+                        expParamName = f'expParam{Identifiers.symbol(expParam.Key)}'
+                        writer.write(f'\t\t\t\t\tSaaSExpectedParam {expParamName};\n')
+                        writer.write(f'\t\t\t\t\t{expParamName}.SetKey("{expParam.Key}");\n')
+                        writer.write(f'\t\t\t\t\t{expParamName}.SetPath("{expParam.Path}");\n')
                         writer.write(f'\t\t\t\t\tbrowseSeq{authFlow.Name}{flowIdx + 1}.GetExpectedParams().'
-                                     f'push_back(expParam{expParam.Key.replace("_", "")});\n\n')
+                                     f'push_back({expParamName});\n\n')
                     writer.write('\t\t\t\t}\n')
 
                 writer.write(f'\t\t\t\tSaaSAuthSequence authSeq{authFlow.Name};\n')
@@ -107,12 +114,11 @@ class ConfigurationCPP(Configurable):
                 for _ in range(1, len(authFlow.AuthSequences) + 1):
                     writer.write(f'\t\t\t\tauthSeq{authFlow.Name}.GetSequence().push_back('
                                  f'browseSeq{authFlow.Name}{_});\n')
-                writer.write(
-                    f'\t\t\t\tauthSeq{profile.Name.replace(" ", "").replace(".", "")}.push_back(authSeq{authFlow.Name});\n')
+                writer.write(f'\t\t\t\t{profileSeqName}.push_back(authSeq{authFlow.Name});\n')
                 writer.write('\n')
             writer.write('\t\t\t}\n')
             writer.write(f'\t\t\tauthProfile.GetAuthSequence().insert({"{"} "{profile.Name}", '
-                         f'authSeq{profile.Name.replace(" ", "").replace(".", "")} {"}"});\n')
+                         f'{profileSeqName} {"}"});\n')
             writer.write(f'\t\t\tauthProfile.GetTypes().push_back("{profile.Name}");\n')
             writer.write('\t\t}\n\n')
 
@@ -174,8 +180,11 @@ class ConfigurationCPP(Configurable):
         # Prepare Tables
         writer.write('\t// Tables\n')
         writer.write('\t{\n')
-        for table in inMDEF.Tables:
-            writer.write(f'\t\t{table.FullName}(out_configs);\n')
+        if inLazyTables:
+            writer.write('\t\t// Registered in TABLE_REGISTRY, populated on first use through PopulateTable\n')
+        else:
+            for table in inMDEF.Tables:
+                writer.write(f'\t\t{table.FullName}(out_configs);\n')
         writer.write('\t}\n\n')
 
         # Prepare Skeleton Tables
@@ -185,8 +194,35 @@ class ConfigurationCPP(Configurable):
             writer.write(f'\t\t{table.FullName}(out_configs);\n')
         writer.write('\t}\n')
         writer.write('}')
+        if inLazyTables:
+            ConfigurationCPP.writeTableRegistry(writer, inMDEF)
         writer.save()
 
+    @staticmethod
+    def writeTableRegistry(inWriter: File, inMDEF: MDEF):
+        """Writes the table name to populate function registry along with its resolver"""
+        inWriter.write('\n\n')
+        if len(inMDEF.Tables) > 0:
+            inWriter.write('const SaaSTableRegistration TABLE_REGISTRY[] =\n')
+            inWriter.write('{\n')
+            for table in inMDEF.Tables:
+                inWriter.write(f'\t{{ "{table.TableSchemaName or ""}", "{table.Name}", &{table.FullName} }},\n')
+            inWriter.write('};\n')
+            inWriter.write('const size_t TABLE_REGISTRY_SIZE = sizeof(TABLE_REGISTRY) / sizeof(TABLE_REGISTRY[0]);\n\n')
+        else:
+            # Zero-size arrays are ill-formed, the placeholder entry is never resolved
+            inWriter.write('const SaaSTableRegistration TABLE_REGISTRY[1] = { { "", "", nullptr } };\n')
+            inWriter.write('const size_t TABLE_REGISTRY_SIZE = 0;\n\n')
+        inWriter.write('bool PopulateTable(SaaSConfiguration& io_configs, const char* in_schemaName, const char* in_name)\n')
+        inWriter.write('{\n')
+        # The registry follows the MDEF order, which the table index refers to
+        inWriter.write('\tint idx = FindTableIndex(in_schemaName, in_name);\n')
+        inWriter.write('\tif (idx < 0)\n')
+        inWriter.write('\t\treturn false;\n')
+        inWriter.write('\tTABLE_REGISTRY[idx].m_populate(io_configs);\n')
+        inWriter.write('\treturn true;\n')
+        inWriter.write('}')
+
 
 class ConfigurationH(Configurable):
     """Represents a class that writes Configuration.h"""
@@ -244,7 +280,9 @@ class ConfigurationH(Configurable):
 class ConfigurationHelpersH(Configurable):
     """Represents a class that writes ConfigurationHelpers.h"""
     @staticmethod
-    def Configure(inMDEF: MDEF, inOutputDir: str):
+    def Configure(inMDEF: MDEF, inOutputDir: str, inSharedColumns: 'SharedColumns' = None,
+                  inDescriptors: bool = False, inLazyTables: bool = False, inTableIndex: bool = False,
+                  inColumnOrdinals: bool = False):
         writer = File('ConfigurationHelpers.h', f'{inMDEF.DataSource} Driver ConfigurationHelpers', inOutputDir)
         writer.write('#ifndef __CONFIGURATIONHELPERS_H__\n')
         writer.write('#define __CONFIGURATIONHELPERS_H__\n\n')
@@ -254,8 +292,10 @@ class ConfigurationHelpersH(Configurable):
                      '{\n'
                      '\tnamespace SaaSSDK\n'
                      '\t{\n'
-                     '\t\tclass SaaSConfiguration;\n'
-                     '\t}\n'
+                     '\t\tclass SaaSConfiguration;\n')
+        if inDescriptors:
+            writer.write('\t\tclass SaaSTable;\n')
+        writer.write('\t}\n'
                      '}\n\n')
 
         # TODO: Enhance Pagination handlers logic here
@@ -272,10 +312,270 @@ class ConfigurationHelpersH(Configurable):
         for table in inMDEF.SkeletonTables:
             writer.write(f'void {table.FullName}(Simba::SaaSSDK::SaaSConfiguration& io_configs);\n')
         writer.write('\n')
+        if inSharedColumns is not None:
+            writer.write('// Shared Columns\n')
+            for helperName in inSharedColumns.Columns:
+                writer.write(f'Simba::SaaSSDK::SaaSTableColumn {helperName}();\n')
+            writer.write('\n')
+        if inDescriptors:
+            ColumnDescriptors.writeDeclarations(writer)
+        if inTableIndex:
+            TableIndex.writeDeclarations(writer)
+        if inColumnOrdinals:
+            ColumnOrdinals.writeDeclarations(writer, inMDEF)
+        if inLazyTables:
+            writer.write('// Table registry\n')
+            writer.write('typedef void (*TablePopulator)(Simba::SaaSSDK::SaaSConfiguration& io_configs);\n\n')
+            writer.write('struct SaaSTableRegistration\n'
+                         '{\n'
+                         '\tconst char* m_schemaName;\n'
+                         '\tconst char* m_name;\n'
+                         '\tTablePopulator m_populate;\n'
+                         '};\n\n')
+            writer.write('extern const SaaSTableRegistration TABLE_REGISTRY[];\n')
+            writer.write('extern const size_t TABLE_REGISTRY_SIZE;\n\n')
+            writer.write('// Populates the given table into io_configs, returns false when the table is unknown\n'
+                         '// Adds the table on every call, call it once per table & configuration\n')
+            writer.write('bool PopulateTable(Simba::SaaSSDK::SaaSConfiguration& io_configs, const char* in_schemaName, '
+                         'const char* in_name);\n\n')
         writer.write('#endif __CONFIGURATIONHELPERS_H__\n')
         writer.save()
 
 
+class ConfigurationHelpersCPP(Configurable):
+    """Represents a class that writes ConfigurationHelpers.cpp"""
+    @staticmethod
+    def Configure(inMDEF: MDEF, inOutputDir: str, inSharedColumns: 'SharedColumns' = None,
+                  inDescriptors: bool = False, inTableIndex: bool = False, inColumnOrdinals: bool = False):
+        writer = File('ConfigurationHelpers.cpp', f'{inMDEF.DataSource} Driver ConfigurationHelpers', inOutputDir)
+        if inTableIndex or inColumnOrdinals:
+            writer.write('#include <cstring>\n\n')
+        writer.write('#include "ConfigurationHelpers.h"\n')
+        writer.write('#include "Configuration/SaaSConfiguration.h"\n\n')
+        writer.write('using namespace Simba::SaaSSDK;\n\n')
+        if inSharedColumns is not None:
+            for helperName, column in inSharedColumns.Columns.items():
+                writer.write(f'SaaSTableColumn {helperName}()\n')
+                writer.write('{\n')
+                AbstractTableConfig.writeColumnDefinition(writer, column, 1)
+                writer.write('\treturn column_table;\n')
+                writer.write('}\n\n')
+        if inDescriptors:
+            ColumnDescriptors.writeMaterializer(writer)
+        if inTableIndex:
+            TableIndex.writeDefinitions(writer, inMDEF)
+        if inColumnOrdinals:
+            ColumnOrdinals.writeFinder(writer)
+        writer.save()
+
+
+class TableIndex:
+    """
+    Represents the name to index lookup of the tables, in the order they are populated
+    Entries are sorted by schema & name at generation time, the driver binary searches them
+    """
+
+    @staticmethod
+    def writeDeclarations(inWriter: File):
+        inWriter.write('// Table index\n')
+        inWriter.write('struct SaaSTableIndexEntry\n'
+                       '{\n'
+                       '\tconst char* m_schemaName;\n'
+                       '\tconst char* m_name;\n'
+                       '\tint m_index;\n'
+                       '};\n\n')
+        inWriter.write('// Returns the position of the given table in the MDEF order, -1 when the table is unknown\n')
+        inWriter.write('int FindTableIndex(const char* in_schemaName, const char* in_name);\n')
+        inWriter.write('int FindSkeletonTableIndex(const char* in_schemaName, const char* in_name);\n\n')
+
+    @staticmethod
+    def entries(inTables: list[LazyTable]) -> list[tuple[str, str, int]]:
+        """Returns the (schema, name, index) entries in strcmp order, the first of duplicated names wins"""
+        entries = dict()
+        for idx, table in enumerate(inTables):
+            entries.setdefault((table.TableSchemaName or '', table.Name), idx)
+        # strcmp compares UTF-8 bytes, whose order is the code points' one
+        return sorted((schema, name, idx) for (schema, name), idx in entries.items())
+
+    @staticmethod
+    def writeDefinitions(inWriter: File, inMDEF: MDEF):
+        inWriter.write('static int FindIndex(const SaaSTableIndexEntry* in_entries, size_t in_count, '
+                       'const char* in_schemaName, const char* in_name)\n')
+        inWriter.write('{\n'
+                       '\tsize_t low = 0;\n'
+                       '\tsize_t high = in_count;\n'
+                       '\twhile (low < high)\n'
+                       '\t{\n'
+                       '\t\tsize_t mid = low + (high - low) / 2;\n'
+                       '\t\tint order = strcmp(in_entries[mid].m_schemaName, in_schemaName);\n'
+                       '\t\tif (0 == order)\n'
+                       '\t\t\torder = strcmp(in_entries[mid].m_name, in_name);\n'
+                       '\t\tif (0 == order)\n'
+                       '\t\t\treturn in_entries[mid].m_index;\n'
+                       '\t\tif (order < 0)\n'
+                       '\t\t\tlow = mid + 1;\n'
+                       '\t\telse\n'
+                       '\t\t\thigh = mid;\n'
+                       '\t}\n'
+                       '\treturn -1;\n'
+                       '}\n\n')
+        for function, arrayName, tables in [('FindTableIndex', 'TABLE_INDEX', inMDEF.Tables),
+                                            ('FindSkeletonTableIndex', 'SKELETON_TABLE_INDEX', inMDEF.SkeletonTables)]:
+            entries = TableIndex.entries(tables)
+            if len(entries) > 0:
+                inWriter.write(f'static const SaaSTableIndexEntry {arrayName}[] =\n')
+                inWriter.write('{\n')
+                for schema, name, idx in entries:
+                    inWriter.write(f'\t{{ "{schema}", "{name}", {idx} }},\n')
+                inWriter.write('};\n\n')
+            inWriter.write(f'int {function}(const char* in_schemaName, const char* in_name)\n')
+            inWriter.write('{\n')
+            if len(entries) > 0:
+                inWriter.write(f'\treturn FindIndex({arrayName}, sizeof({arrayName}) / sizeof({arrayName}[0]), '
+                               'in_schemaName, in_name);\n')
+            else:
+                inWriter.write('\treturn -1;\n')
+            inWriter.write('}\n\n')
+
+
+class ConfigurationBlob(Configurable):
+    """
+    Represents a class that writes Configuration.blob
+    The blob holds the parsed MDEF as compact JSON segments, the base configuration & one per table, preceded
+    by a text index of their offsets so a driver reads only the segments it needs
+    """
+
+    VERSION = 1
+    MAGIC = 'FLUFFYCONFIG'
+    BASESEGMENT = '@Configuration'
+    # Properties of the model classes, by class
+    __properties__ = dict()
+    # Parse diagnostics of the model, not part of the configuration
+    __diagnostics__ = frozenset(['UnknownKeys', 'Label'])
+
+    @staticmethod
+    def Configure(inMDEF: MDEF, inOutputDir: str):
+        segments = [(ConfigurationBlob.BASESEGMENT, ConfigurationBlob.serialize(
+            inMDEF, ['IsStreaming', 'Tables', 'SkeletonTables']))]
+        for table in inMDEF.Tables + inMDEF.SkeletonTables:
+            segments.append((table.FullName, ConfigurationBlob.serialize(table.load())))
+
+        writer = DataFile('Configuration.blob', f'{inMDEF.DataSource} Driver Configuration', inOutputDir)
+        writer.write(f'{ConfigurationBlob.MAGIC} {ConfigurationBlob.VERSION}\n')
+        writer.write(f'{len(segments)}\n')
+        offset = 0
+        payload = list()
+        for name, segment in segments:
+            # Compact & ASCII only, so the offsets count bytes and the payload holds no line break
+            content = json.dumps(segment, separators=(',', ':'))
+            writer.write(f'{offset} {len(content)} {name}\n')
+            offset += len(content)
+            payload.append(content)
+        writer.write('\n')
+        for content in payload:
+            writer.write(content)
+        writer.save()
+
+    @staticmethod
+    def serialize(inObject, inExcluded: list[str] = None):
+        """Returns the JSON-compatible value of the given model object, built from its public properties"""
+        if inObject is None or isinstance(inObject, (bool, int, float, str)):
+            return inObject
+        if isinstance(inObject, Enum):
+            return inObject.value
+        if isinstance(inObject, (list, tuple)):
+            return [ConfigurationBlob.serialize(item) for item in inObject]
+        if isinstance(inObject, dict):
+            return {str(key): ConfigurationBlob.serialize(val) for key, val in inObject.items()}
+        if isinstance(inObject, LazyTable):
+            return ConfigurationBlob.serialize(inObject.load())
+        properties = ConfigurationBlob.__properties__.get(type(inObject))
+        if properties is None:
+            properties = list()
+            for cls in reversed(type(inObject).__mro__):
+                for name, attr in vars(cls).items():
+                    if isinstance(attr, property) and name not in properties \
+                            and name not in ConfigurationBlob.__diagnostics__:
+                        properties.append(name)
+            ConfigurationBlob.__properties__[type(inObject)] = properties
+        return {name: ConfigurationBlob.serialize(getattr(inObject, name))
+                for name in properties if inExcluded is None or name not in inExcluded}
+
+
+class ConfigurationBlobLoader(Configurable):
+    """Represents a class that writes ConfigurationBlob.h & ConfigurationBlob.cpp, the reader of Configuration.blob"""
+
+    @staticmethod
+    def Configure(inMDEF: MDEF, inOutputDir: str):
+        writer = File('ConfigurationBlob.h', f'{inMDEF.DataSource} Driver Configuration Blob', inOutputDir)
+        writer.write('#ifndef _CONFIGURATIONBLOB_H_\n')
+        writer.write('#define _CONFIGURATIONBLOB_H_\n\n')
+        writer.write('#include <fstream>\n'
+                     '#include <map>\n'
+                     '#include <string>\n\n')
+        writer.write('// Reads the segments of Configuration.blob on demand\n'
+                     'class ConfigurationBlob\n'
+                     '{\n'
+                     'public:\n'
+                     f'\tstatic const int VERSION = {ConfigurationBlob.VERSION};\n\n'
+                     '\t// Reads the segment index, returns false when the blob is missing or of another version\n'
+                     '\tbool Open(const std::string& in_path);\n\n'
+                     f'\t// Reads the JSON of a segment, "{ConfigurationBlob.BASESEGMENT}" or the full name of a table, '
+                     'returns false when absent\n'
+                     '\tbool Read(const std::string& in_name, std::string& out_json);\n\n'
+                     'private:\n'
+                     '\tstd::ifstream m_stream;\n'
+                     '\tstd::streamoff m_payload;\n'
+                     '\tstd::map<std::string, std::pair<std::streamoff, size_t> > m_segments;\n'
+                     '};\n\n')
+        writer.write('#endif\n')
+        writer.save()
+
+        writer = File('ConfigurationBlob.cpp', f'{inMDEF.DataSource} Driver Configuration Blob', inOutputDir)
+        writer.write('#include "ConfigurationBlob.h"\n\n')
+        writer.write('bool ConfigurationBlob::Open(const std::string& in_path)\n'
+                     '{\n'
+                     '\tm_segments.clear();\n'
+                     '\tm_stream.open(in_path.c_str(), std::ios::in | std::ios::binary);\n'
+                     '\tstd::string magic;\n'
+                     '\tint version = 0;\n'
+                     '\tsize_t count = 0;\n'
+                     f'\tif (!(m_stream >> magic >> version >> count) || magic != "{ConfigurationBlob.MAGIC}" || '
+                     'version != VERSION)\n'
+                     '\t\treturn false;\n\n'
+                     '\tfor (size_t idx = 0; idx < count; ++idx)\n'
+                     '\t{\n'
+                     '\t\tstd::streamoff offset = 0;\n'
+                     '\t\tsize_t length = 0;\n'
+                     '\t\tstd::string name;\n'
+                     '\t\tif (!(m_stream >> offset >> length) || m_stream.get() != \' \' || !std::getline(m_stream, name))\n'
+                     '\t\t\treturn false;\n'
+                     '\t\tif (!name.empty() && name[name.size() - 1] == \'\\r\')\n'
+                     '\t\t\tname.erase(name.size() - 1);\n'
+                     '\t\tm_segments[name] = std::make_pair(offset, length);\n'
+                     '\t}\n\n'
+                     '\t// Skips the blank line ending the index\n'
+                     '\tstd::string line;\n'
+                     '\tif (!std::getline(m_stream, line))\n'
+                     '\t\treturn false;\n'
+                     '\tm_payload = m_stream.tellg();\n'
+                     '\treturn true;\n'
+                     '}\n\n')
+        writer.write('bool ConfigurationBlob::Read(const std::string& in_name, std::string& out_json)\n'
+                     '{\n'
+                     '\tstd::map<std::string, std::pair<std::streamoff, size_t> >::const_iterator segment =\n'
+                     '\t\tm_segments.find(in_name);\n'
+                     '\tif (segment == m_segments.end())\n'
+                     '\t\treturn false;\n'
+                     '\tout_json.resize(segment->second.second);\n'
+                     '\tm_stream.clear();\n'
+                     '\tm_stream.seekg(m_payload + segment->second.first);\n'
+                     '\treturn out_json.empty() || '
+                     'm_stream.read(&out_json[0], static_cast<std::streamsize>(out_json.size())).good();\n'
+                     '}\n')
+        writer.save()
+
+
 class DriverWideConfigurationCPP(Configurable):
     """Represents a class that write DriverWideConfiguration.cpp"""
 
@@ -323,6 +623,227 @@ class DriverWideConfigurationCPP(Configurable):
         writer.save()
 
 
+class SharedColumns:
+    """
+    Represents the column definitions repeated across the tables
+    Use to emit each of them once as a ConfigurationHelpers.cpp factory, called by the tables' configurations
+    """
+
+    def __init__(self, inMDEF: MDEF):
+        columns = dict()
+        counts = dict()
+        for lazyTable in inMDEF.Tables + inMDEF.SkeletonTables:
+            table = lazyTable.load()
+            for column in table.Columns + [skeletonCol.ColumnDefinition for skeletonCol in table.SkeletonColumns]:
+                helperName = SharedColumns.helperName(column)
+                columns.setdefault(helperName, column)
+                counts[helperName] = counts.get(helperName, 0) + 1
+        self.__mColumns = {helperName: column for helperName, column in columns.items() if counts[helperName] > 1}
+        self.__mNames = frozenset(self.__mColumns)
+
+    @staticmethod
+    def helperName(inColumn: Column) -> str:
+        """Derives the factory name from everything writeColumnDefinition emits, equal columns share it"""
+        metadata = inColumn.Metadata
+        shape = (inColumn.Name, metadata.SQLType, metadata.SourceType, metadata.IsUnsigned, metadata.Length,
+                 metadata.Scale, metadata.Precision, inColumn.Nullable, inColumn.Updatable, inColumn.Passdownable,
+                 inColumn.ListResult, inColumn.ItemResult, inColumn.QueryMapping, inColumn.ReturnIdPath,
+                 inColumn.PushdownMapping)
+        digest = hashlib.sha1(repr(shape).encode('utf-8')).hexdigest()[:10]
+        return f'SharedColumn_{re.sub("[^0-9A-Za-z]", "", inColumn.Name)}_{digest}'
+
+    @property
+    def Columns(self) -> dict[str, Column]:
+        return self.__mColumns
+
+    @property
+    def Names(self) -> frozenset:
+        """Names of the factories, all the tables' configurations need to know"""
+        return self.__mNames
+
+
+class ColumnOrdinals:
+    """
+    Represents the column name to ordinal lookup of every table, static columns first then skeleton ones
+    Entries are sorted by name at generation time, the driver binary searches them
+    """
+
+    @staticmethod
+    def functionName(inTable) -> str:
+        return f'{inTable.FullName}_ColumnOrdinal'
+
+    @staticmethod
+    def writeDeclarations(inWriter: File, inMDEF: MDEF):
+        inWriter.write('// Column ordinals\n')
+        inWriter.write('struct SaaSColumnOrdinal\n'
+                       '{\n'
+                       '\tconst char* m_name;\n'
+                       '\tint m_ordinal;\n'
+                       '};\n\n')
+        inWriter.write('int FindColumnOrdinal(const SaaSColumnOrdinal* in_entries, size_t in_count, const char* in_name);\n')
+        inWriter.write('// Returns the ordinal of the given column of the table, -1 when the table has no such column\n')
+        for table in inMDEF.Tables + inMDEF.SkeletonTables:
+            inWriter.write(f'int {ColumnOrdinals.functionName(table)}(const char* in_name);\n')
+        inWriter.write('\n')
+
+    @staticmethod
+    def writeFinder(inWriter: File):
+        inWriter.write('int FindColumnOrdinal(const SaaSColumnOrdinal* in_entries, size_t in_count, const char* in_name)\n')
+        inWriter.write('{\n'
+                       '\tsize_t low = 0;\n'
+                       '\tsize_t high = in_count;\n'
+                       '\twhile (low < high)\n'
+                       '\t{\n'
+                       '\t\tsize_t mid = low + (high - low) / 2;\n'
+                       '\t\tint order = strcmp(in_entries[mid].m_name, in_name);\n'
+                       '\t\tif (0 == order)\n'
+                       '\t\t\treturn in_entries[mid].m_ordinal;\n'
+                       '\t\tif (order < 0)\n'
+                       '\t\t\tlow = mid + 1;\n'
+                       '\t\telse\n'
+                       '\t\t\thigh = mid;\n'
+                       '\t}\n'
+                       '\treturn -1;\n'
+                       '}\n\n')
+
+    @staticmethod
+    def writeTable(inWriter: File, inTable: Table):
+        """Writes the sorted ordinals of the table's columns along with their lookup"""
+        # Named after the table, as shards gather many tables in one source
+        arrayName = f'{inTable.FullName}_COLUMN_ORDINALS'
+        entries = sorted(inTable.ColumnIndex.items())
+        if len(entries) > 0:
+            inWriter.write(f'static const SaaSColumnOrdinal {arrayName}[] =\n')
+            inWriter.write('{\n')
+            for name, ordinal in entries:
+                inWriter.write(f'\t{{ "{name}", {ordinal} }},\n')
+            inWriter.write('};\n\n')
+        inWriter.write(f'int {ColumnOrdinals.functionName(inTable)}(const char* in_name)\n')
+        inWriter.write('{\n')
+        if len(entries) > 0:
+            inWriter.write(f'\treturn FindColumnOrdinal({arrayName}, sizeof({arrayName}) / sizeof({arrayName}[0]), '
+                           'in_name);\n')
+        else:
+            inWriter.write('\treturn -1;\n')
+        inWriter.write('}\n\n')
+
+
+class EmitOptions:
+    """Represents the emission modes of the tables' configurations, handed over to the workers"""
+
+    def __init__(self, inSharedColumns: frozenset = None, inDescriptors: bool = False, inColumnOrdinals: bool = False):
+        # Names of the ConfigurationHelpers.cpp column factories
+        self.mSharedColumns = inSharedColumns
+        # Emits the static columns as descriptor arrays materialized by AddColumns
+        self.mDescriptors = inDescriptors
+        # Precedes every table with its column name to ordinal lookup
+        self.mColumnOrdinals = inColumnOrdinals
+
+
+class ColumnDescriptors:
+    """
+    Represents the data-driven emission of the static columns
+    Columns become rows of a static constant array, a single loop of ConfigurationHelpers.cpp materializes them
+    """
+
+    # Source type enumeration of the SDK, SaaSMetadata::SetSourceType's parameter
+    SOURCETYPE = 'Simba::SaaSSDK::SaaSSourceType'
+    __fields__ = [
+        ('const char*', 'm_name'),
+        ('int', 'm_sqlType'),
+        ('bool', 'm_hasSourceType'),
+        (SOURCETYPE, 'm_sourceType'),
+        ('bool', 'm_isUnsigned'),
+        ('int', 'm_length'),
+        ('int', 'm_scale'),
+        ('int', 'm_precision'),
+        ('bool', 'm_nullable'),
+        ('bool', 'm_updatable'),
+        ('bool', 'm_passdownable'),
+        ('const char*', 'm_listResult'),
+        ('const char*', 'm_itemResult'),
+        ('const char*', 'm_queryMapping'),
+        ('const char*', 'm_returnIdPath'),
+        ('const char*', 'm_pushdownMapping')
+    ]
+
+    @staticmethod
+    def writeDeclarations(inWriter: File):
+        inWriter.write('// Column descriptors\n')
+        inWriter.write('struct SaaSColumnDescriptor\n')
+        inWriter.write('{\n')
+        for fieldType, fieldName in ColumnDescriptors.__fields__:
+            inWriter.write(f'\t{fieldType} {fieldName};\n')
+        inWriter.write('};\n\n')
+        inWriter.write('void AddColumns(Simba::SaaSSDK::SaaSTable& io_table, const SaaSColumnDescriptor* in_columns, '
+                       'size_t in_count);\n\n')
+
+    @staticmethod
+    def writeMaterializer(inWriter: File):
+        inWriter.write('void AddColumns(SaaSTable& io_table, const SaaSColumnDescriptor* in_columns, size_t in_count)\n')
+        inWriter.write('{\n')
+        inWriter.write('\tfor (size_t idx = 0; idx < in_count; ++idx)\n')
+        inWriter.write('\t{\n')
+        inWriter.write('\t\tconst SaaSColumnDescriptor& descriptor = in_columns[idx];\n')
+        inWriter.write('\t\tSaaSTableColumn column_table;\n')
+        inWriter.write('\t\tcolumn_table.SetName(descriptor.m_name);\n')
+        inWriter.write('\t\tSaaSMetadata metadata_column_table;\n')
+        inWriter.write('\t\tmetadata_column_table.SetSqlType(descriptor.m_sqlType);\n')
+        inWriter.write('\t\tif (descriptor.m_hasSourceType)\n')
+        inWriter.write('\t\t\tmetadata_column_table.SetSourceType(descriptor.m_sourceType);\n')
+        inWriter.write('\t\tif (descriptor.m_isUnsigned)\n')
+        inWriter.write('\t\t\tmetadata_column_table.SetIsUnsigned(true);\n')
+        for setter, fieldName in [('SetLength', 'm_length'), ('SetScale', 'm_scale'), ('SetPrecision', 'm_precision')]:
+            inWriter.write(f'\t\tif (descriptor.{fieldName} > 0)\n')
+            inWriter.write(f'\t\t\tmetadata_column_table.{setter}(descriptor.{fieldName});\n')
+        inWriter.write('\t\tcolumn_table.SetMetadata(metadata_column_table);\n')
+        inWriter.write('\t\tcolumn_table.SetNullable(descriptor.m_nullable);\n')
+        inWriter.write('\t\tcolumn_table.SetUpdatable(descriptor.m_updatable);\n')
+        inWriter.write('\t\tcolumn_table.SetPassdownable(descriptor.m_passdownable);\n')
+        for setter, fieldName in [('SetSvcRespAttrListResult', 'm_listResult'),
+                                  ('SetSvcRespAttrItemResult', 'm_itemResult'),
+                                  ('SetSvcReqParamQueryMapping', 'm_queryMapping'),
+                                  ('SetSvcRespAttrReturnIdPath', 'm_returnIdPath'),
+                                  ('SetColumnPushDownMapping', 'm_pushdownMapping')]:
+            inWriter.write(f'\t\tif (descriptor.{fieldName} != nullptr)\n')
+            inWriter.write(f'\t\t\tcolumn_table.{setter}(descriptor.{fieldName});\n')
+        inWriter.write('\t\tio_table.AddColumn(column_table);\n')
+        inWriter.write('\t}\n')
+        inWriter.write('}\n\n')
+
+    @staticmethod
+    def writeArray(inWriter: File, inColumns: list[Column], indent: int = 1):
+        """Writes the columns as descriptor rows followed by the AddColumns call"""
+        tab = '\t'
+        inWriter.write(f'{tab * indent}static const SaaSColumnDescriptor columns[] =\n')
+        inWriter.write(f'{tab * indent}{"{"}\n')
+        for column in inColumns:
+            metadata = column.Metadata
+            hasSourceType = metadata.SourceType is not None and len(metadata.SourceType) > 0
+            values = [
+                f'"{column.Name}"',
+                metadata.SQLType,
+                ColumnDescriptors.boolean(hasSourceType),
+                metadata.SourceType.upper() if hasSourceType else f'{ColumnDescriptors.SOURCETYPE}()',
+                ColumnDescriptors.boolean(metadata.IsUnsigned),
+                max(metadata.Length, 0),
+                max(metadata.Scale, 0),
+                max(metadata.Precision, 0),
+                ColumnDescriptors.boolean(column.Nullable),
+                ColumnDescriptors.boolean(column.Updatable),
+                ColumnDescriptors.boolean(column.Passdownable)
+            ] + [f'"{value}"' if value is not None and len(value) > 0 else 'nullptr'
+                 for value in [column.ListResult, column.ItemResult, column.QueryMapping, column.ReturnIdPath,
+                               column.PushdownMapping]]
+            inWriter.write(f'{tab * (indent + 1)}{{ {", ".join(str(value) for value in values)} }},\n')
+        inWriter.write(f'{tab * indent}{"}"};\n')
+        inWriter.write(f'{tab * indent}AddColumns(table, columns, sizeof(columns) / sizeof(columns[0]));\n')
+
+    @staticmethod
+    def boolean(inValue) -> str:
+        return 'true' if inValue else 'false'
+
+
 class AbstractTableConfig:
     """Represents a class that writes Common Tables' configurations"""
 
@@ -466,68 +987,80 @@ class AbstractTableConfig:
         inWriter.write(f'{tab * indentLevel}{"}"}\n')
 
     @staticmethod
-    def writeColumns(inWriter: File, inColumns: list[Column], indent: int = 1, isSkeletonColumn: bool = False):
+    def writeColumns(inWriter: File, inColumns: list[Column], indent: int = 1, isSkeletonColumn: bool = False,
+                     inOptions: EmitOptions = None):
         tab = '\t'
+        target = 'skeleton_columns.SetSkeletonColumnDefinition' if isSkeletonColumn else 'table.AddColumn'
         if isSkeletonColumn:
             inWriter.write(f'{tab * indent}// Skeleton Column Definition\n')
         else:
             inWriter.write(f'{tab * indent}// Static Columns\n')
         inWriter.write(f'{tab * indent}{"{"}\n')
+        if inOptions is not None and inOptions.mDescriptors and not isSkeletonColumn:
+            ColumnDescriptors.writeArray(inWriter, inColumns, indent + 1)
+            inWriter.write(f'{tab * indent}{"}"}\n')
+            return
         for column in inColumns:
+            if inOptions is not None and inOptions.mSharedColumns is not None:
+                helperName = SharedColumns.helperName(column)
+                if helperName in inOptions.mSharedColumns:
+                    inWriter.write(f'{tab * (indent + 1)}{target}({helperName}());\n')
+                    continue
             inWriter.write(f'{tab * (indent + 1)}{"{"}\n')
-            inWriter.write(f'{tab * (indent + 2)}SaaSTableColumn column_table;\n')
-            inWriter.write(f'{tab * (indent + 2)}column_table.SetName("{column.Name}");\n')
-
-            inWriter.write(f'{tab * (indent + 2)}SaaSMetadata metadata_column_table;\n')
-            colMetadata = column.Metadata
-            inWriter.write(f'{tab * (indent + 2)}metadata_column_table.SetSqlType({colMetadata.SQLType});\n')
-            if colMetadata.SourceType is not None and len(colMetadata.SourceType) > 0:
-                inWriter.write(
-                    f'{tab * (indent + 2)}metadata_column_table.SetSourceType({colMetadata.SourceType.upper()});\n'
-                )
-            if colMetadata.IsUnsigned:
-                inWriter.write(
-                    f'{tab * (indent + 2)}metadata_column_table.SetIsUnsigned({str(colMetadata.IsUnsigned).lower()});\n'
-                )
-            if colMetadata.Length > 0:
-                inWriter.write(f'{tab * (indent + 2)}metadata_column_table.SetLength({colMetadata.Length});\n')
-            if colMetadata.Scale > 0:
-                inWriter.write(f'{tab * (indent + 2)}metadata_column_table.SetScale({colMetadata.Scale});\n')
-            if colMetadata.Precision > 0:
-                inWriter.write(f'{tab * (indent + 2)}metadata_column_table.SetPrecision({colMetadata.Precision});\n')
-            inWriter.write(f'{tab * (indent + 2)}column_table.SetMetadata(metadata_column_table);\n')
-
-            inWriter.write(f'{tab * (indent + 2)}column_table.SetNullable({str(column.Nullable).lower()});\n')
-            inWriter.write(f'{tab * (indent + 2)}column_table.SetUpdatable({str(column.Updatable).lower()});\n')
-            inWriter.write(f'{tab * (indent + 2)}column_table.SetPassdownable({str(column.Passdownable).lower()});\n')
-            if column.ListResult is not None and len(column.ListResult) > 0:
-                inWriter.write(f'{tab * (indent + 2)}column_table.SetSvcRespAttrListResult("{column.ListResult}");\n')
-            if column.ItemResult is not None and len(column.ItemResult) > 0:
-                inWriter.write(f'{tab * (indent + 2)}column_table.SetSvcRespAttrItemResult("{column.ItemResult}");\n')
-            if column.QueryMapping is not None and len(column.QueryMapping) > 0:
-                inWriter.write(f'{tab * (indent + 2)}column_table.SetSvcReqParamQueryMapping("{column.QueryMapping}");\n')
-            if column.ReturnIdPath is not None and len(column.ReturnIdPath) > 0:
-                inWriter.write(f'{tab * (indent + 2)}column_table.SetSvcRespAttrReturnIdPath("{column.ReturnIdPath}");\n')
-            if column.PushdownMapping is not None and len(column.PushdownMapping) > 0:
-                inWriter.write(f'{tab * (indent + 2)}column_table.SetColumnPushDownMapping("{column.PushdownMapping}");\n')
-            if column.SyntheticIndexColumn:
-                # Do nothing. Virtual tables not implemented
-                pass
-            if isSkeletonColumn:
-                inWriter.write(f'{tab * (indent + 2)}skeleton_columns.SetSkeletonColumnDefinition(column_table);\n')
-            else:
-                inWriter.write(f'{tab * (indent + 2)}table.AddColumn(column_table);\n')
+            AbstractTableConfig.writeColumnDefinition(inWriter, column, indent + 2)
+            inWriter.write(f'{tab * (indent + 2)}{target}(column_table);\n')
             inWriter.write(f'{tab * (indent + 1)}{"}"}\n')
         inWriter.write(f'{tab * indent}{"}"}\n')
 
     @staticmethod
-    def writeSkeletonColumns(inWriter: File, inColumns: list[SkeletonColumn], indent: int = 1):
+    def writeColumnDefinition(inWriter: File, inColumn: Column, indent: int = 1):
+        """Writes the statements building column_table from the given column"""
+        tab = '\t'
+        inWriter.write(f'{tab * indent}SaaSTableColumn column_table;\n')
+        inWriter.write(f'{tab * indent}column_table.SetName("{inColumn.Name}");\n')
+
+        inWriter.write(f'{tab * indent}SaaSMetadata metadata_column_table;\n')
+        colMetadata = inColumn.Metadata
+        inWriter.write(f'{tab * indent}metadata_column_table.SetSqlType({colMetadata.SQLType});\n')
+        if colMetadata.SourceType is not None and len(colMetadata.SourceType) > 0:
+            inWriter.write(f'{tab * indent}metadata_column_table.SetSourceType({colMetadata.SourceType.upper()});\n')
+        if colMetadata.IsUnsigned:
+            inWriter.write(f'{tab * indent}metadata_column_table.SetIsUnsigned({str(colMetadata.IsUnsigned).lower()});\n')
+        if colMetadata.Length > 0:
+            inWriter.write(f'{tab * indent}metadata_column_table.SetLength({colMetadata.Length});\n')
+        if colMetadata.Scale > 0:
+            inWriter.write(f'{tab * indent}metadata_column_table.SetScale({colMetadata.Scale});\n')
+        if colMetadata.Precision > 0:
+            inWriter.write(f'{tab * indent}metadata_column_table.SetPrecision({colMetadata.Precision});\n')
+        inWriter.write(f'{tab * indent}column_table.SetMetadata(metadata_column_table);\n')
+
+        inWriter.write(f'{tab * indent}column_table.SetNullable({str(inColumn.Nullable).lower()});\n')
+        inWriter.write(f'{tab * indent}column_table.SetUpdatable({str(inColumn.Updatable).lower()});\n')
+        inWriter.write(f'{tab * indent}column_table.SetPassdownable({str(inColumn.Passdownable).lower()});\n')
+        if inColumn.ListResult is not None and len(inColumn.ListResult) > 0:
+            inWriter.write(f'{tab * indent}column_table.SetSvcRespAttrListResult("{inColumn.ListResult}");\n')
+        if inColumn.ItemResult is not None and len(inColumn.ItemResult) > 0:
+            inWriter.write(f'{tab * indent}column_table.SetSvcRespAttrItemResult("{inColumn.ItemResult}");\n')
+        if inColumn.QueryMapping is not None and len(inColumn.QueryMapping) > 0:
+            inWriter.write(f'{tab * indent}column_table.SetSvcReqParamQueryMapping("{inColumn.QueryMapping}");\n')
+        if inColumn.ReturnIdPath is not None and len(inColumn.ReturnIdPath) > 0:
+            inWriter.write(f'{tab * indent}column_table.SetSvcRespAttrReturnIdPath("{inColumn.ReturnIdPath}");\n')
+        if inColumn.PushdownMapping is not None and len(inColumn.PushdownMapping) > 0:
+            inWriter.write(f'{tab * indent}column_table.SetColumnPushDownMapping("{inColumn.PushdownMapping}");\n')
+        if inColumn.SyntheticIndexColumn:
+            # Do nothing. Virtual tables not implemented
+            pass
+
+    @staticmethod
+    def writeSkeletonColumns(inWriter: File, inColumns: list[SkeletonColumn], indent: int = 1,
+                             inOptions: EmitOptions = None):
         tab = '\t'
         inWriter.write(f'{tab * indent}// Skeleton Columns\n')
         inWriter.write(f'{tab * indent}{"{"}\n')
         for skeletonCol in inColumns:
             inWriter.write(f'{tab * (indent + 1)}SaaSSkeletonColumn skeleton_columns;\n')
-            AbstractTableConfig.writeColumns(inWriter, [skeletonCol.ColumnDefinition], indent + 1, True)
+            AbstractTableConfig.writeColumns(inWriter, [skeletonCol.ColumnDefinition], indent + 1, True,
+                                             inOptions)
             AbstractTableConfig.writeListVariables(inWriter, [skeletonCol.ListVariableAccess], indent + 1, True)
             inWriter.write(f'{tab * (indent + 1)}table.AddSkeletonColumn(skeleton_columns);\n')
         inWriter.write(f'{tab * indent}{"}"}\n')
@@ -605,12 +1138,19 @@ class AbstractTableConfig:
         inWriter.write('\n')
 
     @staticmethod
-    def Configure(inTable, inDataSource: str, inWriter: File):
+    def writeIncludes(inWriter: File):
+        """Writes the includes shared by the tables' configurations, once per source file"""
         inWriter.write('#include "Authentication/SaaSAuthenticationFactory.h"\n')
         inWriter.write('#include "ConfigurationHelpers.h"\n')
         inWriter.write('#include "Configuration/SaaSConfiguration.h"\n')
         inWriter.write('#include "Pagination/SaaSPaginationFactory.h"\n\n')
         inWriter.write('using namespace Simba::SaaSSDK;\n\n')
+
+    @staticmethod
+    def Configure(inTable, inDataSource: str, inWriter: File, inOptions: EmitOptions = None):
+        """Writes the table definition, inOptions selects how the columns are emitted"""
+        if inOptions is not None and inOptions.mColumnOrdinals:
+            ColumnOrdinals.writeTable(inWriter, inTable)
         inWriter.write(f'void {inTable.FullName}(SaaSConfiguration& io_configs)\n')
         inWriter.write('{\n')
         inWriter.write('\tSaaSTable table;\n')
@@ -635,10 +1175,10 @@ class AbstractTableConfig:
         AbstractTableConfig.writeForeignKeys(inWriter, inTable.ForeignKeys, 1)
 
         # Prepare Columns
-        AbstractTableConfig.writeColumns(inWriter, inTable.Columns, 1)
+        AbstractTableConfig.writeColumns(inWriter, inTable.Columns, 1, False, inOptions)
 
         # Prepare SkeletonTables
-        AbstractTableConfig.writeSkeletonColumns(inWriter, inTable.SkeletonColumns, 1)
+        AbstractTableConfig.writeSkeletonColumns(inWriter, inTable.SkeletonColumns, 1, inOptions)
 
         # Prepares Pagination
         if inTable.Pageable:
@@ -657,36 +1197,123 @@ class AbstractTableConfig:
         inWriter.write('\t\ttable.SetAPIAccess(table_apiAccess);\n')
         inWriter.write('\t}\n\n')
 
+    @staticmethod
+    def ConfigureAll(inConfigureTable, inTables: list, inDataSource: str, inOutputDir: str, inPool: WorkerPool = None,
+                     inOptions: EmitOptions = None):
+        """Writes the tables' configurations through given pool, serially when no pool is given"""
+        pool = inPool if inPool is not None else WorkerPool()
+        results = pool.map(inConfigureTable, inTables, inDataSource, inOutputDir, inOptions)
+        for table, (filePath, digest) in zip(inTables, results):
+            # Workers record into their own copy of the manifest
+            if File.Manifest is not None:
+                File.Manifest.record(filePath, digest, [table.FullName])
+
+    @staticmethod
+    def ConfigureShards(inRenderTable, inTables: list, inDataSource: str, inOutputDir: str, inShardMap: ShardMap,
+                        inShardName: str, inPool: WorkerPool = None, inOptions: EmitOptions = None):
+        """Packs the tables' configurations into the unity-build shards of given map"""
+        pool = inPool if inPool is not None else WorkerPool()
+        definitions = dict(pool.map(inRenderTable, inTables, inDataSource, inOptions))
+        shards = inShardMap.assign(inShardName, {name: len(definition) for name, definition in definitions.items()})
+        for idx, names in enumerate(shards):
+            writer = File(f'{inShardName}_{idx}.cpp', f'{inDataSource} tables configurations, shard {idx}', inOutputDir)
+            AbstractTableConfig.writeIncludes(writer)
+            writer.write('\n\n'.join(definitions[name] for name in names))
+            digest = writer.save()
+            if File.Manifest is not None:
+                File.Manifest.record(os.path.join(inOutputDir, writer.mName), digest, names)
+
 
 class TableConfig(Configurable):
     """Represents a class that writes Tables' configurations"""
 
     @staticmethod
-    def Configure(inMDEF: MDEF, inOutputDir: str):
-        for table in inMDEF.Tables:
-            writer = File(f'{table.FullName}.cpp', f'{inMDEF.DataSource} {table.FullName} configurations', inOutputDir)
-            AbstractTableConfig.Configure(table, inMDEF.DataSource, writer)
-            writer.write('\tio_configs.AddTable(table);\n')
-            writer.write('}')
-            writer.save()
+    def Configure(inMDEF: MDEF, inOutputDir: str, inPool: WorkerPool = None, inShardMap: ShardMap = None,
+                  inOptions: EmitOptions = None):
+        if inShardMap is not None:
+            AbstractTableConfig.ConfigureShards(TableConfig.RenderTable, inMDEF.Tables, inMDEF.DataSource,
+                                                inOutputDir, inShardMap, 'TableShard', inPool, inOptions)
+        else:
+            AbstractTableConfig.ConfigureAll(TableConfig.ConfigureTable, inMDEF.Tables, inMDEF.DataSource,
+                                             inOutputDir, inPool, inOptions)
+
+    @staticmethod
+    def writeTable(inTable: Table, inDataSource: str, inWriter: File, inOptions: EmitOptions = None):
+        AbstractTableConfig.Configure(inTable, inDataSource, inWriter, inOptions)
+        inWriter.write('\tio_configs.AddTable(table);\n')
+        inWriter.write('}')
+
+    @staticmethod
+    def ConfigureTable(inTable: LazyTable, inDataSource: str, inOutputDir: str, inOptions: EmitOptions = None):
+        with Tracer.span(inTable.FullName, 'Table'):
+            with Tracer.span(inTable.FullName, 'Parse'):
+                inTable = inTable.load()
+            with Tracer.span(inTable.FullName, 'Render'):
+                writer = File(f'{inTable.FullName}.cpp', f'{inDataSource} {inTable.FullName} configurations',
+                              inOutputDir)
+                AbstractTableConfig.writeIncludes(writer)
+                TableConfig.writeTable(inTable, inDataSource, writer, inOptions)
+            return os.path.join(inOutputDir, writer.mName), writer.save()
+
+    @staticmethod
+    def RenderTable(inTable: LazyTable, inDataSource: str, inOptions: EmitOptions = None):
+        """Returns the full name of the table along with its rendered definition"""
+        with Tracer.span(inTable.FullName, 'Table'):
+            with Tracer.span(inTable.FullName, 'Parse'):
+                inTable = inTable.load()
+            with Tracer.span(inTable.FullName, 'Render'):
+                fragment = Fragment()
+                TableConfig.writeTable(inTable, inDataSource, fragment, inOptions)
+            return inTable.FullName, fragment.getContent()
 
 
 class SkeletonTableConfig(Configurable):
     """Represents a class that writes SkeletonTables' configurations"""
 
     @staticmethod
-    def Configure(inMDEF: MDEF, inOutputDir: str):
-        for table in inMDEF.SkeletonTables:
-            writer = File(f'{table.FullName}.cpp', f'{inMDEF.DataSource} {table.FullName} configurations', inOutputDir)
-            AbstractTableConfig.Configure(table, inMDEF.DataSource, writer)
-            # Prepares SkeletonTables
-            writer.write('\t// Skeleton Table information\n')
-            writer.write('\tSaaSSkeletonTable skeleton_table;\n')
-            writer.write('\tskeleton_table.SetTableDefinition(table);\n\n')
-
-            # Prepares List Variable PreCalls
-            AbstractTableConfig.writeListVariables(writer, table.ListVariables, 1)
-            writer.write('\tio_configs.SetSkeletonTableInitialized(false);\n')
-            writer.write('\tio_configs.AddSkeletonTable(skeleton_table);\n')
-            writer.write('}')
-            writer.save()
+    def Configure(inMDEF: MDEF, inOutputDir: str, inPool: WorkerPool = None, inShardMap: ShardMap = None,
+                  inOptions: EmitOptions = None):
+        if inShardMap is not None:
+            AbstractTableConfig.ConfigureShards(SkeletonTableConfig.RenderTable, inMDEF.SkeletonTables,
+                                                inMDEF.DataSource, inOutputDir, inShardMap, 'SkeletonTableShard',
+                                                inPool, inOptions)
+        else:
+            AbstractTableConfig.ConfigureAll(SkeletonTableConfig.ConfigureTable, inMDEF.SkeletonTables,
+                                             inMDEF.DataSource, inOutputDir, inPool, inOptions)
+
+    @staticmethod
+    def writeTable(inTable: SkeletonTable, inDataSource: str, inWriter: File, inOptions: EmitOptions = None):
+        AbstractTableConfig.Configure(inTable, inDataSource, inWriter, inOptions)
+        # Prepares SkeletonTables
+        inWriter.write('\t// Skeleton Table information\n')
+        inWriter.write('\tSaaSSkeletonTable skeleton_table;\n')
+        inWriter.write('\tskeleton_table.SetTableDefinition(table);\n\n')
+
+        # Prepares List Variable PreCalls
+        AbstractTableConfig.writeListVariables(inWriter, inTable.ListVariables, 1)
+        inWriter.write('\tio_configs.SetSkeletonTableInitialized(false);\n')
+        inWriter.write('\tio_configs.AddSkeletonTable(skeleton_table);\n')
+        inWriter.write('}')
+
+    @staticmethod
+    def ConfigureTable(inTable: LazyTable, inDataSource: str, inOutputDir: str, inOptions: EmitOptions = None):
+        with Tracer.span(inTable.FullName, 'Table'):
+            with Tracer.span(inTable.FullName, 'Parse'):
+                inTable = inTable.load()
+            with Tracer.span(inTable.FullName, 'Render'):
+                writer = File(f'{inTable.FullName}.cpp', f'{inDataSource} {inTable.FullName} configurations',
+                              inOutputDir)
+                AbstractTableConfig.writeIncludes(writer)
+                SkeletonTableConfig.writeTable(inTable, inDataSource, writer, inOptions)
+            return os.path.join(inOutputDir, writer.mName), writer.save()
+
+    @staticmethod
+    def RenderTable(inTable: LazyTable, inDataSource: str, inOptions: EmitOptions = None):
+        """Returns the full name of the table along with its rendered definition"""
+        with Tracer.span(inTable.FullName, 'Table'):
+            with Tracer.span(inTable.FullName, 'Parse'):
+                inTable = inTable.load()
+            with Tracer.span(inTable.FullName, 'Render'):
+                fragment = Fragment()
+                SkeletonTableConfig.writeTable(inTable, inDataSource, fragment, inOptions)
+            return inTable.FullName, fragment.getContent()
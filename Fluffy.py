@@ -1,38 +1,180 @@
 import os
+import sys
 import json
-from Util import clean
+import argparse
+from Util import AsyncWriter, BuildFragment, File, JSONStream, Manifest, ShardMap, Tracer, WorkerPool
 from Configurations import *
+from Watch import Watcher
+from Validator import Validator
 
 
-def main(inMDEFPath: str, inOutputDir: str):
+def main(inMDEFPath: str, inOutputDir: str, *, inIncremental: bool = False, inJobs: int = 1,
+         inStreaming: bool = False, inStreamWrites: bool = False, inCacheDir: str = None,
+         inProfile: bool = False, inTracePath: str = None, inShards: int = 0,
+         inBuildFragment: bool = False, inWriteThreads: int = 0, inWriteQueue: int = 64,
+         inSharedColumns: bool = False, inDescriptors: bool = False, inLazyTables: bool = False,
+         inBlob: bool = False, inTableIndex: bool = False, inColumnOrdinals: bool = False,
+         inValidate: bool = False) -> Tracer:
+    """Generates the driver configurations, returns the tracer of the run when tracing"""
     if os.path.exists(inMDEFPath):
         inMDEFPath = os.path.abspath(inMDEFPath)
     else:
         print(f'Invalid MDEF path: {inMDEFPath}')
+    if inProfile or inTracePath is not None:
+        Tracer.Active = Tracer()
 
     configDir = os.path.join(inOutputDir, 'Configs')
     tablesDir = os.path.join(inOutputDir, 'Tables')
     skeletonTablesDir = os.path.join(inOutputDir, 'SkeletonTables')
+    outputDirs = [configDir, tablesDir, skeletonTablesDir]
 
-    clean(configDir)
-    clean(tablesDir)
-    clean(skeletonTablesDir)
+    with Tracer.span('Prepare', 'Phase'):
+        # Existing outputs stay in place until replaced, the orphaned ones are pruned once the generation is over
+        for outputDir in outputDirs:
+            File.createDir(outputDir)
+        File.Manifest = Manifest(inOutputDir, not inIncremental)
+        File.Streaming = inStreamWrites
+        File.Writer = AsyncWriter(inWriteThreads, inWriteQueue) if inWriteThreads > 0 else None
 
-    with open(inMDEFPath, 'r') as file:
-        mdefContent = json.load(file)
-    mdef = MDEF(mdefContent)
+    with Tracer.span('Parse', 'Phase'):
+        if inStreaming:
+            # Tables are decoded and parsed one at a time, whenever a Configurable walks through them
+            mdef = MDEF(JSONStream(inMDEFPath).load([Constants.TABLES.value, Constants.SKELETONTABLE.value]), True)
+        elif inCacheDir is not None:
+            mdef = MDEFCache(inCacheDir).load(inMDEFPath)
+        else:
+            with Tracer.span(os.path.basename(inMDEFPath), 'Decode'):
+                with open(inMDEFPath, 'r') as file:
+                    content = json.load(file)
+            mdef = MDEF(content)
 
-    ConfigurationH.Configure(mdef, configDir)
-    ConfigurationCPP.Configure(mdef, configDir)
-    ConfigurationHelpersH.Configure(mdef, configDir)
-    DriverWideConfigurationCPP.Configure(mdef, configDir)
+    if inValidate:
+        # Colliding identifiers are among the validation errors
+        with Tracer.span(Validator.__name__, 'Phase'):
+            Validator.check(mdef, True)
+    else:
+        Validator.check(mdef, False)
+
+    sharedColumns = None
+    if inSharedColumns:
+        with Tracer.span(SharedColumns.__name__, 'Phase'):
+            sharedColumns = SharedColumns(mdef)
+
+    # The lazy table registry is resolved through the table index
+    inTableIndex = inTableIndex or inLazyTables
+    with Tracer.span(ConfigurationH.__name__, 'Phase'):
+        ConfigurationH.Configure(mdef, configDir)
+    with Tracer.span(ConfigurationCPP.__name__, 'Phase'):
+        ConfigurationCPP.Configure(mdef, configDir, inLazyTables)
+    with Tracer.span(DriverWideConfigurationCPP.__name__, 'Phase'):
+        DriverWideConfigurationCPP.Configure(mdef, configDir)
+    with Tracer.span(ConfigurationHelpersH.__name__, 'Phase'):
+        ConfigurationHelpersH.Configure(mdef, configDir, sharedColumns, inDescriptors, inLazyTables, inTableIndex,
+                                        inColumnOrdinals)
+    if sharedColumns is not None or inDescriptors or inTableIndex or inColumnOrdinals:
+        with Tracer.span(ConfigurationHelpersCPP.__name__, 'Phase'):
+            ConfigurationHelpersCPP.Configure(mdef, configDir, sharedColumns, inDescriptors, inTableIndex,
+                                              inColumnOrdinals)
+    if inBlob:
+        for configurable in [ConfigurationBlob, ConfigurationBlobLoader]:
+            with Tracer.span(configurable.__name__, 'Phase'):
+                configurable.Configure(mdef, configDir)
+
+    shardMap = ShardMap(inOutputDir, inShards) if inShards > 0 else None
+    options = EmitOptions(sharedColumns.Names if sharedColumns is not None else None, inDescriptors, inColumnOrdinals)
+    with WorkerPool(inJobs) as pool:
+        with Tracer.span(TableConfig.__name__, 'Phase'):
+            TableConfig.Configure(mdef, tablesDir, pool, shardMap, options)
+        with Tracer.span(SkeletonTableConfig.__name__, 'Phase'):
+            SkeletonTableConfig.Configure(mdef, skeletonTablesDir, pool, shardMap, options)
+    if shardMap is not None:
+        shardMap.save()
+    if File.Writer is not None:
+        with Tracer.span('Flush', 'Phase'):
+            writer, File.Writer = File.Writer, None
+            writer.close()
+
+    with Tracer.span('Prune', 'Phase'):
+        File.Manifest.prune(outputDirs)
+        File.Manifest.save()
+        File.syncDirs(outputDirs + [inOutputDir])
+    if inBuildFragment:
+        BuildFragment.save(File.Manifest)
 
-    TableConfig.Configure(mdef, tablesDir)
-    SkeletonTableConfig.Configure(mdef, skeletonTablesDir)
+    tracer, Tracer.Active = Tracer.Active, None
+    if inTracePath is not None:
+        tracer.export(inTracePath)
+    if inProfile:
+        print(tracer.summary())
+    return tracer
 
 
 if __name__ == '__main__':
-    if len(sys.argv) < 3:
-        print(f'Too few inputs\nRun python {os.path.basename(__file__)} <MDEFPath> <OutputDir>')
+    parser = argparse.ArgumentParser(description='Prepares SaaS SDK driver configurations from the driver MDEF')
+    parser.add_argument('MDEFPath', help='Absolute/relative path to Driver MDEF')
+    parser.add_argument('OutputDir', help='Absolute/relative path to output directory')
+    parser.add_argument('--incremental', action='store_true',
+                        help='Rewrite only the changed files, the unchanged ones keep their modification time')
+    parser.add_argument('--jobs', type=int, default=1, metavar='N',
+                        help='Number of worker processes rendering the tables (default: 1)')
+    parsing = parser.add_mutually_exclusive_group()
+    parsing.add_argument('--stream', action='store_true',
+                         help='Parse the tables incrementally from disk to run in bounded memory on large MDEFs')
+    parsing.add_argument('--cache-dir', metavar='DIR',
+                         help='Reuse the parsed MDEF model cached in DIR while the MDEF and generator are unchanged')
+    parser.add_argument('--stream-writes', action='store_true',
+                        help='Write the generated code straight to buffered file handles instead of memory')
+    parser.add_argument('--profile', action='store_true',
+                        help='Prints the time spent per phase, table & file write, slowest first')
+    parser.add_argument('--trace', metavar='FILE',
+                        help='Records the spans of the run in FILE as Chrome trace events')
+    parser.add_argument('--watch', action='store_true',
+                        help='Keeps running and re-renders the outputs affected by every MDEF edit')
+    parser.add_argument('--shards', type=int, default=0, metavar='N',
+                        help='Packs the tables\' configurations into N unity-build sources per directory')
+    parser.add_argument('--build-fragment', action='store_true',
+                        help='Lists the generated outputs, their tables & whether they changed in '
+                             f'OutputDir/{BuildFragment.FILENAME}')
+    parser.add_argument('--write-threads', type=int, default=0, metavar='N',
+                        help='Writes the files on N background threads while rendering goes on (default: 0)')
+    parser.add_argument('--write-queue', type=int, default=64, metavar='N',
+                        help='Files waiting for the background threads before rendering blocks (default: 64)')
+    columns = parser.add_mutually_exclusive_group()
+    columns.add_argument('--shared-columns', action='store_true',
+                         help='Emits the column definitions repeated across tables once, as ConfigurationHelpers.cpp '
+                              'factories')
+    columns.add_argument('--descriptors', action='store_true',
+                         help='Emits the tables\' columns as constant descriptor arrays materialized by a single loop')
+    parser.add_argument('--lazy-tables', action='store_true',
+                        help='Registers the tables by name in Configuration.cpp to populate them on first use')
+    parser.add_argument('--blob', action='store_true',
+                        help='Also serializes the configurations into Configs/Configuration.blob along with its reader')
+    parser.add_argument('--table-index', action='store_true',
+                        help='Emits a sorted schema & name to table index lookup into ConfigurationHelpers')
+    parser.add_argument('--column-ordinals', action='store_true',
+                        help='Precedes every table\'s configuration with a sorted column name to ordinal lookup')
+    parser.add_argument('--validate', action='store_true',
+                        help='Checks the MDEF references & keys first and generates nothing when any is broken')
+    args = parser.parse_args()
+    if args.watch and args.shards > 0:
+        parser.error('--watch renders one source per table, it can\'t be combined with --shards')
+    # Modes whose outputs depend on every table, which --watch doesn't re-render
+    for option in ['shared_columns', 'descriptors', 'lazy_tables', 'blob', 'table_index', 'column_ordinals']:
+        if args.watch and getattr(args, option):
+            parser.error(f'--watch re-renders the edited tables only, it can\'t be combined with '
+                         f'--{option.replace("_", "-")}')
+    try:
+        # Snapshots the MDEF before the first run, so no edit made meanwhile is missed
+        watcher = Watcher(args.MDEFPath, args.OutputDir, args.build_fragment, args.validate) if args.watch else None
+        main(args.MDEFPath, args.OutputDir, inIncremental=args.incremental or args.watch, inJobs=args.jobs,
+             inStreaming=args.stream, inStreamWrites=args.stream_writes, inCacheDir=args.cache_dir,
+             inProfile=args.profile, inTracePath=args.trace, inShards=args.shards,
+             inBuildFragment=args.build_fragment, inWriteThreads=args.write_threads, inWriteQueue=args.write_queue,
+             inSharedColumns=args.shared_columns, inDescriptors=args.descriptors, inLazyTables=args.lazy_tables,
+             inBlob=args.blob, inTableIndex=args.table_index, inColumnOrdinals=args.column_ordinals,
+             inValidate=args.validate)
+    except MDEFError as error:
+        print(error, file=sys.stderr)
         sys.exit(1)
-    main(sys.argv[1], sys.argv[2])
+    if watcher is not None:
+        watcher.watch()
@@ -1,9 +1,12 @@
 """
 Contains definition of MDEF class
 """
+import os
 import sys
+import json
+import pickle
+import hashlib
 from enum import Enum
-from abc import abstractmethod
 from collections import OrderedDict
 
 
@@ -113,14 +116,165 @@ class Constants(Enum):
     VARIABLENAME = 'VariableName'
 
 
+class MDEFError(Exception):
+    """Represents an MDEF content the scripts can't build the model of"""
+    pass
+
+
 class Parsable:
     """Represents Abstract Parsable class"""
-    @abstractmethod
+
+    # Lets the numerous model classes drop their per-instance __dict__
+    __slots__ = ()
+
+    # MDEF key -> (member, converter) dispatch map driving parse(), see Parsable.fields
+    __fields__ = dict()
+    # Raises on the keys absent from __fields__ instead of skipping them
+    __strict__ = False
+    # Collects the skipped keys as (class name, key) into the given list, None skips them silently
+    UnknownKeys = None
+
+    @staticmethod
+    def fields(inClassName: str, inFields: dict) -> dict:
+        """
+        Builds the __fields__ dispatch map of a Parsable
+        inFields maps a Constants key to the name of the member storing it (without the private __m prefix),
+        optionally paired with a converter of the MDEF value. None marks a known key which is not stored
+        """
+        fields = dict()
+        for key, field in inFields.items():
+            if field is None:
+                fields[key.value] = (None, None)
+            else:
+                member, converter = field if isinstance(field, tuple) else (field, None)
+                fields[key.value] = (f'_{inClassName}__m{member}', converter)
+        return fields
+
+    @staticmethod
+    def keys(*inKeys: Constants) -> frozenset:
+        """Returns the MDEF keys handled by a hand-written parse(), see Parsable.collect"""
+        return frozenset(key.value for key in inKeys)
+
+    @staticmethod
+    def collect(inClassName: str, inData: dict, inKeys: frozenset):
+        """Collects the keys of the MDEF content absent from the handled ones, see UnknownKeys"""
+        if Parsable.UnknownKeys is not None:
+            Parsable.UnknownKeys.extend((inClassName, key) for key in inData if key not in inKeys)
+
+    @staticmethod
+    def intern(inValue):
+        """Converter sharing one instance of the low-cardinality strings repeated across the model"""
+        return sys.intern(inValue) if isinstance(inValue, str) else inValue
+
     def parse(self, inData):
-        pass
+        """Parses MDEF content through the __fields__ dispatch map"""
+        assert isinstance(inData, dict)
+        fields = self.__fields__
+        for key, val in inData.items():
+            field = fields.get(key)
+            if field is None:
+                if self.__strict__:
+                    raise Exception(f'Unhandled key encountered: {key}')
+                # TODO: Remove once all the keys are handled
+                if Parsable.UnknownKeys is not None:
+                    Parsable.UnknownKeys.append((type(self).__name__, key))
+                continue
+            member, converter = field
+            if member is not None:
+                setattr(self, member, val if converter is None else converter(val))
+        return self
+
+
+class Identifiers:
+    """
+    Represents the derivation of the generated C++ symbols from the MDEF names
+    Derived names are memoized, the writers request the same ones many times per run
+    """
+
+    __cleanNames__ = dict()
+    __fullNames__ = dict()
+    __symbols__ = dict()
+
+    @staticmethod
+    def cleanName(inName: str) -> str:
+        """Removes Variable placeholders and separators"""
+        cleanName = Identifiers.__cleanNames__.get(inName)
+        if cleanName is None:
+            cleanName = inName.replace('_', '')
+            startIdx = cleanName.find('{{')
+            if startIdx != -1:
+                endIdx = cleanName.find('}}')
+                cleanName = f'{cleanName[:startIdx]}{cleanName[endIdx + 2:]}'
+            Identifiers.__cleanNames__[inName] = cleanName
+        return cleanName
+
+    @staticmethod
+    def fullName(inPrefix: str, inTableSchemaName: str, inName: str) -> str:
+        """Returns the name of the function & source file of a table"""
+        key = (inPrefix, inTableSchemaName, inName)
+        fullName = Identifiers.__fullNames__.get(key)
+        if fullName is None:
+            fullName = f'{inPrefix}{inTableSchemaName}{Identifiers.cleanName(inName)}'
+            Identifiers.__fullNames__[key] = fullName
+        return fullName
+
+    @staticmethod
+    def symbol(inName: str, inRemoved: str = '_') -> str:
+        """Returns the given name without the inRemoved characters, to suffix the generated variables"""
+        key = (inName, inRemoved)
+        symbol = Identifiers.__symbols__.get(key)
+        if symbol is None:
+            symbol = inName
+            for char in inRemoved:
+                symbol = symbol.replace(char, '')
+            Identifiers.__symbols__[key] = symbol
+        return symbol
+
+    @staticmethod
+    def collisions(inMDEF: 'MDEF') -> list[str]:
+        """
+        Returns the MDEF names deriving the same generated symbol within a C++ scope, e.g. Table_1 & Table1
+        Covers the tables, the AuthBrowseConnectMap & AuthProfile variables, and within every profile the AuthFlow
+        sequence variables & within every sequence the required & expected param variables of Configuration.cpp
+        """
+        scopes = [
+            ('Table', [(table.FullName, f'{table.TableSchemaName}.{table.Name}' if table.TableSchemaName
+                        else table.Name) for table in inMDEF.Tables + inMDEF.SkeletonTables]),
+            ('AuthBrowseConnectMap', [(Identifiers.symbol(authBrowseData.Key), authBrowseData.Key)
+                                      for authBrowseData in inMDEF.AuthBrowseConnectMap]),
+            ('AuthProfile', [(Identifiers.symbol(profile.Name, ' .'), profile.Name)
+                             for profile in inMDEF.AuthProfiles.AllProfiles])
+        ]
+        for profile in inMDEF.AuthProfiles.AllProfiles:
+            # The flows' sequences are declared next to the vector of the profile
+            flowSymbols = [(f'authSeq{Identifiers.symbol(profile.Name, " .")}', profile.Name)]
+            for authFlow in profile.AuthFlows:
+                flowSymbols.append((f'authSeq{authFlow.Name}', authFlow.Name))
+                for seqIdx, authSeq in enumerate(authFlow.AuthSequences, 1):
+                    flowSymbols.append((f'browseSeq{authFlow.Name}{seqIdx}', f'{authFlow.Name} sequence {seqIdx}'))
+                    scope = f'AuthProfile {profile.Name} AuthFlow {authFlow.Name} sequence {seqIdx}'
+                    scopes.append((f'{scope} RequiredParam', [(f'reqParam{Identifiers.symbol(reqParam)}', reqParam)
+                                                              for reqParam in authSeq.RequiredParams]))
+                    scopes.append((f'{scope} ExpectedParam', [(f'expParam{Identifiers.symbol(expParam.Key)}',
+                                                               expParam.Key) for expParam in authSeq.ExpectedParams]))
+            scopes.append((f'AuthProfile {profile.Name} AuthFlow', flowSymbols))
+        collisions = list()
+        for scope, symbols in scopes:
+            sources = dict()
+            for symbol, source in symbols:
+                sources.setdefault(symbol, list()).append(source)
+            for symbol, names in sources.items():
+                # A table repeated as is is reported by the Validator as defined more than once
+                if scope == 'Table':
+                    names = list(dict.fromkeys(names))
+                if len(names) > 1:
+                    collisions.append(f'{scope} {symbol}: {", ".join(names)}')
+        return collisions
 
 
 class AuthBrowseConnectMap(Parsable):
+    __keys__ = Parsable.keys(Constants.KEY, Constants.ENCBROWSECONNECTKEY, Constants.ISSENSITIVEKEY)
+
     def __init__(self):
         self.__mKey = None
         self.__mEncKey = None
@@ -129,6 +283,7 @@ class AuthBrowseConnectMap(Parsable):
     def parse(self, inData):
         """Parses AuthBrowseConnectMap content"""
         assert isinstance(inData, dict)
+        Parsable.collect(AuthBrowseConnectMap.__name__, inData, AuthBrowseConnectMap.__keys__)
         self.__mKey = inData[Constants.KEY.value]
         self.__mEncKey = inData[Constants.ENCBROWSECONNECTKEY.value] \
             if Constants.ENCBROWSECONNECTKEY.value in inData else None
@@ -169,6 +324,8 @@ class Pagination:
 
 
 class ColumnPushdown(Parsable):
+    __keys__ = Parsable.keys(Constants.SUPPORT, Constants.SVCREQPARAMKEY, Constants.SVCREQPARAMDELIMITER)
+
     def __init__(self):
         self.__mParamDelimiter = None
         self.__mParamKey = list()
@@ -177,6 +334,7 @@ class ColumnPushdown(Parsable):
     def parse(self, inData):
         """Parses ColumnPushdown MDEF Content"""
         assert isinstance(inData, dict)
+        Parsable.collect(ColumnPushdown.__name__, inData, ColumnPushdown.__keys__)
         if Constants.SUPPORT.value in inData and inData[Constants.SUPPORT.value]:
             self.__mSupport = inData[Constants.SUPPORT.value]
             self.__mParamKey = inData[Constants.SVCREQPARAMKEY.value]
@@ -197,8 +355,11 @@ class ColumnPushdown(Parsable):
 
 
 class PrimaryKey:
-    def __init__(self, inName: str, inFKCols: list[str], inIdx: int):
+    __slots__ = ('__mRelatedFKColumns', '__mRelatedFKColumnIndices', '__mName', '__mIndex')
+
+    def __init__(self, inName: str, inFKCols: list[str], inIdx: int, inFKColIndices: list[int] = None):
         self.__mRelatedFKColumns = inFKCols
+        self.__mRelatedFKColumnIndices = inFKColIndices
         self.__mName = inName
         self.__mIndex = inIdx
 
@@ -218,8 +379,14 @@ class PrimaryKey:
     def RelatedFKColumns(self) -> list[str]:
         return self.__mRelatedFKColumns
 
+    @property
+    def RelatedFKColumnIndices(self) -> list[int]:
+        """Ordinals of RelatedFKColumns in the owning table, -1 for the columns it does not have"""
+        return self.__mRelatedFKColumnIndices
+
 
 class ForeignKeyColumn:
+    __slots__ = ('__mForeignKey', '__mPrimaryKey')
 
     def __init__(self, inForeignKey: str, inPrimaryKey: str):
         # Represents the column of the table as foreign key
@@ -245,24 +412,18 @@ class ForeignKeyColumn:
 
 
 class ForeignKey(Parsable):
+    __fields__ = Parsable.fields('ForeignKey', {
+        Constants.FOREIGNKEYCOLUMNS: ('ForeignKeyColumns',
+                                      lambda val: [ForeignKeyColumn(fKey, pKey) for fKey, pKey in val.items()]),
+        Constants.REFERENCETABLE: 'ReferenceTable',
+        Constants.REFERENCETABLESCHEMA: 'ReferenceTableSchema'
+    })
+
     def __init__(self):
         self.__mReferenceTableSchema = None
         self.__mReferenceTable = None
         self.__mForeignKeyColumns = list()
 
-    def parse(self, inData):
-        """Parses FKeyColumn MDEF Content"""
-        assert isinstance(inData, dict)
-        for key, val in inData.items():
-            if Constants.FOREIGNKEYCOLUMNS.value == key:
-                for fKey, pKey in val.items():
-                    self.__mForeignKeyColumns.append(ForeignKeyColumn(fKey, pKey))
-            elif Constants.REFERENCETABLE.value == key:
-                self.__mReferenceTable = val
-            elif Constants.REFERENCETABLESCHEMA.value == key:
-                self.__mReferenceTableSchema = val
-        return self
-
     @property
     def ForeignKeyColumns(self) -> list[ForeignKeyColumn]:
         return self.__mForeignKeyColumns
@@ -289,6 +450,17 @@ class ForeignKey(Parsable):
 
 
 class ColumnMetadata(Parsable):
+    __fields__ = Parsable.fields('ColumnMetadata', {
+        Constants.SQLTYPE: ('SQLType', Parsable.intern),
+        Constants.SOURCETYPE: ('SourceType', Parsable.intern),
+        Constants.LENGTH: 'Length',
+        Constants.PRECISION: 'Precision',
+        Constants.SCALE: 'Scale',
+        Constants.ISUNSIGNED: 'IsUnsigned'
+    })
+    __strict__ = True
+    __slots__ = ('__mSourceType', '__mScale', '__mSQLType', '__mPrecision', '__mLength', '__mIsUnsigned')
+
     def __init__(self):
         self.__mSourceType = ''
         self.__mScale = 0
@@ -297,26 +469,6 @@ class ColumnMetadata(Parsable):
         self.__mLength = 0
         self.__mIsUnsigned = False
 
-    def parse(self, inData):
-        """Parses Column's Metadata content"""
-        assert isinstance(inData, dict)
-        for key, val in inData.items():
-            if Constants.SQLTYPE.value == key:
-                self.__mSQLType = val
-            elif Constants.SOURCETYPE.value == key:
-                self.__mSourceType = val
-            elif Constants.LENGTH.value == key:
-                self.__mLength = val
-            elif Constants.PRECISION.value == key:
-                self.__mPrecision = val
-            elif Constants.SCALE.value == key:
-                self.__mScale = val
-            elif Constants.ISUNSIGNED.value == key:
-                self.__mIsUnsigned = val
-            else:
-                raise Exception(f'Unhandled key encountered: {key}')
-        return self
-
     @property
     def IsUnsigned(self) -> bool:
         return self.__mIsUnsigned
@@ -367,6 +519,24 @@ class ColumnMetadata(Parsable):
 
 
 class Column(Parsable):
+    __fields__ = Parsable.fields('Column', {
+        Constants.NAME: 'Name',
+        Constants.METADATA: ('Metadata', lambda val: ColumnMetadata().parse(val)),
+        Constants.NULLABLE: 'Nullable',
+        Constants.UPDATABLE: 'Updatable',
+        Constants.PASSDOWNABLE: 'Passdownable',
+        Constants.SVCRESPATTR_LISTRESULT: 'ListResult',
+        Constants.SVCRESPATTR_ITEMRESULT: 'ItemResult',
+        Constants.SVCREQPARAM_QUERYMAPPING: 'QueryMapping',
+        Constants.SVCRESPATTR_RETURNIDPATH: 'ReturnIdPath',
+        Constants.COLUMNPUSHDOWN_MAPPING: 'PushdownMapping',
+        # Virtual table not supported yet
+        Constants.SYNTHETICINDEXCOLUMN: None
+    })
+    __slots__ = ('__mName', '__mReturnIdPath', '__mPushdownMapping', '__mQueryMapping', '__mItemResult',
+                 '__mListResult', '__mMetadata', '__mPassdownable', '__mUpdatable', '__mNullable',
+                 '__mSyntheticIndexColumn')
+
     def __init__(self):
         self.__mName = ''
         self.__mReturnIdPath = ''
@@ -380,36 +550,6 @@ class Column(Parsable):
         self.__mNullable = False
         self.__mSyntheticIndexColumn = False
 
-    def parse(self, inData):
-        """Parses Column MDEF Content"""
-        assert isinstance(inData, dict)
-        for key, val in inData.items():
-            if Constants.NAME.value == key:
-                self.__mName = val
-            elif Constants.METADATA.value == key:
-                self.__mMetadata = ColumnMetadata().parse(inData[Constants.METADATA.value])
-            elif Constants.NULLABLE.value == key:
-                self.__mNullable = val
-            elif Constants.UPDATABLE.value == key:
-                self.__mUpdatable = val
-            elif Constants.PASSDOWNABLE.value == key:
-                self.__mPassdownable = val
-            elif Constants.SVCRESPATTR_LISTRESULT.value == key:
-                self.__mListResult = val
-            elif Constants.SVCRESPATTR_ITEMRESULT.value == key:
-                self.__mItemResult = val
-            elif Constants.SVCREQPARAM_QUERYMAPPING.value == key:
-                self.__mQueryMapping = val
-            elif Constants.SVCRESPATTR_RETURNIDPATH.value == key:
-                self.__mReturnIdPath = val
-            elif Constants.COLUMNPUSHDOWN_MAPPING.value == key:
-                self.__mPushdownMapping = val
-            elif Constants.SYNTHETICINDEXCOLUMN.value == key:
-                # self.__mSyntheticIndexColumn = val
-                # Virtual table not supported yet
-                pass
-        return self
-
     @property
     def Name(self):
         return self.__mName
@@ -500,6 +640,15 @@ class Column(Parsable):
 
 
 class ReqParamKey(Parsable):
+    __fields__ = Parsable.fields('ReqParamKey', {
+        Constants.KEYNAME: 'KeyName',
+        Constants.SVCRESPATTRFIELD: 'RespAttrField',
+        Constants.ISREFERENCED: 'IsReferenced',
+        Constants.ISPARAMETER: 'IsParameter',
+        Constants.MAXVALUESPERCALL: 'MaxValuesPerCall'
+    })
+    __slots__ = ('__mRespAttrField', '__mKeyName', '__mMaxValuesPerCall', '__mIsReferenced', '__mIsParameter')
+
     def __init__(self):
         self.__mRespAttrField = None
         self.__mKeyName = None
@@ -507,26 +656,6 @@ class ReqParamKey(Parsable):
         self.__mIsReferenced = False
         self.__mIsParameter = False
 
-    def parse(self, inData):
-        """Parses SvcReqParamKeys MDEF Content"""
-        assert isinstance(inData, dict)
-        for key, val in inData.items():
-            if Constants.KEYNAME.value == key:
-                self.__mKeyName = val
-            elif Constants.SVCRESPATTRFIELD.value == key:
-                self.__mRespAttrField = val
-            elif Constants.ISREFERENCED.value == key:
-                self.__mIsReferenced = val
-            elif Constants.ISPARAMETER.value == key:
-                self.__mIsParameter = val
-            elif Constants.MAXVALUESPERCALL.value == key:
-                self.__mMaxValuesPerCall = val
-            else:
-                # TODO: Remove pass once all the keys are handled
-                pass
-                # raise Exception(f'Unhandled key encountered: {key}')
-        return self
-
     @property
     def IsParameter(self) -> bool:
         return self.__mIsParameter
@@ -569,6 +698,16 @@ class ReqParamKey(Parsable):
 
 
 class PreReqCall(Parsable):
+    __fields__ = Parsable.fields('PreReqCall', {
+        Constants.ENDPOINT: 'Endpoint',
+        Constants.ROOT: 'ListRoot',
+        Constants.PAGEABLE: 'Pageable',
+        Constants.PARAMETERFORMAT: 'ParameterFormat',
+        Constants.PREREQCALL: ('ChildPreReqCall', lambda val: PreReqCall().parse(val)),
+        Constants.SVCREQPARAMKEYS: ('ReqParamKeys', lambda val: [ReqParamKey().parse(item) for item in val]),
+        Constants.PAGINATION: ('Pagination', lambda val: Pagination(val[Constants.PAGINATIONTYPE.value]))
+    })
+
     def __init__(self):
         self.__mPageable = False
         self.__mPagination = None
@@ -578,31 +717,6 @@ class PreReqCall(Parsable):
         self.__mParameterFormat = None
         self.__mEndpoint = None
 
-    def parse(self, inData):
-        """Parses PreReqCall MDEF Content"""
-        assert isinstance(inData, dict)
-        for key, val in inData.items():
-            if Constants.ENDPOINT.value == key:
-                self.__mEndpoint = val
-            elif Constants.ROOT.value == key:
-                self.__mListRoot = val
-            elif Constants.PAGEABLE.value == key:
-                self.__mPageable = val
-            elif Constants.PARAMETERFORMAT.value == key:
-                self.__mParameterFormat = val
-            elif Constants.PREREQCALL.value == key:
-                self.__mChildPreReqCall = PreReqCall().parse(val)
-            elif Constants.SVCREQPARAMKEYS.value == key:
-                for item in val:
-                    self.__mReqParamKeys.append(ReqParamKey().parse(item))
-            elif Constants.PAGINATION.value == key:
-                self.__mPagination = Pagination(val[Constants.PAGINATIONTYPE.value])
-            else:
-                # TODO: Remove pass once all the keys are handled
-                pass
-                # raise Exception(f'Unhandled key encountered: {key}')
-        return self
-
     @property
     def Endpoint(self):
         return self.__mEndpoint
@@ -657,6 +771,14 @@ class PreReqCall(Parsable):
 
 
 class Endpoint(Parsable):
+    __fields__ = Parsable.fields('Endpoint', {
+        Constants.LISTENDPOINT: 'ListEndpoint',
+        Constants.ITEMENDPOINT: 'ItemEndpoint',
+        Constants.ITEMENDPOINTHASARRAYRESPONSE: 'ItemEndpointArrayResponse',
+        Constants.TYPE: 'Type',
+        Constants.PREREQCALL: ('PreReqCall', lambda val: PreReqCall().parse(val))
+    })
+
     def __init__(self):
         self.__mItemEndpointArrayResponse = False
         self.__mPreReqCall = None
@@ -664,26 +786,6 @@ class Endpoint(Parsable):
         self.__mItemEndpoint = None
         self.__mListEndpoint = None
 
-    def parse(self, inData):
-        """Parses Endpoint MDEF Content"""
-        assert isinstance(inData, dict)
-        for key, val in inData.items():
-            if Constants.LISTENDPOINT.value == key:
-                self.__mListEndpoint = val
-            elif Constants.ITEMENDPOINT.value == key:
-                self.__mItemEndpoint = val
-            elif Constants.ITEMENDPOINTHASARRAYRESPONSE.value == key:
-                self.__mItemEndpointArrayResponse = val
-            elif Constants.TYPE.value == key:
-                self.__mType = val
-            elif Constants.PREREQCALL.value == key:
-                self.__mPreReqCall = PreReqCall().parse(val)
-            else:
-                # TODO: Remove pass once all the keys are handled
-                pass
-                # raise Exception(f'Unhandled key encountered: {key}')
-        return self
-
     @property
     def ListEndpoint(self) -> str:
         return self.__mListEndpoint
@@ -734,6 +836,19 @@ class ReadAPI(Parsable):
         'QUERY': 'PARAM_FORMAT_QUERY'
     }
 
+    __fields__ = Parsable.fields('ReadAPI', {
+        Constants.METHOD: 'Method',
+        Constants.COLUMNREQUIREMENTS: 'ColumnReq',
+        Constants.BODYSKELETON: 'BodySkeleton',
+        Constants.DATAPATH: 'DataPath',
+        Constants.ENDPOINT: ('Endpoint', lambda val: Endpoint().parse(val)),
+        Constants.ACCEPT: 'Accept',
+        Constants.CONTENTTYPE: 'ContentType',
+        Constants.PARAMETERFORMAT: ('ParameterFormat', lambda val: ReadAPI.__paramformat__[val.upper()]),
+        Constants.LISTROOT: 'ListRoot',
+        Constants.ITEMROOT: 'ItemRoot'
+    })
+
     def __init__(self):
         self.__mItemRoot = None
         self.__mListRoot = None
@@ -746,36 +861,6 @@ class ReadAPI(Parsable):
         self.__mColumnReq = list()
         self.__mEndpoint = None
 
-    def parse(self, inData):
-        """Parses ReadAPI MDEF Content"""
-        assert isinstance(inData, dict)
-        for key, val in inData.items():
-            if Constants.METHOD.value == key:
-                self.__mMethod = val
-            elif Constants.COLUMNREQUIREMENTS.value == key:
-                self.__mColumnReq = val
-            elif Constants.BODYSKELETON.value == key:
-                self.__mBodySkeleton = val
-            elif Constants.DATAPATH.value == key:
-                self.__mDataPath = val
-            elif Constants.ENDPOINT.value == key:
-                self.__mEndpoint = Endpoint().parse(val)
-            elif Constants.ACCEPT.value == key:
-                self.__mAccept = val
-            elif Constants.CONTENTTYPE.value == key:
-                self.__mContentType = val
-            elif Constants.PARAMETERFORMAT.value == key:
-                self.__mParameterFormat = ReadAPI.__paramformat__[val.upper()]
-            elif Constants.LISTROOT.value == key:
-                self.__mListRoot = val
-            elif Constants.ITEMROOT.value == key:
-                self.__mItemRoot = val
-            else:
-                # TODO: Remove pass once all keys handled
-                pass
-                # raise Exception(f'Unhandled key encountered: {key}')
-        return self
-
     @property
     def Method(self):
         return self.__mMethod
@@ -858,6 +943,7 @@ class ReadAPI(Parsable):
 
 
 class Variable:
+    __slots__ = ('__mVariableName', '__mMappedName')
 
     def __init__(self, inName: str, inMappedName: str):
         self.__mVariableName = inName
@@ -881,6 +967,15 @@ class Variable:
 
 
 class ListVariable(Parsable):
+    __fields__ = Parsable.fields('ListVariable', {
+        Constants.ENDPOINT: 'Endpoint',
+        Constants.SVCRESPATTR_DEFAULTVALUE: 'DefaultValue',
+        Constants.ACCEPTTYPE: 'AcceptType',
+        Constants.VARIABLES: ('Variables', lambda val: [
+            Variable(item[Constants.VARIABLENAME.value], item[Constants.SVCRESPATTR_MAPPING.value]) for item in val
+        ]),
+        Constants.VARIABLEROOT: 'VariableRoot'
+    })
 
     def __init__(self):
         self.__mVariableRoot = None
@@ -889,30 +984,6 @@ class ListVariable(Parsable):
         self.__mDefaultValue = None
         self.__mEndpoint = None
 
-    def parse(self, inData):
-        """Parses ListVariablesPrecalls MDEF Content"""
-        assert isinstance(inData, dict)
-        for key, val in inData.items():
-            if key == Constants.ENDPOINT.value:
-                self.__mEndpoint = val
-            elif key == Constants.SVCRESPATTR_DEFAULTVALUE.value:
-                self.__mDefaultValue = val
-            elif key == Constants.ACCEPTTYPE.value:
-                self.__mAcceptType = val
-            elif key == Constants.VARIABLES.value:
-                for item in val:
-                    self.__mVariables.append(
-                        Variable(item[Constants.VARIABLENAME.value],
-                                 item[Constants.SVCRESPATTR_MAPPING.value])
-                    )
-            elif key == Constants.VARIABLEROOT.value:
-                self.__mVariableRoot = val
-            else:
-                # TODO: Remove pass once VTables implemented
-                pass
-                # raise Exception(f'Unhandled Key encountered: {key}')
-        return self
-
     @property
     def Endpoint(self):
         return self.__mEndpoint
@@ -955,6 +1026,7 @@ class ListVariable(Parsable):
 
 
 class SkeletonColumn:
+    __slots__ = ('__mColDef', '__mListVar')
 
     def __init__(self, inColumnDef: Column, inListVariable: ListVariable):
         self.__mColDef = inColumnDef
@@ -978,6 +1050,27 @@ class SkeletonColumn:
 
 
 class Table(Parsable):
+    __fields__ = Parsable.fields('Table', {
+        Constants.TABLENAME: 'Name',
+        Constants.TABLESCHEMANAME: 'TableSchemaName',
+        Constants.ITEMENDPOINTCOLUMNNAMES: 'ItemEndpointColumnNames',
+        Constants.SORTABLE: 'Sortable',
+        Constants.PAGEABLE: 'Pageable',
+        Constants.PAGINATION: ('Pagination', lambda val: Pagination(val[Constants.PAGINATIONTYPE.value])),
+        Constants.COLUMNPUSHDOWN: ('ColumnPushdown', lambda val: ColumnPushdown().parse(val)),
+        Constants.COLUMNS: ('Columns', lambda val: [Column().parse(colData) for colData in val]),
+        # TODO: Support DML operations
+        Constants.APIACCESS: ('ReadAPI', lambda val: ReadAPI().parse(val[Constants.READAPI.value])
+                              if Constants.READAPI.value in val else None),
+        Constants.SKELETONCOLUMN: ('SkeletonColumns', lambda val: [SkeletonColumn(
+            Column().parse(skeletonCol[Constants.COLUMNDEFINITION.value]),
+            ListVariable().parse(skeletonCol[Constants.LISTVARIABLEACCESS.value])
+        ) for skeletonCol in val]),
+        Constants.FKEYCOLUMN: ('ForeignKeys', lambda val: [ForeignKey().parse(item) for item in val]),
+        # Resolved once the columns are known
+        Constants.PKEYCOLUMN: None
+    })
+
     def __init__(self):
         self.__mSkeletonColumns = list()
         self.__mReadAPI = None
@@ -991,68 +1084,35 @@ class Table(Parsable):
         self.__mSortable = None
         self.__mName = None
         self.__mPagination = None
+        self.__mColumnIndex = dict()
+        self.__mUnknownKeys = list()
 
     def parse(self, inData):
         """Parses Tables MDEF Content"""
-        assert isinstance(inData, dict)
-        for key, val in inData.items():
-            if Constants.TABLENAME.value == key:
-                self.__mName = val
-            elif Constants.TABLESCHEMANAME.value == key:
-                self.__mTableSchemaName = val
-            elif Constants.ITEMENDPOINTCOLUMNNAMES.value == key:
-                self.__mItemEndpointColumnNames = val
-            elif Constants.SORTABLE.value == key:
-                self.__mSortable = val
-            elif Constants.PAGEABLE.value == key:
-                self.__mPageable = val
-            elif Constants.PAGINATION.value == key:
-                self.__mPagination = Pagination(val[Constants.PAGINATIONTYPE.value])
-            elif Constants.COLUMNPUSHDOWN.value == key:
-                self.__mColumnPushdown = ColumnPushdown().parse(val)
-            elif Constants.COLUMNS.value == key:
-                for colData in val:
-                    self.__mColumns.append(Column().parse(colData))
-            elif Constants.APIACCESS.value == key:
-                # TODO: Support DML operations
-                for apiName, apiData in val.items():
-                    if Constants.READAPI.value == apiName:
-                        self.__mReadAPI = ReadAPI().parse(apiData)
-                pass
-            elif Constants.SKELETONCOLUMN.value == key:
-                for skeletonCol in val:
-                    self.__mSkeletonColumns.append(SkeletonColumn(
-                        Column().parse(skeletonCol[Constants.COLUMNDEFINITION.value]),
-                        ListVariable().parse(skeletonCol[Constants.LISTVARIABLEACCESS.value])
-                    ))
-            elif Constants.FKEYCOLUMN.value == key:
-                for item in val:
-                    self.__mForeignKeys.append(ForeignKey().parse(item))
-            else:
-                # TODO: Remove pass once VTables implemented
-                pass
-                # raise Exception(f'Unhandled Key encountered: {key}')
+        Parsable.parse(self, inData)
+        # Column ordinals by name, skeleton columns follow the static ones
+        for idx, col in enumerate(self.__mColumns):
+            self.__mColumnIndex.setdefault(col.Name, idx)
+        for idx, skeletonCol in enumerate(self.__mSkeletonColumns, len(self.__mColumns)):
+            self.__mColumnIndex.setdefault(skeletonCol.ColumnDefinition.Name, idx)
         if Constants.PKEYCOLUMN.value in inData:
             for pKeyDataOut in inData[Constants.PKEYCOLUMN.value].values():
                 for pKeyData in pKeyDataOut:
                     pKey = pKeyData[Constants.PKCOLUMNNAME.value]
-                    colIdx = -1
-                    # To find out PrimaryKey column index
-                    for idx, col in enumerate(self.__mColumns):
-                        if col.Name == pKey:
-                            colIdx = idx
-                            break
-                    if colIdx == -1:
-                        # TODO: Column Index connot be found in SkeletonColumns.
-                        #       Remove pass once fixed
-                        # raise Exception(f'Error: {pKey} not found in columns of {self.Name} table')
-                        pass
+                    # Unresolved columns keep index -1
+                    colIdx = self.getColumnIndex(pKey)
+                    relatedFKCols = pKeyData[Constants.RELATEDFKCOLUMNS.value] \
+                        if Constants.RELATEDFKCOLUMNS.value in pKeyData else None
                     self.__mPrimaryKeys.append(PrimaryKey(
-                        pKey, pKeyData[Constants.RELATEDFKCOLUMNS.value]
-                        if Constants.RELATEDFKCOLUMNS.value in pKeyData else None, colIdx)
+                        pKey, relatedFKCols, colIdx,
+                        [self.getColumnIndex(col) for col in relatedFKCols] if relatedFKCols is not None else None)
                     )
         return self
 
+    def getColumnIndex(self, inName: str) -> int:
+        """Returns the ordinal of the given static or skeleton column, -1 if the table has no such column"""
+        return self.__mColumnIndex.get(inName, -1)
+
     @property
     def IsSkeletonTable(self) -> bool:
         return False
@@ -1129,6 +1189,19 @@ class Table(Parsable):
     def ForeignKeys(self, inForeignKey: list[ForeignKey]):
         self.__mForeignKeys = inForeignKey
 
+    @property
+    def UnknownKeys(self) -> list[tuple[str, str]]:
+        """(class name, key) of the keys skipped while parsing the table"""
+        return self.__mUnknownKeys
+
+    @UnknownKeys.setter
+    def UnknownKeys(self, inUnknownKeys: list[tuple[str, str]]):
+        self.__mUnknownKeys = inUnknownKeys
+
+    @property
+    def ColumnIndex(self) -> dict[str, int]:
+        return self.__mColumnIndex
+
     @property
     def Columns(self) -> list[Column]:
         return self.__mColumns
@@ -1151,10 +1224,25 @@ class Table(Parsable):
 
     @property
     def FullName(self):
-        return f'{self.__mTableSchemaName}{MDEF.cleanName(self.__mName)}'
+        return Table.fullName(self.__mTableSchemaName, self.__mName)
+
+    @staticmethod
+    def fullName(inTableSchemaName: str, inName: str) -> str:
+        return Identifiers.fullName('', inTableSchemaName, inName)
+
+    @property
+    def Label(self) -> str:
+        return Table.label(self.IsSkeletonTable, self.__mTableSchemaName, self.__mName)
+
+    @staticmethod
+    def label(inIsSkeletonTable: bool, inTableSchemaName: str, inName: str) -> str:
+        """Returns the name of a table as written in the MDEF, for the messages"""
+        kind = 'SkeletonTable' if inIsSkeletonTable else 'Table'
+        return f'{kind} {inTableSchemaName}.{inName}' if inTableSchemaName else f'{kind} {inName}'
 
 
 class SkeletonTable(Table):
+    __keys__ = Parsable.keys(Constants.TABLEDEFINITION, Constants.LISTVARIABLESPRECALLS)
 
     def __init__(self):
         super().__init__()
@@ -1164,6 +1252,7 @@ class SkeletonTable(Table):
     def parse(self, inData):
         """Parses Skeleton Tables MDEF Content"""
         assert isinstance(inData, dict)
+        Parsable.collect(SkeletonTable.__name__, inData, SkeletonTable.__keys__)
         Table.parse(self, inData[Constants.TABLEDEFINITION.value])
         for item in inData[Constants.LISTVARIABLESPRECALLS.value]:
             self.__mListVariablePreCalls.append(ListVariable().parse(item))
@@ -1175,7 +1264,11 @@ class SkeletonTable(Table):
 
     @property
     def FullName(self):
-        return f'SkeletonTable{super().FullName}'
+        return SkeletonTable.fullName(self.TableSchemaName, self.Name)
+
+    @staticmethod
+    def fullName(inTableSchemaName: str, inName: str) -> str:
+        return Identifiers.fullName('SkeletonTable', inTableSchemaName, inName)
 
     @property
     def ItemEndpointColumnName(self):
@@ -1242,6 +1335,9 @@ class AuthSequence:
 
 
 class AuthFlow(Parsable):
+    __keys__ = Parsable.keys(Constants.NAME, Constants.SEQUENCE)
+    __sequencekeys__ = Parsable.keys(Constants.REQUIREDPARAMS, Constants.EXPECTEDPARAMS, Constants.HEADERS)
+
     def __init__(self):
         self.__mName = None
         self.__mAuthSequences = None
@@ -1249,11 +1345,13 @@ class AuthFlow(Parsable):
     def parse(self, inData):
         """Parses AuthFlow MDEF Content"""
         assert isinstance(inData, dict)
+        Parsable.collect(AuthFlow.__name__, inData, AuthFlow.__keys__)
         flowName, sequences = None, list()
         if Constants.NAME.value in inData:
             flowName = inData[Constants.NAME.value]
         if Constants.SEQUENCE.value in inData:
             for seq in inData[Constants.SEQUENCE.value]:
+                Parsable.collect(AuthSequence.__name__, seq, AuthFlow.__sequencekeys__)
                 reqParams = list()
                 expParams = list()
                 headers = list()
@@ -1295,6 +1393,17 @@ class AuthProfile:
 
 
 class AuthProfiles(Parsable):
+    __fields__ = Parsable.fields('AuthProfiles', {
+        Constants.TOKENTYPE: 'TokenType',
+        Constants.AUTH_WINDOWHEIGHT: 'AuthWindowHeight',
+        Constants.AUTH_WINDOWWIDTH: 'AuthWindowWidth',
+        Constants.ISAUTOREFRESHSUPPORTED: 'IsAutoRefreshSupported',
+        Constants.ISEXPIRATIONDATAAVAILABLE: 'IsExpirationDataAvailable',
+        Constants.REFRESHTOKENWITHINRANGE: 'RefreshTokenWithinRange',
+        Constants.VERIFYHOST: 'VerifyHost',
+        Constants.VERIFYPEER: 'VerifyPeer'
+    })
+
     def __init__(self):
         self.__mVerifyPeer = None
         self.__mVerifyHost = None
@@ -1317,27 +1426,13 @@ class AuthProfiles(Parsable):
                 for authFlow in value:
                     authFlows.append(AuthFlow().parse(authFlow))
                 self.__mAuthProfiles.append(AuthProfile(name, authFlows))
+            elif name in self.__fields__:
+                setattr(self, self.__fields__[name][0], value)
             else:
-                if name == Constants.TOKENTYPE.value:
-                    self.__mTokenType = value
-                elif name == Constants.AUTH_WINDOWHEIGHT.value:
-                    self.__mAuthWindowHeight = value
-                elif name == Constants.AUTH_WINDOWWIDTH.value:
-                    self.__mAuthWindowWidth = value
-                elif name == Constants.ISAUTOREFRESHSUPPORTED.value:
-                    self.__mIsAutoRefreshSupported = value
-                elif name == Constants.ISEXPIRATIONDATAAVAILABLE.value:
-                    self.__mIsExpirationDataAvailable = value
-                elif name == Constants.REFRESHTOKENWITHINRANGE.value:
-                    self.__mRefreshTokenWithinRange = value
-                elif name == Constants.VERIFYHOST.value:
-                    self.__mVerifyHost = value
-                elif name == Constants.VERIFYPEER.value:
-                    self.__mVerifyPeer = value
-                else:
-                    # TODO: Remove pass once all params can be well handled by script
-                    # raise Exception(f'Unhandled Key encountered: {name}')
-                    pass
+                # TODO: Remove once all params can be well handled by script
+                # raise Exception(f'Unhandled Key encountered: {name}')
+                if Parsable.UnknownKeys is not None:
+                    Parsable.UnknownKeys.append((type(self).__name__, name))
         return self
 
     @property
@@ -1409,13 +1504,113 @@ class AuthProfiles(Parsable):
         return self.__mAuthProfiles
 
 
+class LazyTable:
+    """
+    Represents a table parsed on demand
+    Name, TableSchemaName & FullName are served from the table data, the first access to anything else
+    parses the whole table. Parsed tables are kept, except the streamed ones of which only the most recently
+    loaded one is, to keep the memory bounded. Consumers walking the tables read each one in a row
+    """
+
+    # (LazyTable, Table) of the most recently loaded streamed table
+    __streamed__ = (None, None)
+
+    def __init__(self, inTableData: dict, inTableType: type, inGlobalPagination: Pagination,
+                 inSource=None, inOffset: int = -1):
+        definition = inTableData[Constants.TABLEDEFINITION.value] if inTableType is SkeletonTable else inTableData
+        self.__mName = definition.get(Constants.TABLENAME.value)
+        self.__mTableSchemaName = definition.get(Constants.TABLESCHEMANAME.value)
+        self.__mTableType = inTableType
+        self.__mGlobalPagination = inGlobalPagination
+        self.__mSource = inSource
+        self.__mOffset = inOffset
+        self.__mTableData = inTableData if inSource is None else None
+        self.__mTable = None
+
+    def __getattr__(self, inName: str):
+        # Private & special attributes are never delegated, e.g. while unpickling
+        if inName.startswith('_'):
+            raise AttributeError(inName)
+        return getattr(self.load(), inName)
+
+    def load(self) -> Table:
+        """Returns the parsed table"""
+        if self.__mTable is not None:
+            return self.__mTable
+        lazyTable, table = LazyTable.__streamed__
+        if lazyTable is self:
+            return table
+        try:
+            tableData = self.__mTableData if self.__mSource is None else self.__mSource.element(self.__mOffset)
+            # Kept on the model, so cached models report them as well
+            Parsable.UnknownKeys = list()
+            try:
+                table = self.__mTableType().parse(tableData)
+                table.UnknownKeys = Parsable.UnknownKeys
+            finally:
+                Parsable.UnknownKeys = None
+            if table.Pageable and table.PaginationType is None:
+                if self.__mGlobalPagination is None:
+                    raise KeyError(Constants.PAGINATION.value)
+                table.PaginationType = self.__mGlobalPagination
+        except KeyError as error:
+            raise MDEFError(f'{self.Label}: {error} key not found in MDEF') from error
+        except Exception as error:
+            raise MDEFError(f'{self.Label}: Error: {error}') from error
+        if self.__mSource is None:
+            self.__mTable = table
+            self.__mTableData = None
+        else:
+            LazyTable.__streamed__ = (self, table)
+        return table
+
+    @property
+    def IsLoaded(self) -> bool:
+        return self.__mTable is not None
+
+    @property
+    def IsSkeletonTable(self) -> bool:
+        return self.__mTableType is SkeletonTable
+
+    @property
+    def Name(self) -> str:
+        return self.__mName
+
+    @property
+    def TableSchemaName(self) -> str:
+        return self.__mTableSchemaName
+
+    @property
+    def FullName(self):
+        return self.__mTableType.fullName(self.__mTableSchemaName, self.__mName)
+
+    @property
+    def Label(self) -> str:
+        return Table.label(self.__mTableType is SkeletonTable, self.__mTableSchemaName, self.__mName)
+
+
 class MDEF:
     """Represents MDEF class"""
 
-    def __init__(self, inMDEFContent: dict):
+    # Top level keys of the MDEF
+    __keys__ = frozenset(key.value for key in [
+        Constants.DATASOURCE, Constants.BASEURL, Constants.TESTURLENDPOINT, Constants.TIMESTAMPFORMAT,
+        Constants.ISUNIXTIMESTAMPFORMAT, Constants.TIMESTAMPUNIT, Constants.ISLAZYINITIALIZATION,
+        Constants.DOESSERVERSUPPORTTHROTTLING, Constants.AUTHBROWSECONNECTMAP, Constants.AUTHPROFILES,
+        Constants.PAGINATION, Constants.TABLES, Constants.SKELETONTABLE
+    ])
+
+    def __init__(self, inMDEFContent: dict, inStreaming: bool = False):
+        """
+        In streaming mode the Tables & SkeletonTable sections of inMDEFContent are expected to be
+        Util.JSONArray sources, the tables are then re-read from disk whenever they are loaded
+        """
         self.__mContent = inMDEFContent
+        self.__mStreaming = inStreaming
         self.__mCache = OrderedDict()
         self.__parse()
+        # Raw content is not needed anymore once the model is built
+        self.__mContent = None
 
     def __parse(self):
         try:
@@ -1428,42 +1623,59 @@ class MDEF:
             self.__mIsLazyInitialization = self.__mContent[Constants.ISLAZYINITIALIZATION.value]
             self.__mDoesServerSupportThrottling = self.__mContent[Constants.DOESSERVERSUPPORTTHROTTLING.value]
 
-            # Parses Auth Browse Connect Map
-            self.__mAuthBrowseConnectMap = list()
-            for item in self.__mContent[Constants.AUTHBROWSECONNECTMAP.value]:
-                self.__mAuthBrowseConnectMap.append(AuthBrowseConnectMap().parse(item))
+            self.__mUnknownKeys = [(MDEF.__name__, key) for key in self.__mContent if key not in MDEF.__keys__]
+            Parsable.UnknownKeys = self.__mUnknownKeys
+            try:
+                # Parses Auth Browse Connect Map
+                self.__mAuthBrowseConnectMap = list()
+                for item in self.__mContent[Constants.AUTHBROWSECONNECTMAP.value]:
+                    self.__mAuthBrowseConnectMap.append(AuthBrowseConnectMap().parse(item))
 
-            # Parses Auth profiles
-            self.__mAuthProfiles = AuthProfiles().parse(self.__mContent[Constants.AUTHPROFILES.value])
+                # Parses Auth profiles
+                self.__mAuthProfiles = AuthProfiles().parse(self.__mContent[Constants.AUTHPROFILES.value])
+            finally:
+                Parsable.UnknownKeys = None
 
             # Parses Global pagination
+            self.__mGlobalPagination = None
             if Constants.PAGINATION.value in self.__mContent:
                 self.__mGlobalPagination = Pagination(
                     self.__mContent[Constants.PAGINATION.value][Constants.PAGINATIONTYPE.value]
                 )
 
-            # Parse tables
-            self.__mTables = list()
-            for tableData in self.__mContent[Constants.TABLES.value]:
-                table = Table().parse(tableData)
-                if table.Pageable and table.PaginationType is None:
-                    table.PaginationType = self.__mGlobalPagination
-                self.__mTables.append(table)
+            # Parse tables, lazily
+            self.__mTables = self.__lazyTables(self.__mContent[Constants.TABLES.value], Table)
 
-            # Parse SkeletonTables
+            # Parse SkeletonTables, lazily
             self.__mSkeletonTables = list()
             if Constants.SKELETONTABLE.value in self.__mContent:
-                for tableData in self.__mContent[Constants.SKELETONTABLE.value]:
-                    table = SkeletonTable().parse(tableData)
-                    if table.Pageable and table.PaginationType is None:
-                        table.PaginationType = self.__mGlobalPagination
-                    self.__mSkeletonTables.append(table)
+                self.__mSkeletonTables = self.__lazyTables(self.__mContent[Constants.SKELETONTABLE.value],
+                                                           SkeletonTable)
         except KeyError as error:
-            print(f'{error} key not found in MDEF')
-            sys.exit(1)
+            raise MDEFError(f'{error} key not found in MDEF') from error
         except Exception as error:
-            print(f'Error: {error}')
-            sys.exit(1)
+            raise MDEFError(f'Error: {error}') from error
+
+    def __lazyTables(self, inTablesData, inTableType: type) -> list[LazyTable]:
+        if self.__mStreaming:
+            return [LazyTable(tableData, inTableType, self.__mGlobalPagination, inTablesData, offset)
+                    for offset, tableData in inTablesData.items()]
+        return [LazyTable(tableData, inTableType, self.__mGlobalPagination) for tableData in inTablesData]
+
+    def load(self):
+        """Parses every table which is not parsed yet"""
+        for table in self.__mTables + self.__mSkeletonTables:
+            table.load()
+        return self
+
+    @property
+    def UnknownKeys(self) -> list[tuple[str, str]]:
+        """(class name, key) of the top level & auth profiles keys skipped while parsing"""
+        return self.__mUnknownKeys
+
+    @property
+    def IsStreaming(self) -> bool:
+        return self.__mStreaming
 
     @property
     def AuthProfiles(self):
@@ -1520,10 +1732,54 @@ class MDEF:
     @staticmethod
     def cleanName(inName: str):
         """Removes Variable placeholders and separators"""
-        inName = inName.replace('_', '')
-        startIdx = inName.find('{{')
-        if startIdx == -1:
-            return inName
-        else:
-            endIdx = inName.find('}}')
-            return f'{inName[:startIdx]}{inName[endIdx + 2:]}'
+        return Identifiers.cleanName(inName)
+
+
+class MDEFCache:
+    """
+    Represents an on-disk cache of parsed MDEF models
+    Entries are keyed by the MDEF content hash and the generator version, stale entries are rebuilt
+    """
+
+    # Bump whenever the parsed model changes in a way the model code hash cannot tell
+    VERSION = 1
+
+    def __init__(self, inCacheDir: str):
+        self.mCacheDir = inCacheDir
+
+    @staticmethod
+    def key(inMDEFContent: bytes) -> bytes:
+        keyHash = hashlib.sha1(f'{MDEFCache.VERSION}:{pickle.HIGHEST_PROTOCOL}:'.encode('ascii'))
+        # Any change to the model code invalidates the cached models as well
+        with open(__file__, 'rb') as file:
+            keyHash.update(file.read())
+        keyHash.update(inMDEFContent)
+        return keyHash.hexdigest().encode('ascii')
+
+    def __cachePath(self, inMDEFPath: str) -> str:
+        pathHash = hashlib.sha1(os.path.abspath(inMDEFPath).encode('utf-8')).hexdigest()
+        return os.path.join(self.mCacheDir, f'{pathHash}.pickle')
+
+    def load(self, inMDEFPath: str) -> MDEF:
+        """Returns the cached model of given MDEF, parses and caches it on a miss"""
+        with open(inMDEFPath, 'rb') as file:
+            content = file.read()
+        key = MDEFCache.key(content)
+        cachePath = self.__cachePath(inMDEFPath)
+        if os.path.isfile(cachePath):
+            try:
+                with open(cachePath, 'rb') as file:
+                    if file.readline().rstrip(b'\n') == key:
+                        return pickle.load(file)
+            except Exception as error:
+                # A broken entry must never fail the generation, it is simply rebuilt
+                print(f'Ignoring unreadable MDEF cache {cachePath}: {error}')
+        # Cached models are fully parsed, nothing is left to be parsed lazily
+        mdef = MDEF(json.loads(content)).load()
+        os.makedirs(self.mCacheDir, exist_ok=True)
+        tempPath = f'{cachePath}.{os.getpid()}.tmp'
+        with open(tempPath, 'wb') as file:
+            file.write(key + b'\n')
+            pickle.dump(mdef, file, pickle.HIGHEST_PROTOCOL)
+        os.replace(tempPath, cachePath)
+        return mdef
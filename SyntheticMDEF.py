@@ -0,0 +1,220 @@
+"""
+Contains definition of SyntheticMDEF class
+"""
+import json
+import random
+import argparse
+from MDEF import Constants
+
+
+class SyntheticMDEF:
+    """
+    Represents a generator of synthetic driver MDEFs
+    Use to benchmark the scripts against MDEFs of any shape, same knobs & seed give the same MDEF
+    """
+
+    __sqltypes__ = [
+        ('SQL_VARCHAR', 'string', 255, 0, 0),
+        ('SQL_WVARCHAR', 'string', 1024, 0, 0),
+        ('SQL_INTEGER', 'integer', 0, 0, 0),
+        ('SQL_BIGINT', 'long', 0, 0, 0),
+        ('SQL_DOUBLE', 'double', 0, 15, 0),
+        ('SQL_DECIMAL', 'decimal', 0, 38, 6),
+        ('SQL_BIT', 'boolean', 0, 0, 0),
+        ('SQL_TYPE_TIMESTAMP', 'timestamp', 0, 0, 0)
+    ]
+    __authprofiles__ = ['OAuth 2.0', 'Basic Authentication', 'Access Token', 'MWS']
+    __paginationtypes__ = ['INDEX_BASED_PAGINATION', 'TOKEN_BASED_PAGINATION', 'HEADER_BASED_PAGINATION']
+
+    def __init__(self, inTables: int = 100, inColumns: int = 20, inPreReqDepth: int = 1, inSkeletonTables: int = 10,
+                 inListVariables: int = 2, inAuthProfiles: int = 2, inSeed: int = 0):
+        self.mTables = inTables
+        self.mColumns = max(3, inColumns)
+        self.mPreReqDepth = inPreReqDepth
+        self.mSkeletonTables = inSkeletonTables
+        self.mListVariables = inListVariables
+        self.mAuthProfiles = min(inAuthProfiles, len(SyntheticMDEF.__authprofiles__))
+        self.mSeed = inSeed
+        self.__random = random.Random(inSeed)
+
+    def generate(self) -> dict:
+        """Returns the MDEF content"""
+        self.__random.seed(self.mSeed)
+        return {
+            Constants.DATASOURCE.value: 'Synthetic',
+            Constants.BASEURL.value: 'https://api.synthetic.example.com',
+            Constants.TESTURLENDPOINT.value: '/v1/ping',
+            Constants.TIMESTAMPFORMAT.value: '%Y-%m-%dT%H:%M:%S',
+            Constants.ISUNIXTIMESTAMPFORMAT.value: False,
+            Constants.TIMESTAMPUNIT.value: 'SAAS_TIMESTAMP_UNIT_SECONDS',
+            Constants.ISLAZYINITIALIZATION.value: False,
+            Constants.DOESSERVERSUPPORTTHROTTLING.value: True,
+            Constants.AUTHBROWSECONNECTMAP.value: [
+                {Constants.KEY.value: 'client_id', Constants.ISSENSITIVEKEY.value: False},
+                {Constants.KEY.value: 'client_secret', Constants.ENCBROWSECONNECTKEY.value: 'ENC_SECRET',
+                 Constants.ISSENSITIVEKEY.value: True}
+            ],
+            Constants.AUTHPROFILES.value: self.__authProfiles(),
+            Constants.PAGINATION.value: {Constants.PAGINATIONTYPE.value: 'INDEX_BASED_PAGINATION'},
+            Constants.TABLES.value: [self.__table(f'Table_{idx}', idx) for idx in range(self.mTables)],
+            Constants.SKELETONTABLE.value: [self.__skeletonTable(idx) for idx in range(self.mSkeletonTables)]
+        }
+
+    def save(self, inPath: str):
+        with open(inPath, 'w') as file:
+            json.dump(self.generate(), file, indent=2)
+
+    def __authProfiles(self) -> dict:
+        profiles = {'Types': SyntheticMDEF.__authprofiles__[:self.mAuthProfiles]}
+        for name in SyntheticMDEF.__authprofiles__[:self.mAuthProfiles]:
+            flowName = f'Flow{name.replace(" ", "").replace(".", "")}'
+            profiles[name] = [{
+                Constants.NAME.value: flowName,
+                Constants.SEQUENCE.value: [{
+                    Constants.REQUIREDPARAMS.value: [{Constants.KEY.value: 'client_id'},
+                                                     {Constants.KEY.value: 'client_secret'}],
+                    Constants.EXPECTEDPARAMS.value: [{Constants.KEY.value: 'access_token',
+                                                      Constants.PATH.value: '$.access_token'}],
+                    Constants.HEADERS.value: [{Constants.KEY.value: 'Accept',
+                                               Constants.VALUE.value: 'application/json'}]
+                }]
+            }]
+        profiles[Constants.TOKENTYPE.value] = 'Bearer'
+        profiles[Constants.ISEXPIRATIONDATAAVAILABLE.value] = True
+        profiles[Constants.ISAUTOREFRESHSUPPORTED.value] = True
+        profiles[Constants.VERIFYHOST.value] = True
+        profiles[Constants.VERIFYPEER.value] = True
+        profiles[Constants.AUTH_WINDOWHEIGHT.value] = 600
+        profiles[Constants.AUTH_WINDOWWIDTH.value] = 800
+        return profiles
+
+    def __column(self, inName: str) -> dict:
+        sqlType, sourceType, length, precision, scale = self.__random.choice(SyntheticMDEF.__sqltypes__)
+        metadata = {Constants.SQLTYPE.value: sqlType, Constants.SOURCETYPE.value: sourceType}
+        if length > 0:
+            metadata[Constants.LENGTH.value] = length
+        if precision > 0:
+            metadata[Constants.PRECISION.value] = precision
+        if scale > 0:
+            metadata[Constants.SCALE.value] = scale
+        if sqlType in ('SQL_INTEGER', 'SQL_BIGINT') and self.__random.random() < 0.2:
+            metadata[Constants.ISUNSIGNED.value] = True
+        column = {
+            Constants.NAME.value: inName,
+            Constants.METADATA.value: metadata,
+            Constants.NULLABLE.value: self.__random.random() < 0.5,
+            Constants.UPDATABLE.value: self.__random.random() < 0.2,
+            Constants.PASSDOWNABLE.value: self.__random.random() < 0.3,
+            Constants.SVCRESPATTR_LISTRESULT.value: f'$.{inName}',
+            Constants.SVCRESPATTR_ITEMRESULT.value: f'$.{inName}'
+        }
+        if self.__random.random() < 0.2:
+            column[Constants.SVCREQPARAM_QUERYMAPPING.value] = inName
+        if self.__random.random() < 0.1:
+            column[Constants.COLUMNPUSHDOWN_MAPPING.value] = inName
+        return column
+
+    def __preReqCall(self, inDepth: int, inIdx: int) -> dict:
+        preReqCall = {
+            Constants.ENDPOINT.value: f'/v1/prereq{inIdx}/level{inDepth}',
+            Constants.ROOT.value: '$.data',
+            Constants.PAGEABLE.value: False,
+            Constants.SVCREQPARAMKEYS.value: [{
+                Constants.KEYNAME.value: f'key{keyIdx}',
+                Constants.SVCRESPATTRFIELD.value: f'field{keyIdx}',
+                Constants.ISPARAMETER.value: keyIdx == 0,
+                Constants.ISREFERENCED.value: keyIdx == 1,
+                Constants.MAXVALUESPERCALL.value: 50 if keyIdx == 2 else 0
+            } for keyIdx in range(3)]
+        }
+        if inDepth > 1:
+            preReqCall[Constants.PREREQCALL.value] = self.__preReqCall(inDepth - 1, inIdx)
+        return preReqCall
+
+    def __listVariable(self, inIdx: int) -> dict:
+        return {
+            Constants.ENDPOINT.value: f'/v1/variables{inIdx}',
+            Constants.VARIABLES.value: [{Constants.VARIABLENAME.value: f'variable{varIdx}',
+                                         Constants.SVCRESPATTR_MAPPING.value: f'$.variable{varIdx}'}
+                                        for varIdx in range(2)],
+            Constants.ACCEPTTYPE.value: 'application/json',
+            Constants.VARIABLEROOT.value: '$.variables',
+            Constants.SVCRESPATTR_DEFAULTVALUE.value: 'default'
+        }
+
+    def __table(self, inName: str, inIdx: int) -> dict:
+        # Common columns shared by every table, followed by the table specific ones
+        columnNames = ['id', 'created_at', 'updated_at'] + \
+                      [f'{inName.lower()}_col{colIdx}' for colIdx in range(self.mColumns - 3)]
+        pageable = self.__random.random() < 0.6
+        table = {
+            Constants.TABLENAME.value: inName,
+            Constants.TABLESCHEMANAME.value: self.__random.choice(['Sales', 'Support', 'Billing']),
+            Constants.ITEMENDPOINTCOLUMNNAMES.value: ['id'],
+            Constants.SORTABLE.value: self.__random.random() < 0.5,
+            Constants.PAGEABLE.value: pageable,
+            Constants.COLUMNPUSHDOWN.value: {Constants.SUPPORT.value: False},
+            Constants.COLUMNS.value: [self.__column(name) for name in columnNames],
+            Constants.PKEYCOLUMN.value: {'PrimaryKey': [{Constants.PKCOLUMNNAME.value: 'id'}]},
+            Constants.FKEYCOLUMN.value: [],
+            Constants.APIACCESS.value: {
+                Constants.READAPI.value: {
+                    Constants.METHOD.value: 'GET',
+                    Constants.ENDPOINT.value: {
+                        Constants.LISTENDPOINT.value: f'/v1/{inName.lower()}',
+                        Constants.ITEMENDPOINT.value: f'/v1/{inName.lower()}/{{{{id}}}}',
+                        Constants.TYPE.value: 'LIST'
+                    },
+                    Constants.ACCEPT.value: 'application/json',
+                    Constants.PARAMETERFORMAT.value: 'query',
+                    Constants.LISTROOT.value: '$.items',
+                    Constants.ITEMROOT.value: '$'
+                }
+            }
+        }
+        if self.__random.random() < 0.3:
+            table[Constants.COLUMNPUSHDOWN.value] = {
+                Constants.SUPPORT.value: True,
+                Constants.SVCREQPARAMKEY.value: ['fields'],
+                Constants.SVCREQPARAMDELIMITER.value: ','
+            }
+        if pageable and self.__random.random() < 0.5:
+            table[Constants.PAGINATION.value] = {
+                Constants.PAGINATIONTYPE.value: self.__random.choice(SyntheticMDEF.__paginationtypes__)
+            }
+        if inIdx > 0:
+            table[Constants.FKEYCOLUMN.value].append({
+                Constants.FOREIGNKEYCOLUMNS.value: {columnNames[3] if len(columnNames) > 3 else 'id': 'id'},
+                Constants.REFERENCETABLE.value: f'{inName.rsplit("_", 1)[0]}_{inIdx - 1}'
+            })
+        if self.mPreReqDepth > 0:
+            table[Constants.APIACCESS.value][Constants.READAPI.value][Constants.ENDPOINT.value][
+                Constants.PREREQCALL.value] = self.__preReqCall(self.mPreReqDepth, inIdx)
+        return table
+
+    def __skeletonTable(self, inIdx: int) -> dict:
+        tableDef = self.__table(f'Skeleton_{inIdx}', inIdx)
+        tableDef[Constants.SKELETONCOLUMN.value] = [{
+            Constants.COLUMNDEFINITION.value: self.__column(f'skeleton_col{colIdx}'),
+            Constants.LISTVARIABLEACCESS.value: self.__listVariable(colIdx)
+        } for colIdx in range(2)]
+        return {
+            Constants.TABLEDEFINITION.value: tableDef,
+            Constants.LISTVARIABLESPRECALLS.value: [self.__listVariable(idx) for idx in range(self.mListVariables)]
+        }
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Generates a synthetic driver MDEF')
+    parser.add_argument('MDEFPath', help='Path of the MDEF to write')
+    parser.add_argument('--tables', type=int, default=100, help='Number of static tables (default: 100)')
+    parser.add_argument('--columns', type=int, default=20, help='Number of columns per table (default: 20)')
+    parser.add_argument('--prereq-depth', type=int, default=1, help='PreReqCall nesting depth (default: 1)')
+    parser.add_argument('--skeleton-tables', type=int, default=10, help='Number of skeleton tables (default: 10)')
+    parser.add_argument('--list-variables', type=int, default=2,
+                        help='ListVariablesPrecalls per skeleton table (default: 2)')
+    parser.add_argument('--auth-profiles', type=int, default=2, help='Number of auth profiles, up to 4 (default: 2)')
+    parser.add_argument('--seed', type=int, default=0, help='Random seed (default: 0)')
+    args = parser.parse_args()
+    SyntheticMDEF(args.tables, args.columns, args.prereq_depth, args.skeleton_tables, args.list_variables,
+                  args.auth_profiles, args.seed).save(args.MDEFPath)
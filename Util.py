@@ -3,17 +3,18 @@ Contains Utility functions
 """
 import re
 import os
+import json
 import errno
-import shutil
+import codecs
+import time
+import queue
+import hashlib
+import threading
 from enum import Enum
 from datetime import date
-
-
-def clean(inPath: str):
-    """Clears up the existing directories"""
-    if os.path.exists(inPath):
-        shutil.rmtree(inPath)
-    File.createDir(inPath)
+from contextlib import contextmanager, nullcontext
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
 
 
 class Constants(Enum):
@@ -22,20 +23,217 @@ class Constants(Enum):
     TABSPACE = 4
 
 
+class Manifest:
+    """
+    Represents the content-hash manifest of the generated outputs
+    Use to skip rewriting unchanged files and to prune orphaned ones
+    """
+
+    FILENAME = '.fluffy.manifest'
+
+    def __init__(self, inOutputDir: str, inRewrite: bool = False):
+        """inRewrite rewrites every output, even the ones whose content didn't change"""
+        self.mOutputDir = inOutputDir
+        self.mPath = os.path.join(inOutputDir, Manifest.FILENAME)
+        self.mRewrite = inRewrite
+        self.__previous = dict()
+        self.__current = dict()
+        self.__owners = dict()
+        self.__previousOwners = dict()
+        if os.path.isfile(self.mPath):
+            try:
+                with open(self.mPath, 'r') as file:
+                    content = json.load(file)
+                self.__previous = content['Files']
+                self.__previousOwners = content.get('Owners', dict())
+            except (OSError, ValueError, KeyError):
+                # Unreadable manifest, every output is treated as changed
+                self.__previous = dict()
+
+    @staticmethod
+    def hasher():
+        """Returns a new content hash object, the manifest keeps its hex digests"""
+        return hashlib.sha1()
+
+    def key(self, inFilePath: str) -> str:
+        return os.path.relpath(inFilePath, self.mOutputDir).replace(os.sep, '/')
+
+    def isCurrent(self, inFilePath: str, inDigest: str) -> bool:
+        """Checks whether the file on disk already holds the content with given digest"""
+        return not self.mRewrite and self.__previous.get(self.key(inFilePath)) == inDigest and \
+            os.path.isfile(inFilePath)
+
+    def record(self, inFilePath: str, inDigest: str, inOwners: list[str] = None):
+        """Records the digest of a file produced in this run, along with the tables it was rendered from"""
+        self.__current[self.key(inFilePath)] = inDigest
+        if inOwners is not None:
+            self.__owners[self.key(inFilePath)] = inOwners
+
+    def entries(self):
+        """Yields the key, owner tables & changed flag of every file produced in this run"""
+        for key, digest in sorted(self.__current.items()):
+            yield key, self.__owners.get(key, list()), self.__previous.get(key) != digest
+
+    def retain(self, inRemovedPaths: list[str] = ()):
+        """Carries over the previous entries not recorded in this run, except the removed files"""
+        removed = {self.key(filePath) for filePath in inRemovedPaths}
+        for key, digest in self.__previous.items():
+            if key not in removed and key not in self.__current:
+                self.__current[key] = digest
+                if key in self.__previousOwners:
+                    self.__owners[key] = self.__previousOwners[key]
+
+    def prune(self, inDirPaths: list[str]) -> list[str]:
+        """Removes the files from given directories which were not produced in this run"""
+        pruned = list()
+        for dirPath in inDirPaths:
+            if not os.path.isdir(dirPath):
+                continue
+            for entry in os.scandir(dirPath):
+                if entry.is_file() and self.key(entry.path) not in self.__current:
+                    os.remove(entry.path)
+                    pruned.append(entry.path)
+        return pruned
+
+    def save(self):
+        with open(f'{self.mPath}.tmp', 'w') as file:
+            json.dump({'Files': self.__current, 'Owners': self.__owners}, file, indent=1, sort_keys=True)
+        os.replace(f'{self.mPath}.tmp', self.mPath)
+
+
+class BuildFragment:
+    """
+    Represents the CMake include listing the generated outputs
+    Use to configure the downstream build without rescanning the output directories
+    """
+
+    FILENAME = 'FluffySources.cmake'
+
+    @staticmethod
+    def save(inManifest: Manifest) -> str:
+        """Writes the sources, headers, resources & changed sources of the run along with their owner tables"""
+        groups = {'FLUFFY_SOURCES': list(), 'FLUFFY_HEADERS': list(), 'FLUFFY_CHANGED_SOURCES': list(),
+                  'FLUFFY_RESOURCES': list()}
+        properties = list()
+        for key, owners, changed in inManifest.entries():
+            filePath = f'${{CMAKE_CURRENT_LIST_DIR}}/{key}'
+            if key.endswith('.h'):
+                groups['FLUFFY_HEADERS'].append(filePath)
+            elif key.endswith('.cpp'):
+                groups['FLUFFY_SOURCES'].append(filePath)
+            else:
+                groups['FLUFFY_RESOURCES'].append(filePath)
+            if changed and key.endswith('.cpp'):
+                groups['FLUFFY_CHANGED_SOURCES'].append(filePath)
+            fileProperties = f'FLUFFY_CHANGED {"TRUE" if changed else "FALSE"}'
+            if len(owners) > 0:
+                fileProperties += f' FLUFFY_TABLES "{";".join(owners)}"'
+            properties.append(f'set_source_files_properties("{filePath}" PROPERTIES {fileProperties})\n')
+
+        fragmentPath = os.path.join(inManifest.mOutputDir, BuildFragment.FILENAME)
+        with open(f'{fragmentPath}.tmp', 'w') as file:
+            file.write('# Generated by Fluffy.py, lists the generated driver configurations\n\n')
+            for name, filePaths in groups.items():
+                file.write(f'set({name}\n')
+                file.writelines(f'    "{filePath}"\n' for filePath in filePaths)
+                file.write(')\n\n')
+            file.writelines(properties)
+        # The build never reads a partially written fragment
+        os.replace(f'{fragmentPath}.tmp', fragmentPath)
+        return fragmentPath
+
+
+class ShardMap:
+    """
+    Represents the persisted assignment of the tables to unity-build shards
+    Use to keep every table in its shard across runs, only the new tables are placed by their size
+    """
+
+    FILENAME = '.fluffy.shards'
+
+    def __init__(self, inOutputDir: str, inShards: int):
+        self.mShards = max(1, inShards)
+        self.mPath = os.path.join(inOutputDir, ShardMap.FILENAME)
+        self.__previous = dict()
+        self.__current = dict()
+        if os.path.isfile(self.mPath):
+            try:
+                with open(self.mPath, 'r') as file:
+                    content = json.load(file)
+                # Changing the shard count reshuffles every table
+                if content['Shards'] == self.mShards:
+                    self.__previous = content['Assignments']
+            except (OSError, ValueError, KeyError):
+                self.__previous = dict()
+
+    def assign(self, inName: str, inSizes: dict[str, int]) -> list[list[str]]:
+        """
+        Distributes the given tables over the shards, returns the table names of each shard in the given order
+        Tables keep their previous shard, the new ones go largest first to the least loaded shard
+        """
+        previous = self.__previous.get(inName, dict())
+        assignment = dict()
+        loads = [0] * self.mShards
+        for name, size in inSizes.items():
+            shard = previous.get(name, -1)
+            if 0 <= shard < self.mShards:
+                assignment[name] = shard
+                loads[shard] += size
+        for name in sorted((name for name in inSizes if name not in assignment), key=lambda name: -inSizes[name]):
+            shard = loads.index(min(loads))
+            assignment[name] = shard
+            loads[shard] += inSizes[name]
+        self.__current[inName] = assignment
+
+        shards = [list() for _ in range(self.mShards)]
+        for name in inSizes:
+            shards[assignment[name]].append(name)
+        return shards
+
+    def save(self):
+        with open(f'{self.mPath}.tmp', 'w') as file:
+            json.dump({'Shards': self.mShards, 'Assignments': self.__current}, file, indent=1, sort_keys=True)
+        os.replace(f'{self.mPath}.tmp', self.mPath)
+
+
 class File:
     """
     Represents File class
     Use to write CPP codes without worrying about formatting
     """
 
+    # Active manifest of the run, None disables content-hash tracking
+    Manifest = None
+    # Writes the content straight through a buffered file handle instead of keeping it in memory
+    Streaming = False
+    # Collects the saved files into the given list instead of writing them, None writes them right away
+    Deferred = None
+    # Background writer of the saved files, None writes them in the rendering thread
+    Writer = None
+    TABEXPANSION = ' ' * Constants.TABSPACE.value
+    BUFFERSIZE = 1 << 16
+
     def __init__(self, inName: str, inDescription: str, inPath: str):
         self.mName = inName
         self.mPath = inPath
         self.mDescription = inDescription
-        self.__content = ''
+        self.__chunks = list()
+        self.__handle = None
+        self.__hash = None
         self.__spaces = 0
+        if File.Streaming:
+            # Content goes to a temporary file, which replaces the target on save
+            self.__handle = open(self.__tempPath(), 'w', buffering=File.BUFFERSIZE)
+            if File.Manifest is not None:
+                self.__hash = Manifest.hasher()
         self.writeHeader()
 
+    def __filePath(self) -> str:
+        return os.path.join(self.mPath, self.mName)
+
+    def __tempPath(self) -> str:
+        return f'{self.__filePath()}.tmp'
+
     def writeHeader(self):
         """Generates File Header content"""
         self.write(f'// {"=" * Constants.LINELENGTH.value}\n')
@@ -51,7 +249,14 @@ class File:
         Write content to file buffer
         TODO: Implement CPP code formatting
         """
-        self.__content += inContent
+        # Tabs are expanded as the content is emitted, so saving needs no extra pass over it
+        content = inContent.replace('\t', File.TABEXPANSION)
+        if self.__handle is None:
+            self.__chunks.append(content)
+        else:
+            self.__handle.write(content)
+            if self.__hash is not None:
+                self.__hash.update(content.encode('utf-8'))
         # braceIdx = dict()
         # lastIdx = -1
         # for idx, ch in enumerate(inContent):
@@ -73,9 +278,74 @@ class File:
         #     lastIdx = idx
         # self.__content += inContent[lastIdx + 1:].replace('\n', f'\n{self.__spaces * " "}')
 
-    def save(self):
-        with open(os.path.join(self.mPath, self.mName), 'w') as file:
-            file.write(self.__content.replace('\t', f'{" " * 4}'))
+    def getContent(self) -> str:
+        """Returns the buffered content, not available in streaming mode"""
+        assert self.__handle is None
+        return ''.join(self.__chunks)
+
+    def save(self) -> str:
+        """Writes the file buffer to disk and returns its content digest"""
+        if File.Deferred is not None:
+            File.Deferred.append(self)
+            return None
+        # Buffered files are only queued for the writer threads, which trace the actual writes
+        category = 'Enqueue' if File.Writer is not None and self.__handle is None else 'Write'
+        with Tracer.span(self.mName, category):
+            if self.__handle is not None:
+                return self.__saveStream()
+            return self.__saveBuffer()
+
+    def __saveBuffer(self) -> str:
+        filePath = self.__filePath()
+        digest = None
+        if File.Manifest is not None:
+            contentHash = Manifest.hasher()
+            for chunk in self.__chunks:
+                contentHash.update(chunk.encode('utf-8'))
+            digest = contentHash.hexdigest()
+            File.Manifest.record(filePath, digest)
+            if File.Manifest.isCurrent(filePath, digest):
+                # Unchanged output, keep the existing file and its mtime
+                return digest
+        if File.Writer is not None:
+            File.Writer.submit(filePath, self.__chunks)
+        else:
+            File.replace(filePath, self.__chunks)
+        return digest
+
+    def __saveStream(self) -> str:
+        self.__handle.close()
+        self.__handle = None
+        filePath = self.__filePath()
+        digest = None
+        if self.__hash is not None:
+            digest = self.__hash.hexdigest()
+            File.Manifest.record(filePath, digest)
+            if File.Manifest.isCurrent(filePath, digest):
+                os.remove(self.__tempPath())
+                return digest
+        os.replace(self.__tempPath(), filePath)
+        return digest
+
+    @staticmethod
+    def replace(inFilePath: str, inChunks: list[str]):
+        """Replaces the file with given content, readers see either the previous or the new one, never a partial file"""
+        tempPath = f'{inFilePath}.tmp'
+        with open(tempPath, 'w', buffering=File.BUFFERSIZE) as file:
+            file.writelines(inChunks)
+        os.replace(tempPath, inFilePath)
+
+    @staticmethod
+    def syncDirs(inDirPaths: list[str]):
+        """Flushes the renames & removals of the given directories to disk, once per directory"""
+        if os.name != 'posix':
+            return
+        for dirPath in inDirPaths:
+            fd = os.open(dirPath, os.O_RDONLY)
+            try:
+                os.fsync(fd)
+            finally:
+                os.close(fd)
 
     @staticmethod
     def createDir(inDirPath: str, inMode: int = 0o777):
@@ -86,3 +356,374 @@ class File:
             # Re-raise the error unless it's for already existing directory
             if err.errno != errno.EEXIST or not os.path.isdir(inDirPath):
                 raise
+
+
+class DataFile(File):
+    """
+    Represents DataFile class
+    Use to write generated resources other than CPP codes, which carry no file header
+    """
+
+    def writeHeader(self):
+        pass
+
+
+class AsyncWriter:
+    """
+    Represents background threads writing the saved files to disk
+    Use to overlap the disk I/O with rendering, a full queue holds the rendering back until the disk catches up
+    """
+
+    def __init__(self, inThreads: int = 1, inQueueSize: int = 64):
+        self.mThreads = max(1, inThreads)
+        self.mQueueSize = max(1, inQueueSize)
+        self.__queue = queue.Queue(self.mQueueSize)
+        self.__errors = list()
+        self.__threads = [threading.Thread(target=self.__run, daemon=True) for _ in range(self.mThreads)]
+        for thread in self.__threads:
+            thread.start()
+
+    def submit(self, inFilePath: str, inChunks: list[str]):
+        """Queues the content to be written to given file, blocks while the queue is full"""
+        self.__queue.put((inFilePath, inChunks))
+
+    def __run(self):
+        while True:
+            item = self.__queue.get()
+            try:
+                if item is None:
+                    return
+                with Tracer.span(os.path.basename(item[0]), 'Write'):
+                    File.replace(*item)
+            except Exception as err:
+                # Reported by flush or close, the rendering goes on meanwhile
+                self.__errors.append((item[0], err))
+            finally:
+                self.__queue.task_done()
+
+    def __raiseErrors(self):
+        if len(self.__errors) > 0:
+            errors, self.__errors = self.__errors, list()
+            filePath, err = errors[0]
+            raise OSError(f'{len(errors)} file(s) could not be written, first one {filePath}: {err}') from err
+
+    def flush(self):
+        """Waits for the queued files to be written, raises if any of them failed"""
+        self.__queue.join()
+        self.__raiseErrors()
+
+    def close(self):
+        """Writes the queued files and stops the threads, raises if any of the files failed"""
+        for _ in self.__threads:
+            self.__queue.put(None)
+        for thread in self.__threads:
+            thread.join()
+        self.__raiseErrors()
+
+
+class Fragment:
+    """
+    Represents a piece of CPP code rendered apart from its file
+    Use to render code whose destination file is decided later, it's written through File.write
+    """
+
+    def __init__(self):
+        self.__chunks = list()
+
+    def write(self, inContent: str):
+        self.__chunks.append(inContent)
+
+    def getContent(self) -> str:
+        return ''.join(self.__chunks)
+
+
+class JSONCursor:
+    """
+    Represents a forward-only cursor over a UTF-8 JSON file
+    Use to decode a document value by value without holding the whole text in memory
+    """
+
+    CHUNKSIZE = 1 << 16
+
+    def __init__(self, inFile, inOffset: int = 0):
+        inFile.seek(inOffset)
+        self.__file = inFile
+        self.__decoder = codecs.getincrementaldecoder('utf-8')()
+        self.__jsonDecoder = json.JSONDecoder()
+        self.__buffer = ''
+        self.__pos = 0
+        # Byte offset of the first character held in the buffer
+        self.__offset = inOffset
+        self.__eof = False
+
+    def __fill(self, inSize: int = CHUNKSIZE) -> bool:
+        """Appends the next chunk of the file to the buffer, drops the consumed part"""
+        if self.__eof:
+            return False
+        if self.__pos > 0:
+            self.__offset += len(self.__buffer[:self.__pos].encode('utf-8'))
+            self.__buffer = self.__buffer[self.__pos:]
+            self.__pos = 0
+        data = self.__file.read(inSize)
+        self.__eof = len(data) == 0
+        self.__buffer += self.__decoder.decode(data, self.__eof)
+        return not self.__eof
+
+    def peek(self) -> str:
+        """Returns the next non-whitespace character without consuming it, '' at the end of file"""
+        while True:
+            while self.__pos < len(self.__buffer) and self.__buffer[self.__pos] in ' \t\r\n':
+                self.__pos += 1
+            if self.__pos < len(self.__buffer):
+                return self.__buffer[self.__pos]
+            if not self.__fill():
+                return ''
+
+    def expect(self, inChars: str) -> str:
+        """Consumes the next non-whitespace character which must be one of the given"""
+        char = self.peek()
+        if char == '' or char not in inChars:
+            raise ValueError(f'Expected one of {inChars!r} at byte {self.offset()}, found {char!r}')
+        self.__pos += 1
+        return char
+
+    def offset(self) -> int:
+        """Byte offset of the cursor in the file"""
+        return self.__offset + len(self.__buffer[:self.__pos].encode('utf-8'))
+
+    def value(self):
+        """Decodes the next JSON value"""
+        self.peek()
+        while True:
+            try:
+                value, endIdx = self.__jsonDecoder.raw_decode(self.__buffer, self.__pos)
+                # A value ending with the buffer may be a truncated number or literal
+                if endIdx < len(self.__buffer) or self.__eof:
+                    self.__pos = endIdx
+                    return value
+            except json.JSONDecodeError:
+                if self.__eof:
+                    raise
+            # Grow the reads geometrically so a large value is decoded in amortized linear time
+            self.__fill(max(JSONCursor.CHUNKSIZE, len(self.__buffer)))
+
+
+class JSONStream:
+    """
+    Represents a JSON document read incrementally from disk
+    Use to keep large top level arrays out of memory, their elements are decoded one at a time
+    """
+
+    def __init__(self, inPath: str):
+        self.mPath = inPath
+
+    def load(self, inStreamedKeys: list[str]) -> dict:
+        """
+        Decodes the top level object, except the arrays of given keys
+        Those are skipped over and mapped to re-iterable JSONArray instances instead
+        """
+        content = dict()
+        with open(self.mPath, 'rb') as file:
+            cursor = JSONCursor(file)
+            cursor.expect('{')
+            if cursor.peek() == '}':
+                return content
+            while True:
+                key = cursor.value()
+                cursor.expect(':')
+                if key in inStreamedKeys and cursor.peek() == '[':
+                    content[key] = JSONArray(self.mPath, cursor.offset())
+                    for _ in JSONArray.elements(cursor):
+                        pass
+                else:
+                    content[key] = cursor.value()
+                if cursor.expect(',}') == '}':
+                    return content
+
+
+class JSONArray:
+    """Represents a JSON array of a file, its elements are decoded lazily from disk on every access"""
+
+    def __init__(self, inPath: str, inOffset: int):
+        self.mPath = inPath
+        self.mOffset = inOffset
+
+    def __iter__(self):
+        for _, element in self.items():
+            yield element
+
+    def items(self):
+        """Yields the byte offset of each element along with the decoded element"""
+        with open(self.mPath, 'rb') as file:
+            yield from JSONArray.elements(JSONCursor(file, self.mOffset))
+
+    def element(self, inOffset: int):
+        """Decodes the single element starting at given byte offset"""
+        with open(self.mPath, 'rb') as file:
+            return JSONCursor(file, inOffset).value()
+
+    @staticmethod
+    def elements(inCursor: JSONCursor):
+        inCursor.expect('[')
+        if inCursor.peek() == ']':
+            inCursor.expect(']')
+            return
+        while True:
+            inCursor.peek()
+            offset = inCursor.offset()
+            yield offset, inCursor.value()
+            if inCursor.expect(',]') == ']':
+                return
+
+
+class Tracer:
+    """
+    Represents the span recorder of a generation run
+    Use to find out where the time goes, exports Chrome trace events & a sorted text summary
+    """
+
+    # Active tracer of the run, None disables the tracing
+    Active = None
+
+    def __init__(self):
+        self.mOrigin = time.perf_counter()
+        # Spans as (name, category, start, duration, pid, tid, args)
+        self.mEvents = list()
+
+    @staticmethod
+    def span(inName: str, inCategory: str, **inArgs):
+        """Returns a context manager timing its block on the active tracer, a no-op when tracing is off"""
+        if Tracer.Active is None:
+            return nullcontext()
+        return Tracer.Active.record(inName, inCategory, inArgs)
+
+    @contextmanager
+    def record(self, inName: str, inCategory: str, inArgs: dict):
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.mEvents.append((inName, inCategory, start, time.perf_counter() - start, os.getpid(),
+                                 threading.get_native_id(), inArgs))
+
+    def drain(self) -> list:
+        """Hands over the recorded spans, used by the workers to pass them on to the parent"""
+        events, self.mEvents = self.mEvents, list()
+        return events
+
+    def merge(self, inEvents: list):
+        self.mEvents.extend(inEvents)
+
+    def export(self, inPath: str):
+        """Writes the spans as Chrome trace events, loadable in chrome://tracing or Perfetto"""
+        traceEvents = [{
+            'name': name,
+            'cat': category,
+            'ph': 'X',
+            'ts': round((start - self.mOrigin) * 1e6, 1),
+            'dur': round(duration * 1e6, 1),
+            'pid': pid,
+            'tid': tid,
+            'args': args
+        } for name, category, start, duration, pid, tid, args in self.mEvents]
+        with open(inPath, 'w') as file:
+            json.dump({'traceEvents': traceEvents, 'displayTimeUnit': 'ms'}, file)
+
+    def summary(self, inLimit: int = 20) -> str:
+        """Lists the total time of each category followed by its slowest spans"""
+        categories = dict()
+        for event in self.mEvents:
+            categories.setdefault(event[1], list()).append(event)
+        lines = list()
+        for category, events in categories.items():
+            events.sort(key=lambda event: event[3], reverse=True)
+            lines.append(f'{category}: {len(events)} span(s), {sum(event[3] for event in events):.3f}s')
+            for name, _, _, duration, _, _, _ in events[:inLimit]:
+                lines.append(f'\t{duration * 1000:>10.2f} ms  {name}')
+        return '\n'.join(lines)
+
+
+class WorkerPool:
+    """
+    Represents a pool of worker processes
+    Use to spread independent generation tasks, results are always yielded in submission order
+    """
+
+    # Number of tasks handed over to a worker at once
+    CHUNKSIZE = 8
+
+    def __init__(self, inJobs: int = 1):
+        self.mJobs = max(1, inJobs)
+        self.__executor = None
+        if self.mJobs > 1:
+            writer = None if File.Writer is None else (File.Writer.mThreads, File.Writer.mQueueSize)
+            self.__executor = ProcessPoolExecutor(self.mJobs, initializer=WorkerPool.initialize,
+                                                  initargs=(File.Manifest, File.Streaming, Tracer.Active is not None,
+                                                            writer))
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *inExcInfo):
+        self.shutdown()
+
+    @staticmethod
+    def initialize(inManifest: Manifest, inStreaming: bool, inTracing: bool, inWriter: tuple):
+        """Shares the run state of the parent process with a worker"""
+        File.Manifest = inManifest
+        File.Streaming = inStreaming
+        Tracer.Active = Tracer() if inTracing else None
+        File.Writer = AsyncWriter(*inWriter) if inWriter is not None else None
+
+    @staticmethod
+    def runChunk(inFunc, inItems: list, inArgs: tuple) -> tuple:
+        """Returns the results of the chunk along with the spans traced while producing them"""
+        results = [inFunc(item, *inArgs) for item in inItems]
+        if File.Writer is not None:
+            # The chunk is done once its files are on disk
+            File.Writer.flush()
+        return results, Tracer.Active.drain() if Tracer.Active is not None else list()
+
+    @staticmethod
+    def collect(inFuture) -> list:
+        results, events = inFuture.result()
+        if Tracer.Active is not None:
+            Tracer.Active.merge(events)
+        return results
+
+    def map(self, inFunc, inItems, *inArgs):
+        """Yields inFunc(item, *inArgs) for every item, keeping a bounded number of chunks in flight"""
+        if self.__executor is None:
+            for item in inItems:
+                yield inFunc(item, *inArgs)
+            return
+        pending = deque()
+        chunk = list()
+        for item in inItems:
+            chunk.append(item)
+            if len(chunk) == WorkerPool.CHUNKSIZE:
+                pending.append(self.__executor.submit(WorkerPool.runChunk, inFunc, chunk, inArgs))
+                chunk = list()
+                if len(pending) > self.mJobs * 2:
+                    yield from WorkerPool.collect(pending.popleft())
+        if len(chunk) > 0:
+            pending.append(self.__executor.submit(WorkerPool.runChunk, inFunc, chunk, inArgs))
+        while len(pending) > 0:
+            yield from WorkerPool.collect(pending.popleft())
+
+    def submit(self, inFunc, *inArgs) -> Future:
+        """Schedules inFunc(*inArgs) on a worker, runs it right away when there are none"""
+        if self.__executor is not None:
+            return self.__executor.submit(inFunc, *inArgs)
+        future = Future()
+        try:
+            future.set_result(inFunc(*inArgs))
+        except (Exception, SystemExit) as err:
+            # As a worker process would, so the caller gets the failure from the future
+            future.set_exception(err)
+        return future
+
+    def shutdown(self):
+        if self.__executor is not None:
+            self.__executor.shutdown()
+            self.__executor = None
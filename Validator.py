@@ -0,0 +1,128 @@
+"""
+Contains definition of Validator class
+"""
+import sys
+import json
+import argparse
+from MDEF import *
+
+
+class Validator:
+    """
+    Represents the semantic validation of a parsed MDEF
+    Use to find the broken references before generating, every table is loaded once while the tables, columns &
+    foreign key targets are indexed, the references are then resolved against the indexes
+    """
+
+    def __init__(self, inMDEF: MDEF):
+        self.mMDEF = inMDEF
+        self.mErrors = list()
+
+    @staticmethod
+    def check(inMDEF: MDEF, inValidate: bool):
+        """Raises an MDEFError listing every validation error, only the colliding identifiers when not validating"""
+        if inValidate:
+            errors = Validator(inMDEF).validate()
+            if len(errors) > 0:
+                raise MDEFError('\n'.join(errors + [f'{len(errors)} MDEF error(s) found, nothing generated']))
+        else:
+            collisions = Identifiers.collisions(inMDEF)
+            if len(collisions) > 0:
+                raise MDEFError('\n'.join(f'Colliding identifiers, {collision}' for collision in collisions))
+
+    def validate(self) -> list[str]:
+        """Returns every error found in the MDEF, empty when it is consistent"""
+        self.mErrors = [f'MDEF: unknown {className} key "{key}"' for className, key in self.mMDEF.UnknownKeys]
+        # (schema, name) -> column names of the table, names -> schemas of the tables, for the foreign keys
+        columnsByTable = dict()
+        schemasByName = dict()
+        foreignKeys = list()
+        for tables in [self.mMDEF.Tables, self.mMDEF.SkeletonTables]:
+            seen = set()
+            for lazyTable in tables:
+                # An empty schema is no schema, as in the generated foreign keys
+                key = (lazyTable.TableSchemaName or None, lazyTable.Name)
+                if key in seen:
+                    self.mErrors.append(f'{lazyTable.Label}: defined more than once')
+                    continue
+                seen.add(key)
+                try:
+                    table = lazyTable.load()
+                except MDEFError as error:
+                    self.mErrors.append(str(error))
+                    continue
+                for className, unknownKey in table.UnknownKeys:
+                    self.mErrors.append(f'{table.Label}: unknown {className} key "{unknownKey}"')
+                columns = self.validateTable(table)
+                if key not in columnsByTable:
+                    columnsByTable[key] = columns
+                    schemasByName.setdefault(table.Name, list()).append(key[0])
+                foreignKeys.extend((table, columns, foreignKey) for foreignKey in table.ForeignKeys)
+
+        for table, columns, foreignKey in foreignKeys:
+            self.validateForeignKey(table, columns, foreignKey, columnsByTable, schemasByName)
+        self.mErrors.extend(f'Colliding identifiers, {collision}' for collision in Identifiers.collisions(self.mMDEF))
+        return self.mErrors
+
+    def validateTable(self, inTable: Table) -> set[str]:
+        """Checks the columns & primary keys of the table, returns its column names"""
+        label = inTable.Label
+        columns = set()
+        for column in inTable.Columns + [skeletonCol.ColumnDefinition for skeletonCol in inTable.SkeletonColumns]:
+            if column.Name in columns:
+                self.mErrors.append(f'{label}: column "{column.Name}" defined more than once')
+            columns.add(column.Name)
+        for primaryKey in inTable.PrimaryKeys:
+            if primaryKey.Index == -1:
+                self.mErrors.append(f'{label}: primary key column "{primaryKey.Name}" not found')
+            if primaryKey.RelatedFKColumns is not None:
+                for fkColumn, fkIndex in zip(primaryKey.RelatedFKColumns, primaryKey.RelatedFKColumnIndices):
+                    if fkIndex == -1:
+                        self.mErrors.append(f'{label}: related foreign key column "{fkColumn}" of primary key '
+                                            f'"{primaryKey.Name}" not found')
+        for columnName in inTable.ItemEndpointColumnNames or list():
+            if columnName not in columns:
+                self.mErrors.append(f'{label}: item endpoint column "{columnName}" not found')
+        return columns
+
+    def validateForeignKey(self, inTable: Table, inColumns: set[str], inForeignKey: ForeignKey,
+                           inColumnsByTable: dict, inSchemasByName: dict):
+        """Checks the referenced table & the columns on both sides of the foreign key"""
+        label = inTable.Label
+        schema, name = inForeignKey.ReferenceTableSchema or None, inForeignKey.ReferenceTable
+        if schema is None:
+            # Without schema, the reference is resolved when the name is unambiguous
+            schemas = inSchemasByName.get(name, list())
+            if len(schemas) > 1:
+                self.mErrors.append(f'{label}: foreign key reference table "{name}" is ambiguous across schemas '
+                                    f'{", ".join(str(schema) for schema in schemas)}')
+                return
+            schema = schemas[0] if len(schemas) == 1 else None
+        referencedColumns = inColumnsByTable.get((schema, name))
+        if referencedColumns is None:
+            target = f'{schema}.{name}' if schema else name
+            self.mErrors.append(f'{label}: foreign key reference table "{target}" not found')
+            return
+        for fkColumn in inForeignKey.ForeignKeyColumns:
+            if fkColumn.ForeignKey not in inColumns:
+                self.mErrors.append(f'{label}: foreign key column "{fkColumn.ForeignKey}" not found')
+            if fkColumn.PrimaryKey not in referencedColumns:
+                self.mErrors.append(f'{label}: foreign key column "{fkColumn.PrimaryKey}" not found in reference '
+                                    f'table "{name}"')
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Checks the references of a driver MDEF')
+    parser.add_argument('MDEFPath', help='Path to MDEF file')
+    args = parser.parse_args()
+    with open(args.MDEFPath, 'r') as file:
+        try:
+            errors = Validator(MDEF(json.load(file))).validate()
+        except MDEFError as error:
+            errors = [str(error)]
+    for error in errors:
+        print(error, file=sys.stderr)
+    if len(errors) > 0:
+        print(f'{len(errors)} error(s) found', file=sys.stderr)
+        sys.exit(1)
+    print('No error found')
@@ -0,0 +1,134 @@
+"""
+Contains definition of Watcher class
+"""
+import os
+import sys
+import json
+import time
+from Util import BuildFragment, File, Manifest
+from Configurations import *
+from Validator import Validator
+
+
+class Watcher:
+    """
+    Represents a long-running regenerator of a driver MDEF
+    Use to poll the MDEF for edits and re-render only the outputs depending on the changed sections
+    """
+
+    # Seconds between two checks of the MDEF
+    INTERVAL = 0.25
+    __configurables__ = [ConfigurationH, ConfigurationCPP, ConfigurationHelpersH, DriverWideConfigurationCPP]
+    __tableconfigurables__ = [TableConfig, SkeletonTableConfig]
+    # Outputs depending on the top level MDEF sections, the other sections only feed Configuration.cpp
+    __dependencies__ = {
+        Constants.DATASOURCE.value: __configurables__ + __tableconfigurables__,
+        Constants.PAGINATION.value: __tableconfigurables__,
+        Constants.AUTHBROWSECONNECTMAP.value: [ConfigurationCPP, DriverWideConfigurationCPP]
+    }
+
+    def __init__(self, inMDEFPath: str, inOutputDir: str, inBuildFragment: bool = False, inValidate: bool = False):
+        self.mMDEFPath = inMDEFPath
+        self.mOutputDir = inOutputDir
+        self.mBuildFragment = inBuildFragment
+        self.mValidate = inValidate
+        self.mConfigDir = os.path.join(inOutputDir, 'Configs')
+        self.mTableDirs = {
+            TableConfig: os.path.join(inOutputDir, 'Tables'),
+            SkeletonTableConfig: os.path.join(inOutputDir, 'SkeletonTables')
+        }
+        self.mMDEF = None
+        self.__content = None
+        self.__stat = None
+        self.__poll()
+
+    def __poll(self) -> list[str]:
+        """Regenerates when the MDEF changed since the last poll, returns the re-rendered outputs or None"""
+        stat = os.stat(self.mMDEFPath)
+        stat = (stat.st_mtime_ns, stat.st_size)
+        if stat == self.__stat:
+            return None
+        self.__stat = stat
+        with open(self.mMDEFPath, 'r') as file:
+            content = json.load(file)
+        if self.__content is None:
+            self.__content, self.mMDEF = content, MDEF(content)
+            return None
+        return self.regenerate(content)
+
+    @staticmethod
+    def __tables(inContent: dict, inKey: str, inTables: list[LazyTable]) -> dict:
+        """Maps the full name of every table to its raw data"""
+        return {table.FullName: tableData for tableData, table in zip(inContent.get(inKey, list()), inTables)}
+
+    def regenerate(self, inContent: dict) -> list[str]:
+        """Re-renders the outputs affected by the difference between the previous & given MDEF content"""
+        mdef = MDEF(inContent)
+        # An edit the first run would have refused leaves the outputs untouched
+        Validator.check(mdef, self.mValidate)
+        tableSections = [
+            (TableConfig, Constants.TABLES.value, self.mMDEF.Tables, mdef.Tables),
+            (SkeletonTableConfig, Constants.SKELETONTABLE.value, self.mMDEF.SkeletonTables, mdef.SkeletonTables)
+        ]
+        tableKeys = [key for _, key, _, _ in tableSections]
+        configurables = set()
+        for key in set(self.__content) | set(inContent):
+            if key not in tableKeys and self.__content.get(key) != inContent.get(key):
+                configurables.update(Watcher.__dependencies__.get(key, [ConfigurationCPP]))
+
+        regenerated = list()
+        removedPaths = list()
+        File.Manifest = Manifest(self.mOutputDir)
+        for configurable, key, previousTables, tables in tableSections:
+            outputDir = self.mTableDirs[configurable]
+            previousTables = Watcher.__tables(self.__content, key, previousTables)
+            currentTables = Watcher.__tables(inContent, key, tables)
+            if list(previousTables) != list(currentTables):
+                # Tables were added, removed or reordered
+                configurables.update([ConfigurationCPP, ConfigurationHelpersH])
+            for fullName in previousTables.keys() - currentTables.keys():
+                removedPaths.append(os.path.join(outputDir, f'{fullName}.cpp'))
+            for table in tables:
+                if configurable in configurables or \
+                        previousTables.get(table.FullName) != currentTables[table.FullName]:
+                    filePath, digest = configurable.ConfigureTable(table, mdef.DataSource, outputDir)
+                    File.Manifest.record(filePath, digest, [table.FullName])
+                    regenerated.append(table.FullName)
+
+        for configurable in Watcher.__configurables__:
+            if configurable in configurables:
+                configurable.Configure(mdef, self.mConfigDir)
+                regenerated.append(configurable.__name__)
+
+        for filePath in removedPaths:
+            if os.path.isfile(filePath):
+                os.remove(filePath)
+        File.Manifest.retain(removedPaths)
+        File.Manifest.save()
+        if self.mBuildFragment:
+            BuildFragment.save(File.Manifest)
+        self.__content, self.mMDEF = inContent, mdef
+        return regenerated
+
+    def watch(self):
+        """Regenerates on every MDEF edit until interrupted"""
+        print(f'Watching {self.mMDEFPath}, press Ctrl+C to stop')
+        try:
+            while True:
+                time.sleep(Watcher.INTERVAL)
+                start = time.perf_counter()
+                try:
+                    regenerated = self.__poll()
+                except MDEFError as err:
+                    # Well-formed but incomplete, the previous model is kept until the next edit
+                    print(f'Skipping MDEF edit: {err}', file=sys.stderr)
+                    continue
+                except Exception as err:
+                    # The MDEF may be half saved, wait for the next edit
+                    print(f'Skipping MDEF edit: {err!r}', file=sys.stderr)
+                    continue
+                if regenerated is not None:
+                    print(f'Regenerated {len(regenerated)} output(s) in {time.perf_counter() - start:.3f}s: '
+                          f'{", ".join(regenerated)}')
+        except KeyboardInterrupt:
+            pass
@@ -0,0 +1,261 @@
+// =============================================================================================================================
+/// @file Configuration.cpp
+///
+/// Synthetic Driver Configuration
+///
+/// Copyright (C) 2026 Simba Technologies Incorporated.
+// =============================================================================================================================
+
+#include "Configuration.h"
+#include "ConfigurationHelpers.h"
+#include "Authentication/IAuthenticationHandler.h"
+#include "Authentication/SaaSAuthenticationFactory.h"
+#include "Pagination/SaaSPaginationFactory.h"
+#include "Pagination/IPaginationHandler.h"
+#include "Parser/IParserHandler.h"
+#include "Parser/SaaSParserFactory.h"
+#include "SimbaEngine/SharedPtr.h"
+
+using namespace Simba::SaaSSDK;
+using namespace Simba::SaaSSDK::SyntheticODBC;
+
+AutoPtr<ISaaSStaticConfiguration> Simba::SaaSSDK::SaaSSDKDSIFactory()
+{
+    return AutoPtr<ISaaSStaticConfiguration>(new SyntheticODBCStaticConfiguration);
+}
+void SyntheticODBCStaticConfiguration::PopulateMetaDataConfiguration(SaaSConfiguration& out_configs)
+{
+    // Base configuration
+    {
+        out_configs.SetDataSource("Synthetic");
+        out_configs.SetBaseUrl("https://api.synthetic.example.com");
+        out_configs.SetTestUrlEndpoint("/v1/ping");
+        out_configs.SetTimestampFormat("%Y-%m-%dT%H:%M:%S");
+        out_configs.SetIsUnixTimeStampFormat(false);
+        out_configs.SetTimestampUnit(SAAS_TIMESTAMP_UNIT_SECONDS);
+        out_configs.SetIsLazyInitialization(false);
+        out_configs.SetIsThrothrottlingSupported(true);
+    }
+    // AuthBrowseConnectMap
+    {
+        SaaSAuthBrowseConnectMap mapclientid;
+        mapclientid.SetKey("client_id");
+        out_configs.GetAuthBrowseConnectMap().insert({"client_id" , mapclientid});
+
+        SaaSAuthBrowseConnectMap mapclientsecret;
+        mapclientsecret.SetKey("client_secret");
+        mapclientsecret.SetEncBrowseConnectKey("ENC_SECRET");
+        out_configs.GetAuthBrowseConnectMap().insert({"client_secret" , mapclientsecret});
+    }
+    // AuthProfiles
+    {
+        SaaSAuthProfiles authProfile;
+        // OAuth 2.0
+        {
+            std::vector<SaaSAuthSequence> authSeqOAuth20;
+            {
+                // FlowOAuth20
+                SaaSBrowseConnectSequence browseSeqFlowOAuth201;
+                {
+                    SaaSRequiredParam reqParamclientid;
+                    reqParamclientid.SetKey("client_id");
+                    browseSeqFlowOAuth201.GetRequiredParams().push_back(reqParamclientid);
+
+                    SaaSRequiredParam reqParamclientsecret;
+                    reqParamclientsecret.SetKey("client_secret");
+                    browseSeqFlowOAuth201.GetRequiredParams().push_back(reqParamclientsecret);
+
+                    SaaSHeader header1;
+                    header1.SetKey("Accept");
+                    header1.SetValue("application/json");
+                    browseSeqFlowOAuth201.GetHeaders().push_back(header1);
+
+                    SaaSExpectedParam expParamaccesstoken;
+                    expParamaccesstoken.SetKey("access_token");
+                    expParamaccesstoken.SetPath("$.access_token");
+                    browseSeqFlowOAuth201.GetExpectedParams().push_back(expParamaccesstoken);
+
+                }
+                SaaSAuthSequence authSeqFlowOAuth20;
+                authSeqFlowOAuth20.SetName("FlowOAuth20");
+                authSeqFlowOAuth20.GetSequence().push_back(browseSeqFlowOAuth201);
+                authSeqOAuth20.push_back(authSeqFlowOAuth20);
+
+            }
+            authProfile.GetAuthSequence().insert({ "OAuth 2.0", authSeqOAuth20 });
+            authProfile.GetTypes().push_back("OAuth 2.0");
+        }
+
+        // Basic Authentication
+        {
+            std::vector<SaaSAuthSequence> authSeqBasicAuthentication;
+            {
+                // FlowBasicAuthentication
+                SaaSBrowseConnectSequence browseSeqFlowBasicAuthentication1;
+                {
+                    SaaSRequiredParam reqParamclientid;
+                    reqParamclientid.SetKey("client_id");
+                    browseSeqFlowBasicAuthentication1.GetRequiredParams().push_back(reqParamclientid);
+
+                    SaaSRequiredParam reqParamclientsecret;
+                    reqParamclientsecret.SetKey("client_secret");
+                    browseSeqFlowBasicAuthentication1.GetRequiredParams().push_back(reqParamclientsecret);
+
+                    SaaSHeader header1;
+                    header1.SetKey("Accept");
+                    header1.SetValue("application/json");
+                    browseSeqFlowBasicAuthentication1.GetHeaders().push_back(header1);
+
+                    SaaSExpectedParam expParamaccesstoken;
+                    expParamaccesstoken.SetKey("access_token");
+                    expParamaccesstoken.SetPath("$.access_token");
+                    browseSeqFlowBasicAuthentication1.GetExpectedParams().push_back(expParamaccesstoken);
+
+                }
+                SaaSAuthSequence authSeqFlowBasicAuthentication;
+                authSeqFlowBasicAuthentication.SetName("FlowBasicAuthentication");
+                authSeqFlowBasicAuthentication.GetSequence().push_back(browseSeqFlowBasicAuthentication1);
+                authSeqBasicAuthentication.push_back(authSeqFlowBasicAuthentication);
+
+            }
+            authProfile.GetAuthSequence().insert({ "Basic Authentication", authSeqBasicAuthentication });
+            authProfile.GetTypes().push_back("Basic Authentication");
+        }
+
+        // Access Token
+        {
+            std::vector<SaaSAuthSequence> authSeqAccessToken;
+            {
+                // FlowAccessToken
+                SaaSBrowseConnectSequence browseSeqFlowAccessToken1;
+                {
+                    SaaSRequiredParam reqParamclientid;
+                    reqParamclientid.SetKey("client_id");
+                    browseSeqFlowAccessToken1.GetRequiredParams().push_back(reqParamclientid);
+
+                    SaaSRequiredParam reqParamclientsecret;
+                    reqParamclientsecret.SetKey("client_secret");
+                    browseSeqFlowAccessToken1.GetRequiredParams().push_back(reqParamclientsecret);
+
+                    SaaSHeader header1;
+                    header1.SetKey("Accept");
+                    header1.SetValue("application/json");
+                    browseSeqFlowAccessToken1.GetHeaders().push_back(header1);
+
+                    SaaSExpectedParam expParamaccesstoken;
+                    expParamaccesstoken.SetKey("access_token");
+                    expParamaccesstoken.SetPath("$.access_token");
+                    browseSeqFlowAccessToken1.GetExpectedParams().push_back(expParamaccesstoken);
+
+                }
+                SaaSAuthSequence authSeqFlowAccessToken;
+                authSeqFlowAccessToken.SetName("FlowAccessToken");
+                authSeqFlowAccessToken.GetSequence().push_back(browseSeqFlowAccessToken1);
+                authSeqAccessToken.push_back(authSeqFlowAccessToken);
+
+            }
+            authProfile.GetAuthSequence().insert({ "Access Token", authSeqAccessToken });
+            authProfile.GetTypes().push_back("Access Token");
+        }
+
+        // MWS
+        {
+            std::vector<SaaSAuthSequence> authSeqMWS;
+            {
+                // FlowMWS
+                SaaSBrowseConnectSequence browseSeqFlowMWS1;
+                {
+                    SaaSRequiredParam reqParamclientid;
+                    reqParamclientid.SetKey("client_id");
+                    browseSeqFlowMWS1.GetRequiredParams().push_back(reqParamclientid);
+
+                    SaaSRequiredParam reqParamclientsecret;
+                    reqParamclientsecret.SetKey("client_secret");
+                    browseSeqFlowMWS1.GetRequiredParams().push_back(reqParamclientsecret);
+
+                    SaaSHeader header1;
+                    header1.SetKey("Accept");
+                    header1.SetValue("application/json");
+                    browseSeqFlowMWS1.GetHeaders().push_back(header1);
+
+                    SaaSExpectedParam expParamaccesstoken;
+                    expParamaccesstoken.SetKey("access_token");
+                    expParamaccesstoken.SetPath("$.access_token");
+                    browseSeqFlowMWS1.GetExpectedParams().push_back(expParamaccesstoken);
+
+                }
+                SaaSAuthSequence authSeqFlowMWS;
+                authSeqFlowMWS.SetName("FlowMWS");
+                authSeqFlowMWS.GetSequence().push_back(browseSeqFlowMWS1);
+                authSeqMWS.push_back(authSeqFlowMWS);
+
+            }
+            authProfile.GetAuthSequence().insert({ "MWS", authSeqMWS });
+            authProfile.GetTypes().push_back("MWS");
+        }
+
+        authProfile.SetTokenType("Bearer");
+        authProfile.SetIsExpirationDataAvailable("true");
+        authProfile.setIsAutoRefreshSupported("true");
+        authProfile.SetVerifyHost("true");
+        authProfile.SetVerifyPeer("true");
+        authProfile.SetAuthWindowHeight(600);
+        authProfile.SetAuthWindowWidth(800);
+        out_configs.SetAuthProfiles(authProfile);
+
+        // OAuth 2.0
+        {
+            IAuthenticationHandler* authHandler =
+            SaaSAuthenticationFactory::CreateAuthenticationHandler(SAAS_AUTH_VALUE_OAUTH_2);
+
+            out_configs.AddAuthHandler("OAuth_2.0", authHandler);
+            out_configs.AddAuthHandler("OAuth 2.0", authHandler);
+        }
+        // Basic Authentication
+        {
+            IAuthenticationHandler* authHandler =
+            SaaSAuthenticationFactory::CreateAuthenticationHandler(SAAS_AUTH_VALUE_BASIC);
+
+            out_configs.AddAuthHandler("Basic", authHandler);
+            out_configs.AddAuthHandler("Basic Authentication", authHandler);
+        }
+        // Access Token
+        {
+            IAuthenticationHandler* authHandler =
+            SaaSAuthenticationFactory::CreateAuthenticationHandler(SAAS_AUTH_VALUE_ACCESS_TOKEN);
+
+            out_configs.AddAuthHandler("Access_Token", authHandler);
+            out_configs.AddAuthHandler("Access Token", authHandler);
+        }
+        // MWS
+        {
+            IAuthenticationHandler* authHandler =
+            SaaSAuthenticationFactory::CreateAuthenticationHandler(SAAS_AUTH_VALUE_MWS);
+
+            out_configs.AddAuthHandler("MWS", authHandler);
+        }
+    }
+    // Parser handlers
+    {
+        SaaSParser::SaaSParserFactory factory;
+        SaaSParser::IParserHandler* parserHandler =
+        factory.CreateParserHandler(SaaSParser::SAAS_JSON_PARSER);
+
+        out_configs.AddParserHandler("application/json", parserHandler);
+    }
+
+    // Tables
+    {
+        SalesTable0(out_configs);
+        SupportTable1(out_configs);
+        SalesTable2(out_configs);
+        SalesTable3(out_configs);
+        BillingTable4(out_configs);
+    }
+
+    // Skeleton Tables
+    {
+        SkeletonTableBillingSkeleton0(out_configs);
+        SkeletonTableSalesSkeleton1(out_configs);
+    }
+}
\ No newline at end of file
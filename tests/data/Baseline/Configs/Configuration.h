@@ -0,0 +1,53 @@
+// =============================================================================================================================
+/// @file Configuration.h
+///
+/// Synthetic Driver Configuration
+///
+/// Copyright (C) 2026 Simba Technologies Incorporated.
+// =============================================================================================================================
+
+#ifndef _CONFIGURATION_H_
+#define _CONFIGURATION_H_
+
+#include "SaaSSDK.h"
+
+namespace Simba
+{
+    namespace SaaSSDK
+    {
+        namespace SyntheticODBC
+        {
+            /// @brief EloquaODBCStaticConfiguration abstract class, SaaS SDK user need to implement this class as the
+            ///        starting point. And need to fill in the configuration details.
+            class SyntheticODBCStaticConfiguration : public ISaaSStaticConfiguration
+            {
+            public:
+                /// @brief  To populate the meta data configurations for the data source.
+                virtual void PopulateMetaDataConfiguration(SaaSConfiguration& out_configs);
+
+                /// @brief To populate the driver wide settings.
+                ///
+                /// @param out_driverConfigs The static driver wide configuration details.
+                ///
+                virtual void PopulateDriverWideConfiguration(SaaSDriverConfig& out_driverConfig);
+
+                /// @brief The connection string key list which are marked sensistive and it's value is not to visible in
+                ///        log and should be masked in the logs.
+                ///
+                /// @param out_sensitiveList The simba_wstring vector holding sensitive key's name.
+                ///
+                virtual void PopulateSensitiveList(std::vector<simba_wstring>& out_sensitiveList);
+
+                /// @brief To populate the connection configuration to be set.
+                ///
+                /// @param in_connIdent     The connection identifier value passed in connection string
+                /// @param out_connConfig   The list of connection configuration.
+                ///
+                virtual void PopulateConnectionConfiguration(
+                    const simba_wstring& in_connIdent,
+                    SaaSConnectionConfig& out_connConfig);
+            }
+        }
+    }
+}
+#endif _CONFIGURATION_H_
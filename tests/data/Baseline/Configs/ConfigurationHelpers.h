@@ -0,0 +1,37 @@
+// =============================================================================================================================
+/// @file ConfigurationHelpers.h
+///
+/// Synthetic Driver ConfigurationHelpers
+///
+/// Copyright (C) 2026 Simba Technologies Incorporated.
+// =============================================================================================================================
+
+#ifndef __CONFIGURATIONHELPERS_H__
+#define __CONFIGURATIONHELPERS_H__
+
+#include "SaaSSDK.h"
+#include "Configuration/SaaSIndexBasedPaginationData.h"
+
+namespace Simba
+{
+    namespace SaaSSDK
+    {
+        class SaaSConfiguration;
+    }
+}
+
+Simba::Support::SharedPtr<Simba::SaaSSDK::SaaSPagination::SaaSIndexBasedPaginationData> GetPaginationDataDetails_EMPTY();
+Simba::Support::SharedPtr<Simba::SaaSSDK::SaaSPagination::SaaSIndexBasedPaginationData> GetPaginationDataDetails_ROWCOUNT();
+
+// Tables
+void SalesTable0(Simba::SaaSSDK::SaaSConfiguration& io_configs);
+void SupportTable1(Simba::SaaSSDK::SaaSConfiguration& io_configs);
+void SalesTable2(Simba::SaaSSDK::SaaSConfiguration& io_configs);
+void SalesTable3(Simba::SaaSSDK::SaaSConfiguration& io_configs);
+void BillingTable4(Simba::SaaSSDK::SaaSConfiguration& io_configs);
+
+// Skeleton Tables
+void SkeletonTableBillingSkeleton0(Simba::SaaSSDK::SaaSConfiguration& io_configs);
+void SkeletonTableSalesSkeleton1(Simba::SaaSSDK::SaaSConfiguration& io_configs);
+
+#endif __CONFIGURATIONHELPERS_H__
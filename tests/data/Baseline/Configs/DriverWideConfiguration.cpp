@@ -0,0 +1,46 @@
+// =============================================================================================================================
+/// @file DriverWideConfiguration.cpp
+///
+/// Synthetic DriverWide Configuration
+///
+/// Copyright (C) 2026 Simba Technologies Incorporated.
+// =============================================================================================================================
+
+#include "Configuration.h"
+#include <vector>
+
+using namespace Simba::SaaSSDK;
+using namespace Simba::SaaSSDK::SyntheticODBC;
+
+void SyntheticODBCStaticConfiguration::PopulateDriverWideConfiguration(SaaSDriverConfig& out_driverConfig)
+{
+    out_driverConfig.SetDriverName("SyntheticODBC");
+    out_driverConfig.SetVendorName("Simba");
+    out_driverConfig.SetDataSourceName("Synthetic");
+
+    ProductVersion prodVer(2, 10, 0, 1000);
+    out_driverConfig.SetVersion(prodVer);
+
+    out_driverConfig.SetDidFileName("SyntheticODBC.did");
+    out_driverConfig.SetErrorMsgFile("SyntheticError.xml");
+    out_driverConfig.SetComponentIdentifier(401);
+    out_driverConfig.SetComponentName("Synthetic");
+}
+
+void SyntheticODBCStaticConfiguration::PopulateSensitiveList(std::vector<simba_wstring>& out_sensitiveList)
+{
+    out_sensitiveList.push_back("client_secret");
+}
+
+void SyntheticODBCStaticConfiguration::PopulateConnectionConfiguration(
+    const simba_wstring& in_connIdent,
+    SaaSConnectionConfig& out_connConfig)
+{
+    AutoPtr<SaaSConnectionConfigValue> connConfig;
+
+    connConfig = new SaaSConnectionConfigValue(SAAS_CONN_CURRENT_CATALOG, DT_WSTRING, new simba_wstring(L"Synthetic"));
+    out_connConfig.AddToConnConfigMap(connConfig.Detach());
+
+    connConfig = new SaaSConnectionConfigValue(SAAS_CONN_DBMS_NAME, DT_WSTRING, new simba_wstring(L"Synthetic"));
+    out_connConfig.AddToConnConfigMap(connConfig.Detach());
+}
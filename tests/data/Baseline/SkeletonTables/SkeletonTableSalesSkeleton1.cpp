@@ -0,0 +1,358 @@
+// =============================================================================================================================
+/// @file SkeletonTableSalesSkeleton1.cpp
+///
+/// Synthetic SkeletonTableSalesSkeleton1 configurations
+///
+/// Copyright (C) 2026 Simba Technologies Incorporated.
+// =============================================================================================================================
+
+#include "Authentication/SaaSAuthenticationFactory.h"
+#include "ConfigurationHelpers.h"
+#include "Configuration/SaaSConfiguration.h"
+#include "Pagination/SaaSPaginationFactory.h"
+
+using namespace Simba::SaaSSDK;
+
+void SkeletonTableSalesSkeleton1(SaaSConfiguration& io_configs)
+{
+    SaaSTable table;
+    table.SetTableCatalogName(L"Synthetic");
+    table.SetTableName(L"Skeleton_1");
+    table.SetTableSchemaName(L"Sales");
+    table.SetPageable();
+    table.AddItemEndpointColumnNames("id");
+    // Primary Key
+    {
+        SaaSTablePKeyColumn tablePKey;
+        tablePKey.SetPKeyName("pk_Skeleton_1");
+        {
+            SaaSPK pKeySkeleton_1;
+            pKeySkeleton_1.SetPkColumn(0);
+            tablePKey.AddPK(pKeySkeleton_1);
+        }
+        table.SetPkeyColumns(tablePKey);
+    }
+    // Foreign Keys
+    {
+        SaaSFKeyColumn tableFKey;
+        SaaSForeignKeyColumns tableFKeyCol;
+        tableFKeyCol.SetFKeyColumnName("skeleton_1_col0");
+        tableFKeyCol.SetPrimaryKeyColumnName("id");
+        tableFKey.SetReferenceTable("Skeleton_0");
+        table.AddForeignKeyColumn(tableFKey);
+    }
+    // Static Columns
+    {
+        {
+            SaaSTableColumn column_table;
+            column_table.SetName("id");
+            SaaSMetadata metadata_column_table;
+            metadata_column_table.SetSqlType(SQL_VARCHAR);
+            metadata_column_table.SetSourceType(STRING);
+            metadata_column_table.SetLength(255);
+            column_table.SetMetadata(metadata_column_table);
+            column_table.SetNullable(true);
+            column_table.SetUpdatable(false);
+            column_table.SetPassdownable(false);
+            column_table.SetSvcRespAttrListResult("$.id");
+            column_table.SetSvcRespAttrItemResult("$.id");
+            table.AddColumn(column_table);
+        }
+        {
+            SaaSTableColumn column_table;
+            column_table.SetName("created_at");
+            SaaSMetadata metadata_column_table;
+            metadata_column_table.SetSqlType(SQL_WVARCHAR);
+            metadata_column_table.SetSourceType(STRING);
+            metadata_column_table.SetLength(1024);
+            column_table.SetMetadata(metadata_column_table);
+            column_table.SetNullable(true);
+            column_table.SetUpdatable(false);
+            column_table.SetPassdownable(false);
+            column_table.SetSvcRespAttrListResult("$.created_at");
+            column_table.SetSvcRespAttrItemResult("$.created_at");
+            table.AddColumn(column_table);
+        }
+        {
+            SaaSTableColumn column_table;
+            column_table.SetName("updated_at");
+            SaaSMetadata metadata_column_table;
+            metadata_column_table.SetSqlType(SQL_TYPE_TIMESTAMP);
+            metadata_column_table.SetSourceType(TIMESTAMP);
+            column_table.SetMetadata(metadata_column_table);
+            column_table.SetNullable(false);
+            column_table.SetUpdatable(false);
+            column_table.SetPassdownable(false);
+            column_table.SetSvcRespAttrListResult("$.updated_at");
+            column_table.SetSvcRespAttrItemResult("$.updated_at");
+            table.AddColumn(column_table);
+        }
+        {
+            SaaSTableColumn column_table;
+            column_table.SetName("skeleton_1_col0");
+            SaaSMetadata metadata_column_table;
+            metadata_column_table.SetSqlType(SQL_DOUBLE);
+            metadata_column_table.SetSourceType(DOUBLE);
+            metadata_column_table.SetPrecision(15);
+            column_table.SetMetadata(metadata_column_table);
+            column_table.SetNullable(false);
+            column_table.SetUpdatable(false);
+            column_table.SetPassdownable(true);
+            column_table.SetSvcRespAttrListResult("$.skeleton_1_col0");
+            column_table.SetSvcRespAttrItemResult("$.skeleton_1_col0");
+            table.AddColumn(column_table);
+        }
+        {
+            SaaSTableColumn column_table;
+            column_table.SetName("skeleton_1_col1");
+            SaaSMetadata metadata_column_table;
+            metadata_column_table.SetSqlType(SQL_BIT);
+            metadata_column_table.SetSourceType(BOOLEAN);
+            column_table.SetMetadata(metadata_column_table);
+            column_table.SetNullable(true);
+            column_table.SetUpdatable(true);
+            column_table.SetPassdownable(true);
+            column_table.SetSvcRespAttrListResult("$.skeleton_1_col1");
+            column_table.SetSvcRespAttrItemResult("$.skeleton_1_col1");
+            column_table.SetSvcReqParamQueryMapping("skeleton_1_col1");
+            table.AddColumn(column_table);
+        }
+        {
+            SaaSTableColumn column_table;
+            column_table.SetName("skeleton_1_col2");
+            SaaSMetadata metadata_column_table;
+            metadata_column_table.SetSqlType(SQL_WVARCHAR);
+            metadata_column_table.SetSourceType(STRING);
+            metadata_column_table.SetLength(1024);
+            column_table.SetMetadata(metadata_column_table);
+            column_table.SetNullable(false);
+            column_table.SetUpdatable(true);
+            column_table.SetPassdownable(false);
+            column_table.SetSvcRespAttrListResult("$.skeleton_1_col2");
+            column_table.SetSvcRespAttrItemResult("$.skeleton_1_col2");
+            table.AddColumn(column_table);
+        }
+    }
+    // Skeleton Columns
+    {
+        SaaSSkeletonColumn skeleton_columns;
+        // Skeleton Column Definition
+        {
+            {
+                SaaSTableColumn column_table;
+                column_table.SetName("skeleton_col0");
+                SaaSMetadata metadata_column_table;
+                metadata_column_table.SetSqlType(SQL_BIGINT);
+                metadata_column_table.SetSourceType(LONG);
+                column_table.SetMetadata(metadata_column_table);
+                column_table.SetNullable(true);
+                column_table.SetUpdatable(false);
+                column_table.SetPassdownable(true);
+                column_table.SetSvcRespAttrListResult("$.skeleton_col0");
+                column_table.SetSvcRespAttrItemResult("$.skeleton_col0");
+                skeleton_columns.SetSkeletonColumnDefinition(column_table);
+            }
+        }
+        // List Variable Access
+        {
+            SaaSListVariable table_listvariable;
+            table_listvariable.SetEndpoint("/v1/variables0");
+            {
+                SaaSVariable table_variable;
+                table_variable.SetVariableName("variable0");
+                table_variable.SetSvcRespAttrMapping("$.variable0");
+                table_listvariable.AddVariables(table_variable);
+            }
+            {
+                SaaSVariable table_variable;
+                table_variable.SetVariableName("variable1");
+                table_variable.SetSvcRespAttrMapping("$.variable1");
+                table_listvariable.AddVariables(table_variable);
+            }
+            table_listvariable.SetAcceptType("application/json");
+            table_listvariable.SetVariableRoot("$.variables");
+            table_listvariable.SetSvcRespAttrDefaultValue("default");
+            skeleton_columns.SetListVariableAccess(table_listvariable);
+        }
+
+        table.AddSkeletonColumn(skeleton_columns);
+        SaaSSkeletonColumn skeleton_columns;
+        // Skeleton Column Definition
+        {
+            {
+                SaaSTableColumn column_table;
+                column_table.SetName("skeleton_col1");
+                SaaSMetadata metadata_column_table;
+                metadata_column_table.SetSqlType(SQL_BIT);
+                metadata_column_table.SetSourceType(BOOLEAN);
+                column_table.SetMetadata(metadata_column_table);
+                column_table.SetNullable(false);
+                column_table.SetUpdatable(false);
+                column_table.SetPassdownable(false);
+                column_table.SetSvcRespAttrListResult("$.skeleton_col1");
+                column_table.SetSvcRespAttrItemResult("$.skeleton_col1");
+                column_table.SetColumnPushDownMapping("skeleton_col1");
+                skeleton_columns.SetSkeletonColumnDefinition(column_table);
+            }
+        }
+        // List Variable Access
+        {
+            SaaSListVariable table_listvariable;
+            table_listvariable.SetEndpoint("/v1/variables1");
+            {
+                SaaSVariable table_variable;
+                table_variable.SetVariableName("variable0");
+                table_variable.SetSvcRespAttrMapping("$.variable0");
+                table_listvariable.AddVariables(table_variable);
+            }
+            {
+                SaaSVariable table_variable;
+                table_variable.SetVariableName("variable1");
+                table_variable.SetSvcRespAttrMapping("$.variable1");
+                table_listvariable.AddVariables(table_variable);
+            }
+            table_listvariable.SetAcceptType("application/json");
+            table_listvariable.SetVariableRoot("$.variables");
+            table_listvariable.SetSvcRespAttrDefaultValue("default");
+            skeleton_columns.SetListVariableAccess(table_listvariable);
+        }
+
+        table.AddSkeletonColumn(skeleton_columns);
+    }
+    // Pagination
+    SaaSPagination::IPaginationHandler* paginationHandler =
+    SaaSPagination::SaaSPaginationFactory::CreatePaginationHandler(SaaSPagination::SAAS_PAGE_TYPE_INDEX_BASED);
+
+    // APIAccess
+    {
+        SaaSTableApiAccess table_apiAccess;
+        // ReadAPI
+        {
+            SaaSReadApi table_readApi;
+            table_readApi.SetPaginationHandler(paginationHandler);
+            // ReadAPI Endpoints
+            {
+                SaaSReadApiEndpoint table_readApiEndpoint;
+                table_readApiEndpoint.SetListEndPoint("/v1/skeleton_1");
+                table_readApiEndpoint.SetItemEndPoint("/v1/skeleton_1/{{id}}");
+                table_readApiEndpoint.SetType("LIST");
+                table_readApiEndpoint.SetPaginationData(GetPaginationDataDetails());
+                {
+                    // ReadAPI Prereqcall
+                    SaaSPreReqCall table_preReqCall1;
+                    table_preReqCall1.SetEndPoint("/v1/prereq1/level2");
+                    // ServiceReq param key read details
+                    {
+                        SaaSSvcReqParamKey table_svcReqParamKey;
+                        table_svcReqParamKey.SetKeyName("key0");
+                        table_svcReqParamKey.SetSvcRespAttrField("field0");
+                        table_preReqCall1.SetParameterType();
+                        table_preReqCall1.AddSvcReqParamKey(table_svcReqParamKey);
+                    }
+                    {
+                        SaaSSvcReqParamKey table_svcReqParamKey;
+                        table_svcReqParamKey.SetKeyName("key1");
+                        table_svcReqParamKey.SetSvcRespAttrField("field1");
+                        table_preReqCall1.SetReferencedType();
+                        table_preReqCall1.AddSvcReqParamKey(table_svcReqParamKey);
+                    }
+                    {
+                        SaaSSvcReqParamKey table_svcReqParamKey;
+                        table_svcReqParamKey.SetKeyName("key2");
+                        table_svcReqParamKey.SetSvcRespAttrField("field2");
+                        table_preReqCall1.SetMaxValuesPerCall(50);
+                        table_preReqCall1.AddSvcReqParamKey(table_svcReqParamKey);
+                    }
+                    table_preReqCall1.SetListRoot("$.data");
+                    {
+                        // ReadAPI Nested Prereqcall
+                        SaaSPreReqCall table_preReqCall2;
+                        table_preReqCall2.SetEndPoint("/v1/prereq1/level1");
+                        // ServiceReq param key read details
+                        {
+                            SaaSSvcReqParamKey table_svcReqParamKey;
+                            table_svcReqParamKey.SetKeyName("key0");
+                            table_svcReqParamKey.SetSvcRespAttrField("field0");
+                            table_preReqCall2.SetParameterType();
+                            table_preReqCall2.AddSvcReqParamKey(table_svcReqParamKey);
+                        }
+                        {
+                            SaaSSvcReqParamKey table_svcReqParamKey;
+                            table_svcReqParamKey.SetKeyName("key1");
+                            table_svcReqParamKey.SetSvcRespAttrField("field1");
+                            table_preReqCall2.SetReferencedType();
+                            table_preReqCall2.AddSvcReqParamKey(table_svcReqParamKey);
+                        }
+                        {
+                            SaaSSvcReqParamKey table_svcReqParamKey;
+                            table_svcReqParamKey.SetKeyName("key2");
+                            table_svcReqParamKey.SetSvcRespAttrField("field2");
+                            table_preReqCall2.SetMaxValuesPerCall(50);
+                            table_preReqCall2.AddSvcReqParamKey(table_svcReqParamKey);
+                        }
+                        table_preReqCall2.SetListRoot("$.data");
+                        table_preReqCall1.SetPreReqCall(table_preReqCall2);
+                    }
+                    table_readApiEndpoint.SetPreReqCall(table_preReqCall1);
+                }
+                table_readApi.SetEndPoint(table_readApiEndpoint);
+            }
+            table_readApi.SetMethod("GET");
+            table_readApi.SetAccept("application/json");
+            table_readApi.SetParameterFormat(PARAM_FORMAT_QUERY);
+            table_readApi.SetListRoot("$.items");
+            table_readApi.SetItemRoot("$");
+            table_apiAccess.SetReadApi(table_readApi);
+        }
+        table.SetAPIAccess(table_apiAccess);
+    }
+
+    // Skeleton Table information
+    SaaSSkeletonTable skeleton_table;
+    skeleton_table.SetTableDefinition(table);
+
+    // List Variable PreCalls
+    {
+        SaaSListVariable table_listvariable;
+        table_listvariable.SetEndpoint("/v1/variables0");
+        {
+            SaaSVariable table_variable;
+            table_variable.SetVariableName("variable0");
+            table_variable.SetSvcRespAttrMapping("$.variable0");
+            table_listvariable.AddVariables(table_variable);
+        }
+        {
+            SaaSVariable table_variable;
+            table_variable.SetVariableName("variable1");
+            table_variable.SetSvcRespAttrMapping("$.variable1");
+            table_listvariable.AddVariables(table_variable);
+        }
+        table_listvariable.SetAcceptType("application/json");
+        table_listvariable.SetVariableRoot("$.variables");
+        table_listvariable.SetSvcRespAttrDefaultValue("default");
+        skeleton_table.AddListVariablesPrecalls(table_listvariable);
+    }
+    {
+        SaaSListVariable table_listvariable;
+        table_listvariable.SetEndpoint("/v1/variables1");
+        {
+            SaaSVariable table_variable;
+            table_variable.SetVariableName("variable0");
+            table_variable.SetSvcRespAttrMapping("$.variable0");
+            table_listvariable.AddVariables(table_variable);
+        }
+        {
+            SaaSVariable table_variable;
+            table_variable.SetVariableName("variable1");
+            table_variable.SetSvcRespAttrMapping("$.variable1");
+            table_listvariable.AddVariables(table_variable);
+        }
+        table_listvariable.SetAcceptType("application/json");
+        table_listvariable.SetVariableRoot("$.variables");
+        table_listvariable.SetSvcRespAttrDefaultValue("default");
+        skeleton_table.AddListVariablesPrecalls(table_listvariable);
+    }
+
+    io_configs.SetSkeletonTableInitialized(false);
+    io_configs.AddSkeletonTable(skeleton_table);
+}
\ No newline at end of file
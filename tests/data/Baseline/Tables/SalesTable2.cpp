@@ -0,0 +1,230 @@
+// =============================================================================================================================
+/// @file SalesTable2.cpp
+///
+/// Synthetic SalesTable2 configurations
+///
+/// Copyright (C) 2026 Simba Technologies Incorporated.
+// =============================================================================================================================
+
+#include "Authentication/SaaSAuthenticationFactory.h"
+#include "ConfigurationHelpers.h"
+#include "Configuration/SaaSConfiguration.h"
+#include "Pagination/SaaSPaginationFactory.h"
+
+using namespace Simba::SaaSSDK;
+
+void SalesTable2(SaaSConfiguration& io_configs)
+{
+    SaaSTable table;
+    table.SetTableCatalogName(L"Synthetic");
+    table.SetTableName(L"Table_2");
+    table.SetTableSchemaName(L"Sales");
+    table.SetSortable();
+    table.SetPageable();
+    table.AddItemEndpointColumnNames("id");
+    // Primary Key
+    {
+        SaaSTablePKeyColumn tablePKey;
+        tablePKey.SetPKeyName("pk_Table_2");
+        {
+            SaaSPK pKeyTable_2;
+            pKeyTable_2.SetPkColumn(0);
+            tablePKey.AddPK(pKeyTable_2);
+        }
+        table.SetPkeyColumns(tablePKey);
+    }
+    // Foreign Keys
+    {
+        SaaSFKeyColumn tableFKey;
+        SaaSForeignKeyColumns tableFKeyCol;
+        tableFKeyCol.SetFKeyColumnName("table_2_col0");
+        tableFKeyCol.SetPrimaryKeyColumnName("id");
+        tableFKey.SetReferenceTable("Table_1");
+        table.AddForeignKeyColumn(tableFKey);
+    }
+    // Static Columns
+    {
+        {
+            SaaSTableColumn column_table;
+            column_table.SetName("id");
+            SaaSMetadata metadata_column_table;
+            metadata_column_table.SetSqlType(SQL_DOUBLE);
+            metadata_column_table.SetSourceType(DOUBLE);
+            metadata_column_table.SetPrecision(15);
+            column_table.SetMetadata(metadata_column_table);
+            column_table.SetNullable(true);
+            column_table.SetUpdatable(false);
+            column_table.SetPassdownable(false);
+            column_table.SetSvcRespAttrListResult("$.id");
+            column_table.SetSvcRespAttrItemResult("$.id");
+            column_table.SetColumnPushDownMapping("id");
+            table.AddColumn(column_table);
+        }
+        {
+            SaaSTableColumn column_table;
+            column_table.SetName("created_at");
+            SaaSMetadata metadata_column_table;
+            metadata_column_table.SetSqlType(SQL_TYPE_TIMESTAMP);
+            metadata_column_table.SetSourceType(TIMESTAMP);
+            column_table.SetMetadata(metadata_column_table);
+            column_table.SetNullable(true);
+            column_table.SetUpdatable(false);
+            column_table.SetPassdownable(true);
+            column_table.SetSvcRespAttrListResult("$.created_at");
+            column_table.SetSvcRespAttrItemResult("$.created_at");
+            table.AddColumn(column_table);
+        }
+        {
+            SaaSTableColumn column_table;
+            column_table.SetName("updated_at");
+            SaaSMetadata metadata_column_table;
+            metadata_column_table.SetSqlType(SQL_BIT);
+            metadata_column_table.SetSourceType(BOOLEAN);
+            column_table.SetMetadata(metadata_column_table);
+            column_table.SetNullable(false);
+            column_table.SetUpdatable(false);
+            column_table.SetPassdownable(false);
+            column_table.SetSvcRespAttrListResult("$.updated_at");
+            column_table.SetSvcRespAttrItemResult("$.updated_at");
+            column_table.SetColumnPushDownMapping("updated_at");
+            table.AddColumn(column_table);
+        }
+        {
+            SaaSTableColumn column_table;
+            column_table.SetName("table_2_col0");
+            SaaSMetadata metadata_column_table;
+            metadata_column_table.SetSqlType(SQL_INTEGER);
+            metadata_column_table.SetSourceType(INTEGER);
+            column_table.SetMetadata(metadata_column_table);
+            column_table.SetNullable(true);
+            column_table.SetUpdatable(false);
+            column_table.SetPassdownable(false);
+            column_table.SetSvcRespAttrListResult("$.table_2_col0");
+            column_table.SetSvcRespAttrItemResult("$.table_2_col0");
+            column_table.SetColumnPushDownMapping("table_2_col0");
+            table.AddColumn(column_table);
+        }
+        {
+            SaaSTableColumn column_table;
+            column_table.SetName("table_2_col1");
+            SaaSMetadata metadata_column_table;
+            metadata_column_table.SetSqlType(SQL_BIT);
+            metadata_column_table.SetSourceType(BOOLEAN);
+            column_table.SetMetadata(metadata_column_table);
+            column_table.SetNullable(false);
+            column_table.SetUpdatable(false);
+            column_table.SetPassdownable(false);
+            column_table.SetSvcRespAttrListResult("$.table_2_col1");
+            column_table.SetSvcRespAttrItemResult("$.table_2_col1");
+            column_table.SetSvcReqParamQueryMapping("table_2_col1");
+            table.AddColumn(column_table);
+        }
+        {
+            SaaSTableColumn column_table;
+            column_table.SetName("table_2_col2");
+            SaaSMetadata metadata_column_table;
+            metadata_column_table.SetSqlType(SQL_VARCHAR);
+            metadata_column_table.SetSourceType(STRING);
+            metadata_column_table.SetLength(255);
+            column_table.SetMetadata(metadata_column_table);
+            column_table.SetNullable(true);
+            column_table.SetUpdatable(false);
+            column_table.SetPassdownable(false);
+            column_table.SetSvcRespAttrListResult("$.table_2_col2");
+            column_table.SetSvcRespAttrItemResult("$.table_2_col2");
+            table.AddColumn(column_table);
+        }
+    }
+    // Skeleton Columns
+    {
+    }
+    // Pagination
+    SaaSPagination::IPaginationHandler* paginationHandler =
+    SaaSPagination::SaaSPaginationFactory::CreatePaginationHandler(SaaSPagination::SAAS_PAGE_TYPE_TOKEN_BASED);
+
+    // APIAccess
+    {
+        SaaSTableApiAccess table_apiAccess;
+        // ReadAPI
+        {
+            SaaSReadApi table_readApi;
+            table_readApi.SetPaginationHandler(paginationHandler);
+            // ReadAPI Endpoints
+            {
+                SaaSReadApiEndpoint table_readApiEndpoint;
+                table_readApiEndpoint.SetListEndPoint("/v1/table_2");
+                table_readApiEndpoint.SetItemEndPoint("/v1/table_2/{{id}}");
+                table_readApiEndpoint.SetType("LIST");
+                table_readApiEndpoint.SetPaginationData(GetPaginationDataDetails());
+                {
+                    // ReadAPI Prereqcall
+                    SaaSPreReqCall table_preReqCall1;
+                    table_preReqCall1.SetEndPoint("/v1/prereq2/level2");
+                    // ServiceReq param key read details
+                    {
+                        SaaSSvcReqParamKey table_svcReqParamKey;
+                        table_svcReqParamKey.SetKeyName("key0");
+                        table_svcReqParamKey.SetSvcRespAttrField("field0");
+                        table_preReqCall1.SetParameterType();
+                        table_preReqCall1.AddSvcReqParamKey(table_svcReqParamKey);
+                    }
+                    {
+                        SaaSSvcReqParamKey table_svcReqParamKey;
+                        table_svcReqParamKey.SetKeyName("key1");
+                        table_svcReqParamKey.SetSvcRespAttrField("field1");
+                        table_preReqCall1.SetReferencedType();
+                        table_preReqCall1.AddSvcReqParamKey(table_svcReqParamKey);
+                    }
+                    {
+                        SaaSSvcReqParamKey table_svcReqParamKey;
+                        table_svcReqParamKey.SetKeyName("key2");
+                        table_svcReqParamKey.SetSvcRespAttrField("field2");
+                        table_preReqCall1.SetMaxValuesPerCall(50);
+                        table_preReqCall1.AddSvcReqParamKey(table_svcReqParamKey);
+                    }
+                    table_preReqCall1.SetListRoot("$.data");
+                    {
+                        // ReadAPI Nested Prereqcall
+                        SaaSPreReqCall table_preReqCall2;
+                        table_preReqCall2.SetEndPoint("/v1/prereq2/level1");
+                        // ServiceReq param key read details
+                        {
+                            SaaSSvcReqParamKey table_svcReqParamKey;
+                            table_svcReqParamKey.SetKeyName("key0");
+                            table_svcReqParamKey.SetSvcRespAttrField("field0");
+                            table_preReqCall2.SetParameterType();
+                            table_preReqCall2.AddSvcReqParamKey(table_svcReqParamKey);
+                        }
+                        {
+                            SaaSSvcReqParamKey table_svcReqParamKey;
+                            table_svcReqParamKey.SetKeyName("key1");
+                            table_svcReqParamKey.SetSvcRespAttrField("field1");
+                            table_preReqCall2.SetReferencedType();
+                            table_preReqCall2.AddSvcReqParamKey(table_svcReqParamKey);
+                        }
+                        {
+                            SaaSSvcReqParamKey table_svcReqParamKey;
+                            table_svcReqParamKey.SetKeyName("key2");
+                            table_svcReqParamKey.SetSvcRespAttrField("field2");
+                            table_preReqCall2.SetMaxValuesPerCall(50);
+                            table_preReqCall2.AddSvcReqParamKey(table_svcReqParamKey);
+                        }
+                        table_preReqCall2.SetListRoot("$.data");
+                        table_preReqCall1.SetPreReqCall(table_preReqCall2);
+                    }
+                    table_readApiEndpoint.SetPreReqCall(table_preReqCall1);
+                }
+                table_readApi.SetEndPoint(table_readApiEndpoint);
+            }
+            table_readApi.SetMethod("GET");
+            table_readApi.SetAccept("application/json");
+            table_readApi.SetParameterFormat(PARAM_FORMAT_QUERY);
+            table_readApi.SetListRoot("$.items");
+            table_readApi.SetItemRoot("$");
+            table_apiAccess.SetReadApi(table_readApi);
+        }
+        table.SetAPIAccess(table_apiAccess);
+    }
+
+    io_configs.AddTable(table);
+}
\ No newline at end of file
@@ -0,0 +1,52 @@
+"""
+Tests of the Batch class
+"""
+import os
+import sys
+import json
+import tempfile
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from Batch import Batch
+from SyntheticMDEF import SyntheticMDEF
+
+
+class TestBatch(unittest.TestCase):
+    """Runs a manifest holding a broken driver next to a valid one"""
+
+    def setUp(self):
+        self.mWorkDir = tempfile.TemporaryDirectory()
+        workDir = self.mWorkDir.name
+        SyntheticMDEF(5, 4, inSkeletonTables=1).save(os.path.join(workDir, 'Valid.json'))
+        with open(os.path.join(workDir, 'Valid.json'), 'r') as file:
+            content = json.load(file)
+        del content['AuthProfiles']
+        with open(os.path.join(workDir, 'Broken.json'), 'w') as file:
+            json.dump(content, file)
+        self.mManifestPath = os.path.join(workDir, 'Manifest.json')
+        with open(self.mManifestPath, 'w') as file:
+            json.dump([{'MDEFPath': 'Broken.json', 'OutputDir': 'Broken'},
+                       {'MDEFPath': 'Valid.json', 'OutputDir': 'Valid'}], file)
+
+    def tearDown(self):
+        self.mWorkDir.cleanup()
+
+    def checkReports(self, inReports: list[dict]):
+        self.assertEqual(len(inReports), 2)
+        self.assertIn('AuthProfiles', inReports[0]['Error'])
+        self.assertNotIn('Error', inReports[1])
+        self.assertIn('Total', inReports[1]['Timings'])
+        self.assertTrue(os.path.isfile(os.path.join(self.mWorkDir.name, 'Valid', 'Configs', 'Configuration.cpp')))
+        self.assertIn('Failed', Batch.summary(inReports))
+
+    def test_brokenDriverInline(self):
+        self.checkReports(Batch(self.mManifestPath).run(1))
+
+    def test_brokenDriverWorkers(self):
+        self.checkReports(Batch(self.mManifestPath).run(2))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,114 @@
+"""
+Tests of the Fluffy generation
+"""
+import os
+import sys
+import json
+import tempfile
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from Fluffy import main
+from MDEF import Constants
+
+DATA_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'data')
+# Synthetic MDEF, generated through SyntheticMDEF.py --tables 5 --columns 6 --prereq-depth 2 --skeleton-tables 2
+# --auth-profiles 4 --seed 7
+MDEF_PATH = os.path.join(DATA_DIR, 'MDEF.json')
+# Outputs of the MDEF rendered by the scripts before any optimization
+BASELINE_DIR = os.path.join(DATA_DIR, 'Baseline')
+
+
+def outputs(inOutputDir: str) -> dict:
+    """Maps the relative path of every generated output to its content, the Fluffy state files aside"""
+    contents = dict()
+    for dirPath, _, fileNames in os.walk(inOutputDir):
+        for fileName in fileNames:
+            if not fileName.startswith('.fluffy'):
+                filePath = os.path.join(dirPath, fileName)
+                with open(filePath, 'rb') as file:
+                    contents[os.path.relpath(filePath, inOutputDir).replace(os.sep, '/')] = file.read()
+    return contents
+
+
+class TestBaseline(unittest.TestCase):
+    """Renders the MDEF through every mode promising the baseline output, byte for byte"""
+
+    def setUp(self):
+        self.mWorkDir = tempfile.TemporaryDirectory()
+
+    def tearDown(self):
+        self.mWorkDir.cleanup()
+
+    def test_modes(self):
+        baseline = outputs(BASELINE_DIR)
+        modes = {
+            'default': dict(),
+            'incremental': dict(inIncremental=True),
+            'jobs': dict(inJobs=2),
+            'stream': dict(inStreaming=True),
+            'cache-dir': dict(inCacheDir=os.path.join(self.mWorkDir.name, 'Cache')),
+            'stream-writes': dict(inStreamWrites=True),
+            'write-threads': dict(inWriteThreads=2)
+        }
+        for mode, options in modes.items():
+            with self.subTest(mode=mode):
+                outputDir = os.path.join(self.mWorkDir.name, mode)
+                main(MDEF_PATH, outputDir, **options)
+                self.assertEqual(outputs(outputDir), baseline)
+
+    def test_cachedModel(self):
+        outputDir = os.path.join(self.mWorkDir.name, 'Output')
+        cacheDir = os.path.join(self.mWorkDir.name, 'Cache')
+        for _ in range(2):
+            main(MDEF_PATH, outputDir, inCacheDir=cacheDir)
+            self.assertEqual(outputs(outputDir), outputs(BASELINE_DIR))
+
+
+class TestIncremental(unittest.TestCase):
+    """Regenerates the MDEF with --incremental after edits of its content"""
+
+    # Modification time the outputs are reset to between the runs
+    MTIME = 1000000000
+
+    def setUp(self):
+        self.mWorkDir = tempfile.TemporaryDirectory()
+        self.mMDEFPath = os.path.join(self.mWorkDir.name, 'MDEF.json')
+        self.mOutputDir = os.path.join(self.mWorkDir.name, 'Output')
+        with open(MDEF_PATH, 'r') as file:
+            self.mContent = json.load(file)
+
+    def tearDown(self):
+        self.mWorkDir.cleanup()
+
+    def generate(self) -> dict:
+        """Runs the generation, returns the modification time of every output"""
+        with open(self.mMDEFPath, 'w') as file:
+            json.dump(self.mContent, file)
+        main(self.mMDEFPath, self.mOutputDir, inIncremental=True)
+        mtimes = dict()
+        for key in outputs(self.mOutputDir):
+            filePath = os.path.join(self.mOutputDir, key)
+            mtimes[key] = os.stat(filePath).st_mtime
+            os.utime(filePath, (TestIncremental.MTIME, TestIncremental.MTIME))
+        return mtimes
+
+    def test_rewritesChangedOnly(self):
+        self.generate()
+        self.assertTrue(all(mtime == TestIncremental.MTIME for mtime in self.generate().values()))
+        table = self.mContent[Constants.TABLES.value][1]
+        table[Constants.SORTABLE.value] = not table[Constants.SORTABLE.value]
+        changed = [filePath for filePath, mtime in self.generate().items() if mtime != TestIncremental.MTIME]
+        self.assertEqual(changed, [f'Tables/{table[Constants.TABLESCHEMANAME.value]}Table1.cpp'])
+
+    def test_prunesRemovedTables(self):
+        before = self.generate()
+        table = self.mContent[Constants.TABLES.value].pop(3)
+        after = self.generate()
+        self.assertEqual(set(before) - set(after), {f'Tables/{table[Constants.TABLESCHEMANAME.value]}Table3.cpp'})
+        self.assertEqual(set(after) - set(before), set())
+
+
+if __name__ == '__main__':
+    unittest.main()
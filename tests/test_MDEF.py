@@ -0,0 +1,48 @@
+"""
+Tests of the MDEF model
+"""
+import os
+import sys
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from MDEF import MDEF, Constants, Table
+from Util import JSONStream
+from Validator import Validator
+
+MDEF_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'data', 'MDEF.json')
+
+
+class TestStreamedTables(unittest.TestCase):
+    """Loads the tables of the MDEF from disk, as --stream does"""
+
+    def setUp(self):
+        self.mParses = list()
+        parse = Table.parse
+
+        def countedParse(inTable, inData):
+            self.mParses.append(inTable)
+            return parse(inTable, inData)
+        Table.parse = countedParse
+        self.addCleanup(setattr, Table, 'parse', parse)
+        self.mMDEF = MDEF(JSONStream(MDEF_PATH).load([Constants.TABLES.value, Constants.SKELETONTABLE.value]), True)
+
+    def test_proxyReadsParseOnce(self):
+        for lazyTable in self.mMDEF.Tables:
+            lazyTable.Columns, lazyTable.PrimaryKeys, lazyTable.ForeignKeys, lazyTable.ReadAPI
+        self.assertEqual(len(self.mParses), len(self.mMDEF.Tables))
+
+    def test_streamedTablesAreNotKept(self):
+        tables = [lazyTable.load() for lazyTable in self.mMDEF.Tables]
+        self.assertFalse(any(lazyTable.IsLoaded for lazyTable in self.mMDEF.Tables))
+        self.assertIs(self.mMDEF.Tables[-1].load(), tables[-1])
+        self.assertIsNot(self.mMDEF.Tables[0].load(), tables[0])
+
+    def test_validatorParsesOnce(self):
+        self.assertEqual(Validator(self.mMDEF).validate(), list())
+        self.assertEqual(len(self.mParses), len(self.mMDEF.Tables) + len(self.mMDEF.SkeletonTables))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,71 @@
+"""
+Tests of the Validator class
+"""
+import os
+import sys
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from MDEF import MDEF, Constants
+from Validator import Validator
+from SyntheticMDEF import SyntheticMDEF
+
+
+class TestValidator(unittest.TestCase):
+    """Validates synthetic MDEFs, consistent unless a test breaks them"""
+
+    def setUp(self):
+        self.mContent = SyntheticMDEF(5, 4, inSkeletonTables=1).generate()
+
+    def validate(self) -> list[str]:
+        return Validator(MDEF(self.mContent)).validate()
+
+    def test_consistent(self):
+        self.assertEqual(self.validate(), list())
+
+    def test_emptySchemaIsNoSchema(self):
+        tables = self.mContent[Constants.TABLES.value]
+        del tables[0][Constants.TABLESCHEMANAME.value]
+        tables[1][Constants.FKEYCOLUMN.value][0][Constants.REFERENCETABLESCHEMA.value] = ''
+        tables[2][Constants.TABLESCHEMANAME.value] = ''
+        tables[3][Constants.FKEYCOLUMN.value][0][Constants.REFERENCETABLESCHEMA.value] = ''
+        self.assertEqual(self.validate(), list())
+
+    def test_unknownKeys(self):
+        self.mContent['Unknown'] = 0
+        self.mContent[Constants.AUTHBROWSECONNECTMAP.value][0]['Unknown'] = 0
+        authFlow = self.mContent[Constants.AUTHPROFILES.value]['OAuth 2.0'][0]
+        authFlow['Unknown'] = 0
+        authFlow[Constants.SEQUENCE.value][0]['Unknown'] = 0
+        self.mContent[Constants.TABLES.value][0][Constants.COLUMNPUSHDOWN.value]['Unknown'] = 0
+        self.mContent[Constants.SKELETONTABLE.value][0]['Unknown'] = 0
+        errors = self.validate()
+        for className in ['MDEF', 'AuthBrowseConnectMap', 'AuthFlow', 'AuthSequence', 'ColumnPushdown',
+                          'SkeletonTable']:
+            self.assertEqual(len([error for error in errors if f'unknown {className} key "Unknown"' in error]), 1)
+        self.assertEqual(len(errors), 6)
+
+    def test_collidingAuthFlowVariables(self):
+        authFlows = self.mContent[Constants.AUTHPROFILES.value]['OAuth 2.0']
+        sequence = authFlows[0][Constants.SEQUENCE.value][0]
+        sequence[Constants.REQUIREDPARAMS.value].append({Constants.KEY.value: 'clientid'})
+        sequence[Constants.EXPECTEDPARAMS.value].append({Constants.KEY.value: 'access_token', Constants.PATH.value: '$'})
+        authFlows.append(dict(authFlows[0], **{Constants.NAME.value: 'OAuth20'}))
+        errors = self.validate()
+        self.assertIn('Colliding identifiers, AuthProfile OAuth 2.0 AuthFlow FlowOAuth20 sequence 1 RequiredParam '
+                      'reqParamclientid: client_id, clientid', errors)
+        self.assertIn('Colliding identifiers, AuthProfile OAuth 2.0 AuthFlow FlowOAuth20 sequence 1 ExpectedParam '
+                      'expParamaccesstoken: access_token, access_token', errors)
+        self.assertIn('Colliding identifiers, AuthProfile OAuth 2.0 AuthFlow authSeqOAuth20: OAuth 2.0, OAuth20',
+                      errors)
+
+    def test_missingReferenceTable(self):
+        tables = self.mContent[Constants.TABLES.value]
+        tables[1][Constants.FKEYCOLUMN.value][0][Constants.REFERENCETABLE.value] = 'Missing'
+        schema = tables[1][Constants.TABLESCHEMANAME.value]
+        self.assertEqual(self.validate(), [f'Table {schema}.Table_1: foreign key reference table "Missing" not found'])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,73 @@
+"""
+Tests of the Watcher class
+"""
+import os
+import sys
+import json
+import tempfile
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from Fluffy import main
+from MDEF import Constants, MDEFError
+from Util import BuildFragment
+from Watch import Watcher
+from SyntheticMDEF import SyntheticMDEF
+
+
+class TestWatcher(unittest.TestCase):
+    """Regenerates the outputs of a synthetic MDEF after edits of its content"""
+
+    def setUp(self):
+        self.mWorkDir = tempfile.TemporaryDirectory()
+        self.mMDEFPath = os.path.join(self.mWorkDir.name, 'MDEF.json')
+        self.mOutputDir = os.path.join(self.mWorkDir.name, 'Output')
+        SyntheticMDEF(4, 4, inSkeletonTables=1).save(self.mMDEFPath)
+        with open(self.mMDEFPath, 'r') as file:
+            self.mContent = json.load(file)
+
+    def tearDown(self):
+        self.mWorkDir.cleanup()
+
+    def watcher(self, inValidate: bool = False) -> Watcher:
+        watcher = Watcher(self.mMDEFPath, self.mOutputDir, True, inValidate)
+        main(self.mMDEFPath, self.mOutputDir, inIncremental=True, inBuildFragment=True, inValidate=inValidate)
+        return watcher
+
+    def fragment(self) -> str:
+        with open(os.path.join(self.mOutputDir, BuildFragment.FILENAME), 'r') as file:
+            return file.read()
+
+    def test_buildFragment(self):
+        watcher = self.watcher()
+        tables = self.mContent[Constants.TABLES.value]
+        removedName = watcher.mMDEF.Tables[3].FullName
+        editedName = watcher.mMDEF.Tables[1].FullName
+        del tables[3]
+        tables[1][Constants.SORTABLE.value] = not tables[1][Constants.SORTABLE.value]
+        watcher.regenerate(self.mContent)
+        fragment = self.fragment()
+        self.assertNotIn(removedName, fragment)
+        changed = fragment[fragment.index('set(FLUFFY_CHANGED_SOURCES'):]
+        changed = changed[:changed.index(')')]
+        self.assertIn(f'Tables/{editedName}.cpp', changed)
+        self.assertNotIn(f'Tables/{watcher.mMDEF.Tables[0].FullName}.cpp', changed)
+        # The files carried over from the first run keep their owner table
+        self.assertIn(f'FLUFFY_TABLES "{watcher.mMDEF.Tables[0].FullName}"', fragment)
+
+    def test_collidingEdit(self):
+        for validate in [False, True]:
+            with self.subTest(validate=validate):
+                watcher = self.watcher(validate)
+                tables = self.mContent[Constants.TABLES.value]
+                tables.append(dict(tables[1], **{Constants.TABLENAME.value: 'Table1'}))
+                with self.assertRaises(MDEFError):
+                    watcher.regenerate(self.mContent)
+                # The previous model is kept
+                self.assertEqual(len(watcher.mMDEF.Tables), 4)
+                del tables[-1]
+
+
+if __name__ == '__main__':
+    unittest.main()